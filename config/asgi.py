@@ -11,6 +11,8 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "interview.settings")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.local")
+# Persistent connections are not reused across requests under ASGI, so pool them.
+os.environ.setdefault("DATABASE_POOL", "1")
 
 application = get_asgi_application()
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 
@@ -17,6 +18,10 @@ from pathlib import Path
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 
+def env_bool(name: str, default: bool = False) -> bool:
+    return os.environ.get(name, str(default)).lower() in ("1", "true", "yes")
+
+
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/4.1/howto/deployment/checklist/
 
@@ -38,14 +43,19 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "interview.core",
     "interview.inventory",
     "interview.order",
+    "interview.analytics",
 ]
 
 MIDDLEWARE = [
+    "interview.core.middleware.MetricsMiddleware",
+    "interview.core.middleware.InstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "interview.core.middleware.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -78,17 +88,74 @@ WSGI_APPLICATION = "config.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/4.1/ref/settings/#databases
 
+# DATABASE_POOL=1 switches to the in-process connection pool, which is meant for
+# ASGI deployments. Otherwise connections persist for DATABASE_CONN_MAX_AGE
+# seconds and are health checked before being reused.
+
+DATABASE_POOL = env_bool("DATABASE_POOL")
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
-        "NAME": "tmt_interview",
-        "USER": "docker",
-        "PASSWORD": "docker",
-        "HOST": "127.0.0.1",
-        "PORT": "5444",
+        "ENGINE": (
+            "interview.core.db.backends.postgresql_pool"
+            if DATABASE_POOL
+            else "django.db.backends.postgresql"
+        ),
+        "NAME": os.environ.get("DATABASE_NAME", "tmt_interview"),
+        "USER": os.environ.get("DATABASE_USER", "docker"),
+        "PASSWORD": os.environ.get("DATABASE_PASSWORD", "docker"),
+        "HOST": os.environ.get("DATABASE_HOST", "127.0.0.1"),
+        "PORT": os.environ.get("DATABASE_PORT", "5444"),
+        "CONN_MAX_AGE": int(
+            os.environ.get("DATABASE_CONN_MAX_AGE", 0 if DATABASE_POOL else 60)
+        ),
+        "CONN_HEALTH_CHECKS": env_bool("DATABASE_CONN_HEALTH_CHECKS", True),
+        "POOL": {
+            "MAX_SIZE": int(os.environ.get("DATABASE_POOL_MAX_SIZE", 10)),
+            "TIMEOUT": float(os.environ.get("DATABASE_POOL_TIMEOUT", 10)),
+        },
     }
 }
 
+# Read replicas, as DATABASE_REPLICA_HOSTS="host[:port],...". Each replica shares
+# the default database's name and credentials. Reads are routed to them except
+# for writing requests and for REPLICA_PIN_SECONDS after a client's last write.
+
+DATABASE_REPLICA_HOSTS = [
+    host.strip()
+    for host in os.environ.get("DATABASE_REPLICA_HOSTS", "").split(",")
+    if host.strip()
+]
+DATABASE_REPLICAS = [f"replica_{i}" for i in range(len(DATABASE_REPLICA_HOSTS))]
+DATABASES.update(
+    {
+        alias: {
+            **DATABASES["default"],
+            "HOST": host.partition(":")[0],
+            "PORT": host.partition(":")[2] or DATABASES["default"]["PORT"],
+            "TEST": {"MIRROR": "default"},
+        }
+        for alias, host in zip(DATABASE_REPLICAS, DATABASE_REPLICA_HOSTS)
+    }
+)
+DATABASE_ROUTERS = ["interview.core.routers.ReplicaRouter"]
+REPLICA_PIN_SECONDS = int(os.environ.get("REPLICA_PIN_SECONDS", 5))
+
+# Change feeds return an "until" watermark this many seconds behind their read,
+# so that the next poll also covers transactions that were still committing.
+
+CHANGE_FEED_OVERLAP_SECONDS = int(os.environ.get("CHANGE_FEED_OVERLAP_SECONDS", 30))
+
+# Change feeds return at most this many changed rows, and as many deleted ids, per
+# response, with a "next" link to the rest.
+
+CHANGE_FEED_PAGE_SIZE = 1000
+
+# Tombstones of deleted rows are kept this many days, after which purge_tombstones
+# removes them; change feeds answer older watermarks with a 410.
+
+CHANGE_FEED_RETENTION_DAYS = int(os.environ.get("CHANGE_FEED_RETENTION_DAYS", 30))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
@@ -127,6 +194,76 @@ USE_TZ = True
 STATIC_URL = "static/"
 STATIC_ROOT = "interview/static"
 
+# Django REST framework
+# FastJSONRenderer and FastJSONParser use orjson when it is installed.
+
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": [
+        "interview.core.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "interview.core.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+}
+
+# Lookup table cache (types, languages and tags)
+# Set LOOKUP_CACHE_ALIAS to one of CACHES to share loaded tables between processes;
+# without it, other processes only see a change once their copy expires after
+# LOOKUP_CACHE_TIMEOUT seconds. Lookups missing from a table reload it at most once
+# per LOOKUP_CACHE_MISS_INTERVAL seconds.
+
+LOOKUP_CACHE_ALIAS = os.environ.get("LOOKUP_CACHE_ALIAS") or None
+LOOKUP_CACHE_TIMEOUT = 300
+LOOKUP_CACHE_MISS_INTERVAL = 10
+
+# Rendered inventory responses, invalidated through model signals. Off unless
+# RESPONSE_CACHE_ALIAS names one of CACHES that every process shares (e.g. Redis or
+# Memcached): a per-process cache would only see the writing process's invalidations.
+
+RESPONSE_CACHE_ALIAS = os.environ.get("RESPONSE_CACHE_ALIAS") or None
+# Cached responses embed lookup rows, so every process must see lookup changes
+# before it fills the response cache.
+LOOKUP_CACHE_ALIAS = LOOKUP_CACHE_ALIAS or RESPONSE_CACHE_ALIAS
+RESPONSE_CACHE_TIMEOUT = 300
+
+# Prometheus metrics at /metrics. With several worker processes, point METRICS_DIR
+# at a directory shared by them (and emptied on deploy) so every scrape sees all workers.
+# Exited workers are detected by pid, so the directory must not be shared across
+# containers.
+
+METRICS = env_bool("METRICS", True)
+METRICS_DIR = os.environ.get("METRICS_DIR")
+METRICS_FLUSH_INTERVAL = 5
+
+# Request instrumentation: Server-Timing headers, /stats/requests/ and N+1 detection.
+
+INSTRUMENTATION = env_bool("INSTRUMENTATION")
+INSTRUMENTATION_N_PLUS_ONE_THRESHOLD = 10
+INSTRUMENTATION_N_PLUS_ONE_RAISE = False
+
+# Serve list endpoints through the values()-based fast serializers.
+FAST_SERIALIZERS = False
+
+# Serve the order list from the denormalized OrderReadModel table. The table is
+# maintained either way, so this can be switched without a rebuild; it is filled
+# by "manage.py order_read_model" after migrating.
+ORDER_READ_MODEL = True
+
+# Changes that touch any number of orders (lookup renames, set_active(), tag
+# deletes) only flag their read model rows as stale. They are rendered again in a
+# background thread after commit, or, with this off, by "order_read_model --stale",
+# which should then run periodically.
+ORDER_READ_MODEL_BACKGROUND_REFRESH = env_bool(
+    "ORDER_READ_MODEL_BACKGROUND_REFRESH", True
+)
+
+# Serve /analytics/ reports from the snapshots written by refresh_analytics,
+# which should then run periodically. Reports are computed per request otherwise.
+ANALYTICS_SNAPSHOTS = False
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.1/ref/settings/#default-auto-field
 
@@ -0,0 +1,90 @@
+from datetime import date, timedelta
+
+import pytest
+from django.core.cache import caches
+
+from interview.core.cache import lookup_cache
+from interview.inventory.models import (
+    Inventory,
+    InventoryLanguage,
+    InventoryTag,
+    InventoryType,
+)
+from interview.order.models import Order, OrderTag
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    # The lookup cache lives in process memory and would otherwise keep rows
+    # from earlier, rolled back, tests.
+    lookup_cache.clear()
+    for cache in caches.all():
+        cache.clear()
+    yield
+    lookup_cache.clear()
+
+
+@pytest.fixture
+def api_client(client):
+    client.defaults["HTTP_ACCEPT"] = "application/json"
+    return client
+
+
+@pytest.fixture
+def lookups(db) -> dict:
+    return {
+        "types": [
+            InventoryType.objects.create(name=name) for name in ("Movie", "Show")
+        ],
+        "languages": [
+            InventoryLanguage.objects.create(name=name)
+            for name in ("English", "French")
+        ],
+        "inventory_tags": [
+            InventoryTag.objects.create(name="Drama"),
+            InventoryTag.objects.create(name="Comedy"),
+            InventoryTag.objects.create(name="Retired", is_active=False),
+        ],
+        "order_tags": [
+            OrderTag.objects.create(name="Priority"),
+            OrderTag.objects.create(name="Archived", is_active=False),
+        ],
+    }
+
+
+@pytest.fixture
+def catalogue(lookups) -> dict:
+    """
+    Twelve inventory items with one order each, cycling through the lookup
+    rows, tag sets that include inactive and empty ones, and metadata with
+    null fields.
+    """
+    inventory_tags, order_tags = lookups["inventory_tags"], lookups["order_tags"]
+    inventories, orders = [], []
+    for i in range(12):
+        inventory = Inventory.objects.create(
+            name=f"Title {i}",
+            type=lookups["types"][i % 2],
+            language=lookups["languages"][i % 2],
+            metadata={
+                "year": 2000 + i if i % 3 else None,
+                "actors": [f"Actor {i}"] if i % 4 else [],
+                "imdb_rating": 7.5 if i % 2 else None,
+                "rotten_tomatoes_rating": None,
+                "film_locations": [],
+            },
+        )
+        inventory.tags.set(inventory_tags[: i % 4])
+        inventories.append(inventory)
+
+        start_date = date(2024, 1, 1) + timedelta(days=30 * i)
+        order = Order.objects.create(
+            inventory=inventory,
+            start_date=start_date,
+            embargo_date=start_date + timedelta(days=14),
+            is_active=bool(i % 5),
+        )
+        order.tags.set(order_tags[: i % 3])
+        orders.append(order)
+
+    return {**lookups, "inventories": inventories, "orders": orders}
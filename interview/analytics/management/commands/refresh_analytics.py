@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from interview.analytics import reports
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the analytics report snapshots served when "
+        "ANALYTICS_SNAPSHOTS is on. Run it periodically, e.g. from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "reports",
+            nargs="*",
+            help=f"Reports to refresh (default: all of {', '.join(reports.REPORTS)}).",
+        )
+
+    def handle(self, *args, **options):
+        unknown = set(options["reports"]) - reports.REPORTS.keys()
+        if unknown:
+            raise CommandError(f"Unknown reports: {', '.join(sorted(unknown))}.")
+
+        for report, count in reports.refresh(options["reports"]).items():
+            self.stdout.write(f"{report}: {count} rows")
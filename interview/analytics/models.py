@@ -0,0 +1,16 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class ReportSnapshot(models.Model):
+    """
+    The last computed rows of an analytics report, written by the
+    refresh_analytics command.
+    """
+
+    report = models.CharField(max_length=100, unique=True)
+    rows = models.JSONField(encoder=DjangoJSONEncoder)
+    refreshed_at = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"{self.report} at {self.refreshed_at}"
@@ -0,0 +1,99 @@
+from django.db import transaction
+from django.db.models import Avg, Count, FloatField, Q
+from django.db.models.functions import Cast, Round, TruncMonth
+from django.utils import timezone
+
+from interview.analytics.models import ReportSnapshot
+from interview.inventory.models import (
+    METADATA_IMDB_RATING,
+    METADATA_YEAR,
+    Inventory,
+    InventoryLanguage,
+    InventoryTag,
+    InventoryType,
+)
+from interview.order.models import Order, OrderTag
+
+# Every report is a single GROUP BY query; rows are plain dicts ready to render.
+
+
+def count_by_lookup(model, relation: str, *fields: str) -> list[dict]:
+    # Lookup rows without any related rows are listed with a count of 0.
+    return list(
+        model.objects.values("id", "name", *fields)
+        .annotate(count=Count(relation))
+        .order_by("-count", "name")
+    )
+
+
+def inventory_by_type() -> list[dict]:
+    return count_by_lookup(InventoryType, "inventories")
+
+
+def inventory_by_language() -> list[dict]:
+    return count_by_lookup(InventoryLanguage, "inventories")
+
+
+def inventory_by_tag() -> list[dict]:
+    return count_by_lookup(InventoryTag, "inventories", "is_active")
+
+
+def inventory_by_year() -> list[dict]:
+    return list(
+        Inventory.objects.annotate(year=METADATA_YEAR)
+        .values("year")
+        .annotate(
+            count=Count("id"),
+            average_imdb_rating=Cast(Round(Avg(METADATA_IMDB_RATING), 2), FloatField()),
+        )
+        .order_by("year")
+    )
+
+
+def orders_by_tag() -> list[dict]:
+    return count_by_lookup(OrderTag, "orders", "is_active")
+
+
+def orders_by_month() -> list[dict]:
+    return list(
+        Order.objects.annotate(month=TruncMonth("start_date"))
+        .values("month")
+        .annotate(count=Count("id"), active=Count("id", filter=Q(is_active=True)))
+        .order_by("month")
+    )
+
+
+def orders_by_active() -> list[dict]:
+    return list(
+        Order.objects.values("is_active")
+        .annotate(count=Count("id"))
+        .order_by("-is_active")
+    )
+
+
+REPORTS = {
+    "inventory-by-type": inventory_by_type,
+    "inventory-by-language": inventory_by_language,
+    "inventory-by-tag": inventory_by_tag,
+    "inventory-by-year": inventory_by_year,
+    "orders-by-tag": orders_by_tag,
+    "orders-by-month": orders_by_month,
+    "orders-by-active": orders_by_active,
+}
+
+
+def refresh(reports=None) -> dict[str, int]:
+    """
+    Recomputes reports (all of them by default) into ReportSnapshot and
+    returns the number of rows stored per report.
+    """
+    counts = {}
+    with transaction.atomic():
+        for report in reports or REPORTS:
+            rows = REPORTS[report]()
+            ReportSnapshot.objects.update_or_create(
+                report=report,
+                defaults={"rows": rows, "refreshed_at": timezone.now()},
+            )
+            counts[report] = len(rows)
+    return counts
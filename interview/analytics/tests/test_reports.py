@@ -0,0 +1,182 @@
+from collections import Counter, defaultdict
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from interview.analytics import reports
+from interview.analytics.models import ReportSnapshot
+from interview.inventory.models import InventoryType
+
+
+def by_count(rows: list[dict]) -> list[dict]:
+    return sorted(rows, key=lambda row: (-row["count"], row["name"]))
+
+
+def count_lookups(lookup_rows, items, related, *fields) -> list[dict]:
+    counts = Counter(row.pk for item in items for row in related(item))
+    return by_count(
+        [
+            {
+                "id": row.pk,
+                "name": row.name,
+                **{field: getattr(row, field) for field in fields},
+                "count": counts[row.pk],
+            }
+            for row in lookup_rows
+        ]
+    )
+
+
+def expected_reports(catalogue) -> dict[str, list[dict]]:
+    inventories, orders = catalogue["inventories"], catalogue["orders"]
+
+    years = defaultdict(list)
+    for inventory in inventories:
+        years[inventory.metadata["year"]].append(inventory.metadata["imdb_rating"])
+    months = defaultdict(list)
+    for order in orders:
+        months[order.start_date.replace(day=1)].append(order.is_active)
+    active = Counter(order.is_active for order in orders)
+
+    def average(ratings):
+        ratings = [rating for rating in ratings if rating is not None]
+        return round(sum(ratings) / len(ratings), 2) if ratings else None
+
+    return {
+        "inventory-by-type": count_lookups(
+            catalogue["types"], inventories, lambda inventory: [inventory.type]
+        ),
+        "inventory-by-language": count_lookups(
+            catalogue["languages"], inventories, lambda inventory: [inventory.language]
+        ),
+        "inventory-by-tag": count_lookups(
+            catalogue["inventory_tags"],
+            inventories,
+            lambda inventory: inventory.tags.all(),
+            "is_active",
+        ),
+        # Postgres sorts the items without a year last.
+        "inventory-by-year": [
+            {
+                "year": year,
+                "count": len(ratings),
+                "average_imdb_rating": average(ratings),
+            }
+            for year, ratings in sorted(
+                years.items(), key=lambda item: (item[0] is None, item[0] or 0)
+            )
+        ],
+        "orders-by-tag": count_lookups(
+            catalogue["order_tags"], orders, lambda order: order.tags.all(), "is_active"
+        ),
+        "orders-by-month": [
+            {"month": month, "count": len(flags), "active": sum(flags)}
+            for month, flags in sorted(months.items())
+        ],
+        "orders-by-active": [
+            {"is_active": is_active, "count": active[is_active]}
+            for is_active in (True, False)
+        ],
+    }
+
+
+@pytest.fixture
+def expected(catalogue) -> dict[str, list[dict]]:
+    return expected_reports(catalogue)
+
+
+@pytest.mark.parametrize("report", reports.REPORTS)
+def test_report_is_one_query(catalogue, expected, report, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        rows = reports.REPORTS[report]()
+
+    assert rows == expected[report]
+
+
+def test_lookups_without_rows_are_counted(catalogue):
+    InventoryType.objects.create(name="Anime")
+
+    assert reports.inventory_by_type()[-1]["name"] == "Anime"
+    assert reports.inventory_by_type()[-1]["count"] == 0
+
+
+@pytest.mark.parametrize("report", reports.REPORTS)
+def test_snapshot_matches_live(api_client, catalogue, settings, report):
+    settings.ANALYTICS_SNAPSHOTS = True
+    reports.refresh()
+
+    snapshot = api_client.get(f"/analytics/{report}/").json()
+    live = api_client.get(f"/analytics/{report}/?live=true").json()
+
+    assert snapshot["refreshed_at"] is not None
+    assert live["refreshed_at"] is None
+    assert snapshot["results"] == live["results"]
+
+
+def test_snapshot_is_served_until_refreshed(
+    api_client, catalogue, settings, django_assert_num_queries
+):
+    settings.ANALYTICS_SNAPSHOTS = True
+    reports.refresh(["orders-by-active"])
+    catalogue["orders"][1].delete()
+
+    with django_assert_num_queries(1):
+        response = api_client.get("/analytics/orders-by-active/")
+
+    assert response.json()["results"] == [
+        {"is_active": True, "count": 9},
+        {"is_active": False, "count": 3},
+    ]
+    assert api_client.get("/analytics/orders-by-active/?live=1").json()["results"] == [
+        {"is_active": True, "count": 8},
+        {"is_active": False, "count": 3},
+    ]
+
+    reports.refresh(["orders-by-active"])
+    assert api_client.get("/analytics/orders-by-active/").json()["results"] == [
+        {"is_active": True, "count": 8},
+        {"is_active": False, "count": 3},
+    ]
+
+
+def test_missing_snapshot_is_computed(api_client, catalogue, settings):
+    settings.ANALYTICS_SNAPSHOTS = True
+
+    response = api_client.get("/analytics/orders-by-active/")
+
+    assert response.json()["refreshed_at"] is None
+    assert response.json()["results"][0] == {"is_active": True, "count": 9}
+
+
+def test_snapshots_are_ignored_when_disabled(api_client, catalogue, settings):
+    settings.ANALYTICS_SNAPSHOTS = False
+    reports.refresh()
+
+    assert api_client.get("/analytics/orders-by-active/").json()["refreshed_at"] is None
+
+
+def test_unknown_report(api_client, db):
+    assert api_client.get("/analytics/orders-by-colour/").status_code == 404
+
+
+def test_report_list(api_client, db):
+    reports.refresh(["orders-by-tag"])
+
+    refreshed = {
+        row["report"]: row["refreshed_at"]
+        for row in api_client.get("/analytics/").json()
+    }
+
+    assert refreshed.keys() == reports.REPORTS.keys()
+    assert [report for report, at in refreshed.items() if at] == ["orders-by-tag"]
+
+
+def test_refresh_command(catalogue):
+    call_command("refresh_analytics", "orders-by-tag", "orders-by-active")
+
+    assert set(ReportSnapshot.objects.values_list("report", flat=True)) == {
+        "orders-by-tag",
+        "orders-by-active",
+    }
+    with pytest.raises(CommandError):
+        call_command("refresh_analytics", "orders-by-colour")
@@ -0,0 +1,8 @@
+from django.urls import path
+from interview.analytics.views import ReportListView, ReportView
+
+
+urlpatterns = [
+    path("<slug:report>/", ReportView.as_view(), name="analytics-report"),
+    path("", ReportListView.as_view(), name="analytics-reports"),
+]
@@ -0,0 +1,55 @@
+from django.conf import settings
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from interview.analytics.models import ReportSnapshot
+from interview.analytics.reports import REPORTS
+
+
+class ReportListView(APIView):
+    """
+    Lists the available reports and when their snapshots were last refreshed.
+    """
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        refreshed = dict(ReportSnapshot.objects.values_list("report", "refreshed_at"))
+        return Response(
+            [
+                {"report": report, "refreshed_at": refreshed.get(report)}
+                for report in REPORTS
+            ],
+            status=200,
+        )
+
+
+class ReportView(APIView):
+    """
+    Serves a report computed by the database. With ANALYTICS_SNAPSHOTS on, the
+    last snapshot written by refresh_analytics is served when there is one;
+    ?live=true always computes the report.
+    """
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        report = kwargs["report"]
+        if report not in REPORTS:
+            raise NotFound(f"Unknown report: {report}.")
+
+        live = request.query_params.get("live", "").lower() in ("1", "true")
+        if settings.ANALYTICS_SNAPSHOTS and not live:
+            snapshot = ReportSnapshot.objects.filter(report=report).first()
+            if snapshot is not None:
+                return Response(
+                    {
+                        "report": report,
+                        "refreshed_at": snapshot.refreshed_at,
+                        "results": snapshot.rows,
+                    },
+                    status=200,
+                )
+
+        return Response(
+            {"report": report, "refreshed_at": None, "results": REPORTS[report]()},
+            status=200,
+        )
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "interview.core"
+
+    def ready(self):
+        from interview.core import signals
+
+        signals.connect_lookup_cache_invalidation()
+        signals.connect_lookup_cache_requests()
+        signals.connect_m2m_touch()
@@ -1,5 +1,14 @@
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
+from django.dispatch import Signal
+from django.utils import timezone
+
+from interview.core.cache import lookup_cache
+
+# Sent once per IsActiveModel.set_active() call that changed any rows, with
+# is_active, count and the updated_at value written (None on models without
+# timestamps), in place of per-row post_save signals.
+is_active_changed = Signal()
 
 
 class UUIDModel(models.Model):
@@ -16,10 +25,17 @@ class UUIDModel(models.Model):
             return None
 
 
+class TimestampedQuerySet(models.QuerySet):
+    def updated_since(self, timestamp):
+        return self.filter(updated_at__gte=timestamp)
+
+
 class TimestampedModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = TimestampedQuerySet.as_manager()
+
     class Meta:
         abstract = True
 
@@ -31,12 +47,36 @@ class IsActiveModel(models.Model):
         abstract = True
 
     @classmethod
-    def activate(cls, pk: int):
-        cls.objects.filter(pk=pk).update(is_active=False)
+    def activate(cls, pk: int) -> int:
+        return cls.set_active(True, cls.objects.filter(pk=pk))
 
     @classmethod
-    def deactivate(cls, pk: int):
-        cls.objects.filter(pk=pk).update(is_active=True)
+    def deactivate(cls, pk: int) -> int:
+        return cls.set_active(False, cls.objects.filter(pk=pk))
+
+    @classmethod
+    def set_active(cls, is_active: bool, queryset=None) -> int:
+        """
+        Sets is_active on the rows of queryset (every row by default) in a single
+        UPDATE, bumping updated_at on timestamped models, and returns the number
+        of rows that changed. Rows already in that state are left untouched.
+        """
+        if queryset is None:
+            queryset = cls.objects.all()
+
+        values = {"is_active": is_active}
+        if issubclass(cls, TimestampedModel):
+            values["updated_at"] = timezone.now()
+
+        count = queryset.exclude(is_active=is_active).update(**values)
+        if count:
+            is_active_changed.send(
+                sender=cls,
+                is_active=is_active,
+                count=count,
+                updated_at=values.get("updated_at"),
+            )
+        return count
 
 
 class NameModel(models.Model):
@@ -58,7 +98,4 @@ class UniqueNameModel(models.Model):
 
     @classmethod
     def get_by_name(cls, name: str):
-        try:
-            return cls.objects.get(name=name)
-        except ObjectDoesNotExist:
-            return None
+        return lookup_cache.get_by_name(cls, name)
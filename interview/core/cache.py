@@ -0,0 +1,256 @@
+import copy
+import hashlib
+import threading
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+# Shared cache generations already checked in the current request, by table;
+# None outside requests, where every read checks.
+checked_generations = ContextVar("checked_generations", default=None)
+
+
+class LookupCache:
+    """
+    Read-through cache for small, nearly static lookup tables (types, languages
+    and tags). A table is loaded whole on first use and kept in process memory
+    for LOOKUP_CACHE_TIMEOUT seconds. When LOOKUP_CACHE_ALIAS names one of the
+    configured CACHES, loaded tables are shared between processes through it,
+    under a per-table generation that writes bump on commit. Each request
+    checks the generation of a table once, so no process serves a table older
+    than the request.
+    """
+
+    key_prefix = "lookup"
+
+    def __init__(self):
+        self._tables = {}
+        self._reloaded = {}
+
+    def get(self, model, pk):
+        """
+        Returns the cached instance for pk. The instance is shared between
+        callers and must be treated as read-only.
+        """
+        return self.get_complete_table(model, pks=[pk])["by_id"].get(pk)
+
+    def get_by_name(self, model, name: str):
+        table = self.get_complete_table(model, names=[name])
+        pk = table["by_name"].get(name)
+        if pk is None:
+            return None
+        return copy.copy(table["by_id"][pk])
+
+    def get_complete_table(self, model, pks=(), names=()) -> dict:
+        """
+        Returns the table, reloading it from the database if it lacks any of
+        pks or names, e.g. rows created without signals by another process.
+        Reloads on a miss happen at most once per LOOKUP_CACHE_MISS_INTERVAL
+        seconds per table, so requests for rows that do not exist cannot keep
+        reloading it.
+        """
+        table = self.get_table(model)
+        if set(pks) <= table["by_id"].keys() and set(names) <= table["by_name"].keys():
+            return table
+
+        label = model._meta.label_lower
+        now = time.monotonic()
+        reloaded = self._reloaded.get(label)
+        if (
+            reloaded is not None
+            and now - reloaded < settings.LOOKUP_CACHE_MISS_INTERVAL
+        ):
+            return table
+        self._reloaded[label] = now
+        return self.store(model, self.get_generation(model), self.query(model))
+
+    def get_table(self, model, min_ttl: float = 0) -> dict:
+        """
+        Returns the table, reloading it if it expires within min_ttl seconds or
+        another process changed it.
+        """
+        generation = self.get_generation(model)
+        entry = self._tables.get(model._meta.label_lower)
+        if (
+            entry is not None
+            and entry["expires"] > time.monotonic() + min_ttl
+            and entry["generation"] == generation
+        ):
+            return entry["table"]
+
+        return self.store(model, generation, self.load(model, generation))
+
+    def is_loaded(self, model, min_ttl: float = 0) -> bool:
+        """
+        Whether get_table() can return without touching the database or, with
+        a shared cache, the cache server.
+        """
+        label = model._meta.label_lower
+        entry = self._tables.get(label)
+        if entry is None or entry["expires"] <= time.monotonic() + min_ttl:
+            return False
+        if self.get_shared_cache() is None:
+            return True
+        checked = checked_generations.get()
+        return checked is not None and checked.get(label) == entry["generation"]
+
+    def load(self, model, generation: int) -> dict:
+        shared_cache = self.get_shared_cache()
+        key = self.get_key(model, generation)
+        table = shared_cache.get(key) if shared_cache else None
+        if table is None:
+            table = self.query(model)
+        return table
+
+    def query(self, model) -> dict:
+        instances = list(model.objects.all())
+        return {
+            "by_id": {instance.pk: instance for instance in instances},
+            "by_name": {instance.name: instance.pk for instance in instances},
+        }
+
+    def store(self, model, generation: int, table: dict) -> dict:
+        self._tables[model._meta.label_lower] = {
+            "table": table,
+            "generation": generation,
+            "expires": time.monotonic() + settings.LOOKUP_CACHE_TIMEOUT,
+        }
+        shared_cache = self.get_shared_cache()
+        # Rows read inside a transaction may never be committed.
+        if shared_cache and not transaction.get_connection().in_atomic_block:
+            shared_cache.set(
+                self.get_key(model, generation), table, settings.LOOKUP_CACHE_TIMEOUT
+            )
+        return table
+
+    def get_generation(self, model) -> int:
+        shared_cache = self.get_shared_cache()
+        if shared_cache is None:
+            return 0
+
+        label = model._meta.label_lower
+        checked = checked_generations.get()
+        if checked is not None and label in checked:
+            return checked[label]
+        # Read before the rows, so that a table loaded while another process
+        # commits a change is stored under the generation that change retires.
+        generation = shared_cache.get(self.get_generation_key(model), 0)
+        if checked is not None:
+            checked[label] = generation
+        return generation
+
+    def invalidate(self, model):
+        label = model._meta.label_lower
+        self._tables.pop(label, None)
+        checked = checked_generations.get()
+        if checked is not None:
+            checked.pop(label, None)
+        if self.get_shared_cache():
+            # Other processes must not reload before the change is visible.
+            transaction.on_commit(lambda: self.bump_generation(model))
+
+    def bump_generation(self, model):
+        shared_cache = self.get_shared_cache()
+        key = self.get_generation_key(model)
+        try:
+            shared_cache.incr(key)
+        except ValueError:
+            if not shared_cache.add(key, 1, None):
+                shared_cache.incr(key)
+
+    def start_request(self, **kwargs):
+        checked_generations.set({})
+
+    def finish_request(self, **kwargs):
+        checked_generations.set(None)
+
+    def clear(self):
+        self._tables.clear()
+        self._reloaded.clear()
+
+    def get_key(self, model, generation: int) -> str:
+        return f"{self.key_prefix}:{model._meta.label_lower}:{generation}"
+
+    def get_generation_key(self, model) -> str:
+        return f"{self.key_prefix}:generation:{model._meta.label_lower}"
+
+    def get_shared_cache(self):
+        if settings.LOOKUP_CACHE_ALIAS is None:
+            return None
+        return caches[settings.LOOKUP_CACHE_ALIAS]
+
+
+lookup_cache = LookupCache()
+
+
+class ResponseCache:
+    """
+    Caches rendered response bodies in one of the configured CACHES. Keys embed
+    generation counters, so invalidating a namespace, or a single object in it,
+    is one increment instead of a scan for affected keys. Hits and misses are
+    counted per namespace in this process.
+    """
+
+    key_prefix = "response"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def get_key(self, namespace: str, scope: str, variant: str) -> str:
+        generations = self.get_generations([f"{namespace}", f"{namespace}:{scope}"])
+        digest = hashlib.md5(variant.encode()).hexdigest()
+        return f"{self.key_prefix}:{namespace}:{scope}:{generations}:{digest}"
+
+    def get(self, namespace: str, key: str) -> dict | None:
+        entry = self.get_cache().get(key)
+        self.count(namespace, "hits" if entry is not None else "misses")
+        return entry
+
+    def set(self, key: str, entry: dict):
+        self.get_cache().set(key, entry, settings.RESPONSE_CACHE_TIMEOUT)
+
+    def get_generations(self, names: list[str]) -> str:
+        keys = [self.get_generation_key(name) for name in names]
+        generations = self.get_cache().get_many(keys)
+        return ".".join(str(generations.get(key, 0)) for key in keys)
+
+    def invalidate(self, namespace: str, scope: str | None = None):
+        """
+        Invalidates one scope of a namespace (a list, or an object id), or the
+        whole namespace when no scope is given.
+        """
+        cache = self.get_cache()
+        key = self.get_generation_key(
+            namespace if scope is None else f"{namespace}:{scope}"
+        )
+        try:
+            cache.incr(key)
+        except ValueError:
+            if not cache.add(key, 1, None):
+                cache.incr(key)
+
+    def count(self, namespace: str, outcome: str):
+        with self._lock:
+            stats = self._stats.setdefault(namespace, {"hits": 0, "misses": 0})
+            stats[outcome] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {namespace: dict(stats) for namespace, stats in self._stats.items()}
+
+    def get_generation_key(self, name: str) -> str:
+        return f"{self.key_prefix}:generation:{name}"
+
+    def is_enabled(self) -> bool:
+        return settings.RESPONSE_CACHE_ALIAS is not None
+
+    def get_cache(self):
+        return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+response_cache = ResponseCache()
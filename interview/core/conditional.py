@@ -0,0 +1,172 @@
+import asyncio
+import hashlib
+from datetime import datetime
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+from rest_framework.response import Response
+
+from interview.core.cache import lookup_cache, response_cache
+from interview.core.routers import use_primary
+
+
+def get_queryset_validators(
+    request, queryset, timestamp_fields=("updated_at",), lookup_models=()
+) -> tuple[str, datetime | None]:
+    """
+    Computes an ETag and Last-Modified value for a queryset from a single
+    COUNT/MAX aggregate, without fetching or serializing any rows. Nested
+    lookup tables are folded in from the lookup cache.
+    """
+    aggregate = queryset.order_by().aggregate(
+        count=Count("pk"),
+        **{f"max_{i}": Max(field) for i, field in enumerate(timestamp_fields)},
+    )
+    timestamps = [
+        aggregate[f"max_{i}"]
+        for i in range(len(timestamp_fields))
+        if aggregate[f"max_{i}"] is not None
+    ]
+    for model in lookup_models:
+        table = lookup_cache.get_table(model)["by_id"]
+        timestamps.extend(instance.updated_at for instance in table.values())
+
+    last_modified = max(timestamps, default=None)
+    key = "|".join(
+        [
+            request.get_full_path(),
+            str(aggregate["count"]),
+            last_modified.isoformat() if last_modified else "",
+        ]
+    )
+    etag = quote_etag(hashlib.md5(key.encode()).hexdigest())
+
+    return etag, last_modified
+
+
+def conditional_get(method):
+    """
+    Wraps a view's get() so requests carrying a matching If-None-Match or
+    If-Modified-Since get a 304 before the view queries or serializes anything.
+    The view provides its validators through get_validators(). Async get()
+    methods are supported; their validators are computed in a worker thread.
+    """
+
+    if asyncio.iscoroutinefunction(method):
+
+        @wraps(method)
+        async def async_wrapper(self, request, *args, **kwargs):
+            etag, last_modified = await sync_to_async(self.get_validators)(
+                request, *args, **kwargs
+            )
+            response = get_not_modified_response(request, etag, last_modified)
+            if response is None:
+                response = await method(self, request, *args, **kwargs)
+            return set_validator_headers(response, etag, last_modified)
+
+        return async_wrapper
+
+    @wraps(method)
+    def wrapper(self, request, *args, **kwargs):
+        etag, last_modified = self.get_validators(request, *args, **kwargs)
+        response = get_not_modified_response(request, etag, last_modified)
+        if response is None:
+            response = method(self, request, *args, **kwargs)
+        return set_validator_headers(response, etag, last_modified)
+
+    return wrapper
+
+
+def get_not_modified_response(request, etag, last_modified):
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    return get_conditional_response(request, etag=etag, last_modified=timestamp)
+
+
+def set_validator_headers(response, etag, last_modified):
+    if response.status_code in (200, 304):
+        if etag and not response.has_header("ETag"):
+            response["ETag"] = etag
+        if last_modified and not response.has_header("Last-Modified"):
+            response["Last-Modified"] = http_date(int(last_modified.timestamp()))
+
+    return response
+
+
+def cache_response(method):
+    """
+    Wraps a view's get() so that rendered JSON bodies are served from the
+    response cache. The view names its namespace in cache_namespace and the
+    scope of a request, "list" or an object id, through get_cache_scope().
+    Only 200 JSON responses are stored, and misses are rendered from the
+    primary; conditional requests that hit the cache are answered from the
+    stored validators. Apply it above conditional_get.
+    """
+
+    @wraps(method)
+    def wrapper(self, request, *args, **kwargs):
+        if (
+            not response_cache.is_enabled()
+            or request.accepted_renderer.format != "json"
+        ):
+            return method(self, request, *args, **kwargs)
+
+        namespace = self.cache_namespace
+        key = response_cache.get_key(
+            namespace,
+            self.get_cache_scope(request, *args, **kwargs),
+            f"{request.build_absolute_uri()}|{request.accepted_media_type}",
+        )
+        entry = response_cache.get(namespace, key)
+        if entry is None:
+            # A lagging replica could otherwise store a stale body under the new
+            # generation, for every client.
+            with use_primary():
+                response = method(self, request, *args, **kwargs)
+            if not isinstance(response, Response) or response.status_code != 200:
+                return response
+            entry = render_cache_entry(self, request, response)
+            response_cache.set(key, entry)
+            cache_status = "MISS"
+        else:
+            cache_status = "HIT"
+
+        last_modified = entry["headers"].get("Last-Modified")
+        response = get_conditional_response(
+            request,
+            etag=entry["headers"].get("ETag"),
+            last_modified=last_modified and parse_http_date_safe(last_modified),
+        )
+        if response is None:
+            response = HttpResponse(
+                entry["content"], content_type=entry["content_type"]
+            )
+        for header, value in entry["headers"].items():
+            response[header] = value
+        response["X-Cache"] = cache_status
+
+        return response
+
+    return wrapper
+
+
+def render_cache_entry(view, request, response) -> dict:
+    renderer = request.accepted_renderer
+    content_type = renderer.media_type
+    if renderer.charset:
+        content_type = f"{content_type}; charset={renderer.charset}"
+
+    return {
+        "content": renderer.render(
+            response.data, request.accepted_media_type, view.get_renderer_context()
+        ),
+        "content_type": content_type,
+        "headers": {
+            header: response[header]
+            for header in ("ETag", "Last-Modified")
+            if response.has_header(header)
+        },
+    }
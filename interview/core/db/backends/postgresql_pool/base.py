@@ -0,0 +1,27 @@
+from functools import partial
+
+from django.db.backends.postgresql import base
+
+from interview.core.db.backends.postgresql_pool.pool import get_pool
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    PostgreSQL backend that borrows connections from an in-process pool and
+    returns them on close instead of disconnecting. Size it with
+    DATABASES[alias]["POOL"] = {"MAX_SIZE": ..., "TIMEOUT": ...} and keep
+    CONN_MAX_AGE at 0 so every request hands its connection back.
+    """
+
+    def get_new_connection(self, conn_params):
+        pool = get_pool(self.alias, self.settings_dict)
+        connection = pool.get(partial(super().get_new_connection, conn_params))
+        self.isolation_level = self.settings_dict["OPTIONS"].get(
+            "isolation_level", connection.isolation_level
+        )
+        return connection
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                get_pool(self.alias, self.settings_dict).put(self.connection)
@@ -0,0 +1,152 @@
+import collections
+import os
+import threading
+import time
+
+import psycopg2
+from psycopg2 import extensions
+
+
+class ConnectionPool:
+    """
+    Bounded, thread-safe pool of psycopg2 connections. At most max_size
+    connections are open at once; get() waits up to timeout seconds for one to
+    be returned before giving up.
+    """
+
+    def __init__(self, max_size: int = 10, timeout: float = 10.0, health_checks=True):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_checks = health_checks
+        self.idle = collections.deque()
+        self.open = 0
+        self.condition = threading.Condition()
+        self.counters = collections.Counter()
+
+    def get(self, connect):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            with self.condition:
+                while not self.idle and self.open >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.counters["timeouts"] += 1
+                        raise psycopg2.OperationalError(
+                            f"No pooled connection available within {self.timeout}s."
+                        )
+                    self.counters["waits"] += 1
+                    self.condition.wait(remaining)
+
+                if self.idle:
+                    connection = self.idle.pop()
+                else:
+                    connection = None
+                    self.open += 1
+
+            if connection is None:
+                try:
+                    connection = connect()
+                except Exception:
+                    self.release()
+                    raise
+                self.counters["created"] += 1
+                return connection
+
+            if self.is_usable(connection):
+                self.counters["reused"] += 1
+                return connection
+            self.discard(connection)
+
+    def put(self, connection):
+        if not self.reset(connection):
+            self.discard(connection)
+            return
+
+        with self.condition:
+            self.idle.append(connection)
+            self.condition.notify()
+
+    def discard(self, connection):
+        self.counters["discarded"] += 1
+        try:
+            connection.close()
+        except psycopg2.Error:
+            pass
+        self.release()
+
+    def release(self):
+        with self.condition:
+            self.open -= 1
+            self.condition.notify()
+
+    def reset(self, connection) -> bool:
+        if connection.closed:
+            return False
+        status = connection.info.transaction_status
+        if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+            return False
+        if status != extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                connection.rollback()
+            except psycopg2.Error:
+                return False
+        return True
+
+    def is_usable(self, connection) -> bool:
+        if connection.closed:
+            return False
+        if not self.health_checks:
+            return True
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        except psycopg2.Error:
+            return False
+        return True
+
+    def close(self):
+        with self.condition:
+            idle, self.idle = self.idle, collections.deque()
+        for connection in idle:
+            self.discard(connection)
+
+    def stats(self) -> dict:
+        with self.condition:
+            return {
+                "max_size": self.max_size,
+                "open": self.open,
+                "idle": len(self.idle),
+                "in_use": self.open - len(self.idle),
+                **self.counters,
+            }
+
+
+# Keyed by process id as well as alias so that a forked worker never reuses
+# connections opened by its parent.
+pools = {}
+pools_lock = threading.Lock()
+
+
+def get_pool(alias: str, settings_dict: dict) -> ConnectionPool:
+    key = (os.getpid(), alias)
+    pool = pools.get(key)
+    if pool is None:
+        with pools_lock:
+            pool = pools.get(key)
+            if pool is None:
+                options = settings_dict.get("POOL", {})
+                pool = pools[key] = ConnectionPool(
+                    max_size=options.get("MAX_SIZE", 10),
+                    timeout=options.get("TIMEOUT", 10.0),
+                    health_checks=settings_dict["CONN_HEALTH_CHECKS"],
+                )
+    return pool
+
+
+def get_pool_stats() -> dict[str, dict]:
+    pid = os.getpid()
+    return {
+        alias: pool.stats()
+        for (pool_pid, alias), pool in pools.items()
+        if pool_pid == pid
+    }
@@ -0,0 +1,353 @@
+ISO_LANGUAGES = {
+    "ab": "Abkhaz",
+    "aa": "Afar",
+    "af": "Afrikaans",
+    "ak": "Akan",
+    "sq": "Albanian",
+    "am": "Amharic",
+    "ar": "Arabic",
+    "an": "Aragonese",
+    "hy": "Armenian",
+    "as": "Assamese",
+    "av": "Avaric",
+    "ae": "Avestan",
+    "ay": "Aymara",
+    "az": "Azerbaijani",
+    "bm": "Bambara",
+    "ba": "Bashkir",
+    "eu": "Basque",
+    "be": "Belarusian",
+    "bn": "Bengali",
+    "bh": "Bihari",
+    "bi": "Bislama",
+    "bs": "Bosnian",
+    "br": "Breton",
+    "bg": "Bulgarian",
+    "my": "Burmese",
+    "ch": "Chamorro",
+    "ce": "Chechen",
+    "zh": "Chinese",
+    "cv": "Chuvash",
+    "kw": "Cornish",
+    "co": "Corsican",
+    "cr": "Cree",
+    "hr": "Croatian",
+    "cs": "Czech",
+    "da": "Danish",
+    "nl": "Dutch",
+    "en": "English",
+    "eo": "Esperanto",
+    "et": "Estonian",
+    "ee": "Ewe",
+    "fo": "Faroese",
+    "fj": "Fijian",
+    "fi": "Finnish",
+    "fr": "French",
+    "gl": "Galician",
+    "ka": "Georgian",
+    "de": "German",
+    "gn": "Guaraní",
+    "gu": "Gujarati",
+    "ha": "Hausa",
+    "he": "Hebrew",
+    "hz": "Herero",
+    "hi": "Hindi",
+    "ho": "Hiri Motu",
+    "hu": "Hungarian",
+    "ia": "Interlingua",
+    "id": "Indonesian",
+    "ie": "Interlingue",
+    "ga": "Irish",
+    "ig": "Igbo",
+    "ik": "Inupiaq",
+    "io": "Ido",
+    "is": "Icelandic",
+    "it": "Italian",
+    "iu": "Inuktitut",
+    "ja": "Japanese",
+    "jv": "Javanese",
+    "kn": "Kannada",
+    "kr": "Kanuri",
+    "ks": "Kashmiri",
+    "kk": "Kazakh",
+    "km": "Khmer",
+    "rw": "Kinyarwanda",
+    "kv": "Komi",
+    "kg": "Kongo",
+    "ko": "Korean",
+    "ku": "Kurdish",
+    "la": "Latin",
+    "lg": "Luganda",
+    "ln": "Lingala",
+    "lo": "Lao",
+    "lt": "Lithuanian",
+    "lu": "Luba-Katanga",
+    "lv": "Latvian",
+    "gv": "Manx",
+    "mk": "Macedonian",
+    "mg": "Malagasy",
+    "ms": "Malay",
+    "ml": "Malayalam",
+    "mt": "Maltese",
+    "mh": "Marshallese",
+    "mn": "Mongolian",
+    "na": "Nauru",
+    "nd": "North Ndebele",
+    "ne": "Nepali",
+    "ng": "Ndonga",
+    "nn": "Norwegian Nynorsk",
+    "no": "Norwegian",
+    "ii": "Nuosu",
+    "nr": "South Ndebele",
+    "oc": "Occitan",
+    "om": "Oromo",
+    "or": "Oriya",
+    "fa": "Persian",
+    "pl": "Polish",
+    "pt": "Portuguese",
+    "qu": "Quechua",
+    "rm": "Romansh",
+    "rn": "Kirundi",
+    "ru": "Russian",
+    "sc": "Sardinian",
+    "sd": "Sindhi",
+    "se": "Northern Sami",
+    "sm": "Samoan",
+    "sg": "Sango",
+    "sr": "Serbian",
+    "sn": "Shona",
+    "sk": "Slovak",
+    "sl": "Slovene",
+    "so": "Somali",
+    "st": "Southern Sotho",
+    "su": "Sundanese",
+    "sw": "Swahili",
+    "ss": "Swati",
+    "sv": "Swedish",
+    "ta": "Tamil",
+    "te": "Telugu",
+    "tg": "Tajik",
+    "th": "Thai",
+    "ti": "Tigrinya",
+    "tk": "Turkmen",
+    "tl": "Tagalog",
+    "tn": "Tswana",
+    "tr": "Turkish",
+    "ts": "Tsonga",
+    "tt": "Tatar",
+    "tw": "Twi",
+    "ty": "Tahitian",
+    "uk": "Ukrainian",
+    "ur": "Urdu",
+    "uz": "Uzbek",
+    "ve": "Venda",
+    "vi": "Vietnamese",
+    "wa": "Walloon",
+    "cy": "Welsh",
+    "wo": "Wolof",
+    "fy": "Western Frisian",
+    "xh": "Xhosa",
+    "yi": "Yiddish",
+    "yo": "Yoruba",
+}
+
+INVENTORY_TAGS = [
+    "Action",
+    "Adventure",
+    "Comedy",
+    "Drama",
+    "Romance",
+    "Sci-Fi",
+    "Thriller",
+    "Crime",
+]
+
+INVENTORY_TYPES = ["Movie", "Episode", "Version"]
+
+MATRIX_ACTORS = ["Keanu Reeves", "Laurence Fishburne", "Carrie-Anne Moss"]
+LOTR_ACTORS = ["Elijah Wood", "Ian McKellen", "Viggo Mortensen"]
+SEINFELD_ACTORS = ["Jerry Seinfeld", "Julia Louis-Dreyfus", "Michael Richards"]
+
+INVENTORY_ITEMS = [
+    dict(
+        name="The Matrix",
+        language="Abkhaz",
+        type="Version",
+        tags=["Action"],
+        metadata=dict(
+            year=1999,
+            actors=MATRIX_ACTORS,
+            imdb_rating=8.7,
+            rotten_tomatoes_rating=87,
+        ),
+    ),
+    dict(
+        name="The Matrix Reloaded",
+        language="Assamese",
+        type="Version",
+        tags=["Action"],
+        metadata=dict(
+            year=2003,
+            actors=MATRIX_ACTORS,
+            imdb_rating=7.2,
+            rotten_tomatoes_rating=73,
+        ),
+    ),
+    dict(
+        name="The Matrix Revolutions",
+        language="Assamese",
+        type="Version",
+        tags=["Action"],
+        metadata=dict(
+            year=2003,
+            actors=MATRIX_ACTORS,
+            imdb_rating=6.7,
+            rotten_tomatoes_rating=59,
+        ),
+    ),
+    dict(
+        name="Reqiuem for a Dream",
+        language="Avestan",
+        type="Version",
+        tags=["Drama"],
+        metadata=dict(
+            year=2000,
+            actors=["Ellen Burstyn", "Jared Leto", "Jennifer Connelly"],
+            imdb_rating=8.3,
+            rotten_tomatoes_rating=89,
+        ),
+    ),
+    dict(
+        name="The Lord of the Rings: The Fellowship of the Ring",
+        language="English",
+        type="Movie",
+        tags=["Adventure"],
+        metadata=dict(
+            year=2001,
+            actors=LOTR_ACTORS,
+            imdb_rating=8.8,
+            rotten_toamtoes_rating=91,
+        ),
+    ),
+    dict(
+        name="The Lord of the Rings: The Two Towers",
+        language="English",
+        type="Movie",
+        tags=["Adventure"],
+        metadata=dict(
+            year=2002,
+            actors=LOTR_ACTORS,
+            imdb_rating=8.7,
+            rotten_tomatoes_rating=87,
+        ),
+    ),
+    dict(
+        name="The Lord of the Rings: The Return of the King",
+        language="English",
+        type="Movie",
+        tags=["Adventure"],
+        metadata=dict(
+            year=2003,
+            actors=LOTR_ACTORS,
+            imdb_rating=8.9,
+            rotten_tomatoes_rating=95,
+        ),
+    ),
+    dict(
+        name="Titanic",
+        language="English",
+        type="Movie",
+        tags=["Romance"],
+        metadata=dict(
+            year=1997,
+            actors=["Leonardo DiCaprio", "Kate Winslet", "Billy Zane"],
+            imdb_rating=7.8,
+            rotten_tomatoes_rating=89,
+        ),
+    ),
+    dict(
+        name="Crash",
+        language="Guaraní",
+        type="Version",
+        tags=["Drama"],
+        metadata=dict(
+            year=2004,
+            actors=["Don Cheadle", "Sandra Bullock", "Matt Dillon"],
+            imdb_rating=7.8,
+            rotten_tomatoes_rating=89,
+        ),
+    ),
+] + [
+    dict(
+        name=f"Seinfeld Season 1 Episode {episode}",
+        language="English",
+        type="Episode",
+        tags=["Comedy"],
+        metadata=dict(
+            year=1990,
+            actors=SEINFELD_ACTORS,
+            imdb_rating=8.8,
+            rotten_tomatoes_rating=91,
+        ),
+    )
+    for episode in range(1, 9)
+]
+
+ORDER_TAGS = [
+    "San Antonio",
+    "Austin",
+    "Dallas",
+    "Houston",
+    "El Paso",
+    "Boston",
+    "New York",
+    "Chicago",
+    "Los Angeles",
+    "San Francisco",
+    "Pending",
+    "Delivered",
+    "Cancelled",
+    "On-hold",
+    "Processing",
+    "QC",
+    "Dubbing",
+    "Subbing",
+    "Closed Captioning",
+    "Transcription",
+    "Transcoding",
+]
+
+# Start and embargo dates are offsets in days from the day the data is seeded.
+ORDERS = [
+    dict(
+        inventory="The Lord of the Rings: The Fellowship of the Ring",
+        start_date=0,
+        embargo_date=30,
+        tags=["San Antonio", "Pending", "Dubbing"],
+    ),
+    dict(
+        inventory="The Lord of the Rings: The Two Towers",
+        start_date=0,
+        embargo_date=-30,
+        tags=["Chicago", "Delivered", "Dubbing"],
+    ),
+    dict(
+        inventory="The Lord of the Rings: The Return of the King",
+        start_date=5,
+        embargo_date=30,
+        tags=["Boston", "QC", "Subbing", "Transcription"],
+    ),
+    dict(
+        inventory="Crash",
+        start_date=15,
+        embargo_date=30,
+        tags=["New York", "Processing", "Dubbing", "Transcoding"],
+    ),
+    dict(
+        inventory="The Matrix",
+        start_date=15,
+        embargo_date=30,
+        is_active=False,
+        tags=["Los Angeles", "Cancelled", "Dubbing", "Transcoding"],
+    ),
+]
@@ -0,0 +1,194 @@
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+current_profile = ContextVar("current_profile", default=None)
+
+# Histogram bucket upper bounds: milliseconds for the timings, a plain count
+# for queries.
+DURATION_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+PHASES = ("db", "serialize", "render")
+
+PLACEHOLDER_LIST = re.compile(r"%s(?:\s*,\s*%s)+")
+NUMBER = re.compile(r"\b\d+\b")
+
+
+class NPlusOneError(AssertionError):
+    pass
+
+
+def get_sql_shape(sql: str) -> str:
+    """
+    Normalizes a statement so that queries differing only in their parameters,
+    including the length of IN lists, share a shape.
+    """
+    return NUMBER.sub("N", PLACEHOLDER_LIST.sub("%s", sql))
+
+
+class RequestProfile:
+    """
+    Collects the query count and the time spent in the database, serializing
+    and rendering while it is the current profile.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.durations = dict.fromkeys(PHASES, 0.0)
+        self.shapes = Counter()
+        self.started = time.perf_counter()
+        self._depth = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        # connection.execute_wrapper() hook.
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.durations["db"] += time.perf_counter() - start
+            self.queries += 1
+            self.shapes[get_sql_shape(sql)] += 1
+
+    @contextmanager
+    def activate(self):
+        token = current_profile.set(self)
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(self))
+                yield self
+        finally:
+            current_profile.reset(token)
+
+    @contextmanager
+    def time(self, phase: str):
+        # Only the outermost block of a phase is counted, so nested serializers
+        # are not timed twice.
+        self._depth[phase] += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth[phase] -= 1
+            if not self._depth[phase]:
+                self.durations[phase] += time.perf_counter() - start
+
+    def get_total(self) -> float:
+        return time.perf_counter() - self.started
+
+    def get_repeated_queries(self, threshold: int) -> dict[str, int]:
+        return {
+            shape: count for shape, count in self.shapes.items() if count > threshold
+        }
+
+    def get_server_timing(self) -> str:
+        metrics = [
+            f'db;dur={self.durations["db"] * 1000:.1f};desc="{self.queries} queries"',
+            f'serialize;dur={self.durations["serialize"] * 1000:.1f}',
+            f'render;dur={self.durations["render"] * 1000:.1f}',
+            f"total;dur={self.get_total() * 1000:.1f}",
+        ]
+        return ", ".join(metrics)
+
+
+@contextmanager
+def timed(phase: str):
+    """
+    Adds the time spent in the block to the current request profile, if any.
+    """
+    profile = current_profile.get()
+    if profile is None:
+        yield
+        return
+    with profile.time(phase):
+        yield
+
+
+@contextmanager
+def detect_n_plus_one(threshold: int = 10):
+    """
+    Raises NPlusOneError when a statement of the same shape runs more than
+    threshold times inside the block, e.g. around a test client request.
+    """
+    profile = RequestProfile()
+    with profile.activate():
+        yield profile
+
+    repeated = profile.get_repeated_queries(threshold)
+    if repeated:
+        raise NPlusOneError(
+            "Repeated queries: "
+            + "; ".join(f"{count} x {shape}" for shape, count in repeated.items())
+        )
+
+
+class Histogram:
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.sum += value
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                return
+        self.counts[-1] += 1
+
+    def as_dict(self) -> dict:
+        labels = [str(bound) for bound in self.buckets] + ["+Inf"]
+        return {"sum": self.sum, "buckets": dict(zip(labels, self.counts))}
+
+
+class EndpointStats:
+    """
+    Per-process histograms of request profiles, keyed by endpoint.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def record(self, endpoint: str, profile: RequestProfile, n_plus_one: bool):
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = {
+                    "count": 0,
+                    "n_plus_one": 0,
+                    "queries": Histogram(QUERY_BUCKETS),
+                    "total_ms": Histogram(DURATION_BUCKETS),
+                    **{f"{phase}_ms": Histogram(DURATION_BUCKETS) for phase in PHASES},
+                }
+            stats["count"] += 1
+            stats["n_plus_one"] += n_plus_one
+            stats["queries"].observe(profile.queries)
+            stats["total_ms"].observe(profile.get_total() * 1000)
+            for phase in PHASES:
+                stats[f"{phase}_ms"].observe(profile.durations[phase] * 1000)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                endpoint: {
+                    name: value.as_dict() if isinstance(value, Histogram) else value
+                    for name, value in stats.items()
+                }
+                for endpoint, stats in self._endpoints.items()
+            }
+
+    def clear(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+endpoint_stats = EndpointStats()
@@ -0,0 +1,493 @@
+import json
+import logging
+import platform
+import statistics
+import time
+import tracemalloc
+from datetime import date, timedelta
+from itertools import count
+
+import django
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client
+from django.test.utils import (
+    CaptureQueriesContext,
+    override_settings,
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+
+from interview.core.cache import lookup_cache
+from interview.inventory.models import (
+    Inventory,
+    InventoryLanguage,
+    InventoryTag,
+    InventoryType,
+)
+from interview.order.models import Order, OrderTag
+
+METADATA = {
+    "year": 2000,
+    "actors": ["Ana Adams", "Ben Baker"],
+    "imdb_rating": 7.5,
+    "rotten_tomatoes_rating": 80,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds a test database and measures throughput, p50/p99 latency, query "
+        "counts and peak memory of every inventory and order route through the "
+        "test client. Writes the results as JSON and, given a baseline file, "
+        "fails on regressions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--inventory", type=int, default=1000, help="Synthetic inventory rows."
+        )
+        parser.add_argument(
+            "--orders", type=int, default=2000, help="Synthetic order rows."
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--requests", type=int, default=50, help="Timed requests per route."
+        )
+        parser.add_argument(
+            "--warmup", type=int, default=5, help="Untimed requests per route."
+        )
+        parser.add_argument(
+            "--route", action="append", help="Only run routes containing this."
+        )
+        parser.add_argument("--output", help="Write the results to this JSON file.")
+        parser.add_argument("--baseline", help="Compare against this results file.")
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.25,
+            help="Allowed relative p50 slowdown before a route counts as regressed.",
+        )
+        parser.add_argument(
+            "--min-delta",
+            type=float,
+            default=1.0,
+            help="Ignore p50 slowdowns smaller than this many milliseconds.",
+        )
+        parser.add_argument(
+            "--response-cache",
+            action="store_true",
+            help="Turn the response cache on; by default every request is a miss.",
+        )
+        parser.add_argument(
+            "--keepdb", action="store_true", help="Reuse an existing test database."
+        )
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_config = setup_databases(
+            verbosity=0,
+            interactive=False,
+            keepdb=options["keepdb"],
+            aliases={"default"},
+        )
+        try:
+            if not Inventory.objects.exists():
+                call_command(
+                    "seed",
+                    inventory=options["inventory"],
+                    orders=options["orders"],
+                    seed=options["seed"],
+                    stdout=self.stdout,
+                )
+            for cache in caches.all():
+                cache.clear()
+            lookup_cache.clear()
+
+            # A single process, so the local default cache will do.
+            cache_settings = {
+                "RESPONSE_CACHE_ALIAS": (
+                    (settings.RESPONSE_CACHE_ALIAS or "default")
+                    if options["response_cache"]
+                    else None
+                )
+            }
+            # Expected 4xx responses would otherwise log a warning each.
+            request_logger = logging.getLogger("django.request")
+            level = request_logger.level
+            request_logger.setLevel(logging.ERROR)
+            try:
+                with override_settings(**cache_settings):
+                    results = self.run(options)
+            finally:
+                request_logger.setLevel(level)
+        finally:
+            teardown_databases(old_config, verbosity=0, keepdb=options["keepdb"])
+            teardown_test_environment()
+
+        report = {
+            "environment": {
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "inventory": options["inventory"],
+                "orders": options["orders"],
+                "seed": options["seed"],
+                "requests": options["requests"],
+                "response_cache": options["response_cache"],
+            },
+            "results": results,
+        }
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(report, f, indent=2, sort_keys=True)
+            self.stdout.write(f"Results written to {options['output']}.")
+
+        if options["baseline"]:
+            with open(options["baseline"]) as f:
+                baseline = json.load(f)
+            regressions = self.compare(
+                baseline["results"],
+                results,
+                options["tolerance"],
+                options["min_delta"],
+            )
+            if regressions:
+                raise CommandError(
+                    f"{len(regressions)} regressed: {', '.join(regressions)}."
+                )
+            self.stdout.write("No regressions against the baseline.")
+
+    def run(self, options) -> dict:
+        self.client = Client(HTTP_ACCEPT="application/json")
+        self.names = count()
+        cases = self.get_cases()
+
+        missing = self.get_route_names() - {case["route"] for case in cases}
+        if missing:
+            self.stderr.write(
+                f"Routes without a benchmark: {', '.join(sorted(missing))}"
+            )
+
+        results = {}
+        for case in cases:
+            key = f"{case['method'].upper()} {case['route']}"
+            if "label" in case:
+                key = f"{key} ({case['label']})"
+            if options["route"] and not any(part in key for part in options["route"]):
+                continue
+            results[key] = result = self.measure(
+                case, options["requests"], options["warmup"]
+            )
+            self.stdout.write(
+                f"{key:<40} {result['throughput']:>8.0f} req/s "
+                f"p50 {result['p50_ms']:>7.2f} ms p99 {result['p99_ms']:>7.2f} ms "
+                f"{result['queries']:>3} queries "
+                f"{result['peak_memory_kb']:>8.0f} KiB "
+                f"status {','.join(map(str, result['status']))}"
+            )
+        return results
+
+    def measure(self, case: dict, requests: int, warmup: int) -> dict:
+        for _ in range(warmup):
+            self.request(case)
+
+        latencies, queries, statuses = [], [], set()
+        elapsed = 0.0
+        for _ in range(requests):
+            prepared = self.prepare(case)
+            with CaptureQueriesContext(connections["default"]) as context:
+                start = time.perf_counter()
+                response = self.send(*prepared)
+                latency = time.perf_counter() - start
+            elapsed += latency
+            latencies.append(latency)
+            queries.append(len(context))
+            statuses.add(response.status_code)
+
+        # Measured separately: tracing allocations slows every request down.
+        prepared = self.prepare(case)
+        tracemalloc.start()
+        try:
+            self.send(*prepared)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        latencies.sort()
+        return {
+            "requests": requests,
+            "throughput": requests / elapsed if elapsed else 0.0,
+            "p50_ms": statistics.median(latencies) * 1000,
+            "p99_ms": latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000,
+            "queries": max(queries),
+            "peak_memory_kb": peak / 1024,
+            "status": sorted(statuses),
+        }
+
+    def request(self, case: dict):
+        return self.send(*self.prepare(case))
+
+    def prepare(self, case: dict) -> tuple:
+        kwargs = case["prepare"]() if "prepare" in case else {}
+        data = case.get("data")
+        if callable(data):
+            data = data()
+        return case["method"], reverse(case["route"], kwargs=kwargs), case, data
+
+    def send(self, method: str, path: str, case: dict, data):
+        if method == "get":
+            response = self.client.get(path, case.get("query", {}))
+        elif method == "delete":
+            response = self.client.delete(path)
+        else:
+            response = getattr(self.client, method)(
+                path, json.dumps(data), content_type="application/json"
+            )
+        if response.streaming:
+            b"".join(response.streaming_content)
+        return response
+
+    def compare(self, baseline: dict, results: dict, tolerance, min_delta) -> list:
+        regressions = []
+        for key, result in results.items():
+            base = baseline.get(key)
+            if base is None:
+                continue
+            delta = result["p50_ms"] - base["p50_ms"]
+            slower = delta > min_delta and delta > base["p50_ms"] * tolerance
+            more_queries = result["queries"] > base["queries"]
+            # Timings of a different outcome, e.g. a 400 instead of a 201, are
+            # not comparable.
+            status_changed = result["status"] != base["status"]
+            regressed = slower or more_queries or status_changed
+            if regressed:
+                regressions.append(key)
+            self.stdout.write(
+                f"{key:<40} p50 {base['p50_ms']:>7.2f} -> {result['p50_ms']:>7.2f} ms "
+                f"queries {base['queries']:>3} -> {result['queries']:>3} "
+                f"status {','.join(map(str, base['status']))} -> "
+                f"{','.join(map(str, result['status']))}"
+                + ("  REGRESSED" if regressed else "")
+            )
+        return regressions
+
+    def get_route_names(self) -> set[str]:
+        names = set()
+        for pattern in get_resolver().url_patterns:
+            if isinstance(pattern, URLResolver) and pattern.urlconf_name in (
+                "interview.inventory.urls",
+                "interview.order.urls",
+            ):
+                names.update(
+                    p.name for p in pattern.url_patterns if isinstance(p, URLPattern)
+                )
+        return names
+
+    def get_cases(self) -> list[dict]:
+        inventory = Inventory.objects.order_by("id").first()
+        order = Order.objects.order_by("id").first()
+        inventory_tag = InventoryTag.objects.order_by("id").first()
+        order_tag = OrderTag.objects.order_by("id").first()
+        language = InventoryLanguage.objects.order_by("id").first()
+        inventory_type = InventoryType.objects.order_by("id").first()
+        today = date.today()
+        inventory_id = {"id": inventory.id}
+
+        return [
+            {"route": "inventory-list", "method": "get"},
+            {
+                "route": "inventory-list",
+                "method": "get",
+                "label": "page",
+                "query": {"page_size": 50},
+            },
+            # The nested serializers reject these payloads, so the list POST
+            # cases time the validation path; creates are timed through bulk.
+            {
+                "route": "inventory-list",
+                "method": "post",
+                "label": "validation",
+                "data": lambda: {
+                    "name": self.get_name(),
+                    "type": {"name": inventory_type.name},
+                    "language": {"name": language.name},
+                    "tags": [],
+                    "metadata": METADATA,
+                },
+            },
+            {
+                "route": "inventory-detail",
+                "method": "get",
+                "prepare": lambda: inventory_id,
+            },
+            {
+                "route": "inventory-detail",
+                "method": "patch",
+                "prepare": lambda: inventory_id,
+                "data": lambda: {"name": self.get_name()},
+            },
+            {
+                "route": "inventory-detail",
+                "method": "delete",
+                "prepare": lambda: {"id": self.create_inventory().id},
+            },
+            {
+                "route": "inventory-bulk",
+                "method": "post",
+                "data": lambda: [
+                    {
+                        "name": self.get_name(),
+                        "type": inventory_type.name,
+                        "language": language.name,
+                        "tags": [inventory_tag.name],
+                        "metadata": METADATA,
+                    }
+                    for _ in range(10)
+                ],
+            },
+            {
+                "route": "inventory-changes",
+                "method": "get",
+                "query": {"updated_since": (today - timedelta(days=1)).isoformat()},
+            },
+            {"route": "inventory-export", "method": "get"},
+            {"route": "inventory-search", "method": "get", "query": {"q": "dark"}},
+            {"route": "inventory-async-list", "method": "get"},
+            {
+                "route": "inventory-async-detail",
+                "method": "get",
+                "prepare": lambda: inventory_id,
+            },
+            {
+                "route": "inventory-tag-inventory",
+                "method": "get",
+                "prepare": lambda: {"id": inventory_tag.id},
+            },
+            {
+                "route": "inventory-tags",
+                "method": "get",
+                "prepare": lambda: inventory_id,
+            },
+            {
+                "route": "inventory-tagged",
+                "method": "get",
+                "query": {"tags": inventory_tag.name},
+            },
+            {
+                "route": "inventory-tags-active",
+                "method": "post",
+                "data": {"is_active": True, "ids": [inventory_tag.id]},
+            },
+            *self.get_lookup_cases("inventory-tags", InventoryTag),
+            *self.get_lookup_cases("inventory-languages", InventoryLanguage),
+            *self.get_lookup_cases("inventory-types", InventoryType),
+            {"route": "order-list", "method": "get"},
+            {
+                "route": "order-list",
+                "method": "get",
+                "label": "page",
+                "query": {"page_size": 50},
+            },
+            {
+                "route": "order-list",
+                "method": "post",
+                "label": "validation",
+                "data": {
+                    "inventory": inventory.id,
+                    "start_date": today.isoformat(),
+                    "embargo_date": (today + timedelta(days=30)).isoformat(),
+                    "tags": [],
+                },
+            },
+            {
+                "route": "order-changes",
+                "method": "get",
+                "query": {"updated_since": (today - timedelta(days=1)).isoformat()},
+            },
+            {
+                "route": "order-date-range",
+                "method": "get",
+                "query": {
+                    "start_date_after": (today - timedelta(days=30)).isoformat(),
+                    "page_size": 50,
+                },
+            },
+            {"route": "order-async-list", "method": "get"},
+            {
+                "route": "order-tag-orders",
+                "method": "get",
+                "prepare": lambda: {"id": order_tag.id},
+            },
+            {
+                "route": "order-tags",
+                "method": "get",
+                "prepare": lambda: {"id": order.id},
+            },
+            {
+                "route": "order-tagged",
+                "method": "get",
+                "query": {"tags": order_tag.name},
+            },
+            {
+                "route": "order-active",
+                "method": "post",
+                "data": {"is_active": True, "ids": [order.id]},
+            },
+            {
+                "route": "order-tags-active",
+                "method": "post",
+                "data": {"is_active": True, "ids": [order_tag.id]},
+            },
+            {"route": "order-detail", "method": "get"},
+            {
+                "route": "order-detail",
+                "method": "post",
+                "data": lambda: {"name": self.get_name()},
+            },
+        ]
+
+    def get_lookup_cases(self, prefix: str, model) -> list[dict]:
+        first = model.objects.order_by("id").first()
+        return [
+            {"route": f"{prefix}-list", "method": "get"},
+            {
+                "route": f"{prefix}-list",
+                "method": "post",
+                "data": lambda: {"name": self.get_name()},
+            },
+            {
+                "route": f"{prefix}-detail",
+                "method": "get",
+                "prepare": lambda: {"id": first.id},
+            },
+            {
+                "route": f"{prefix}-detail",
+                "method": "patch",
+                "prepare": lambda: {"id": first.id},
+                "data": {"name": first.name},
+            },
+            {
+                "route": f"{prefix}-detail",
+                "method": "delete",
+                "prepare": lambda: {
+                    "id": model.objects.create(name=self.get_name()).id
+                },
+            },
+        ]
+
+    def create_inventory(self) -> Inventory:
+        return Inventory.objects.create(
+            name=self.get_name(),
+            type=InventoryType.objects.order_by("id").first(),
+            language=InventoryLanguage.objects.order_by("id").first(),
+            metadata=METADATA,
+        )
+
+    def get_name(self) -> str:
+        return f"Benchmark {next(self.names)}"
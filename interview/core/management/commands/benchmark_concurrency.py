@@ -0,0 +1,202 @@
+import asyncio
+import io
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares a threaded WSGI deployment with ASGI, serving the sync and the "
+        "async view of the same resource to many concurrent, slow clients."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sync-url", default="/inventory/")
+        parser.add_argument("--async-url", default="/inventory/async/")
+        parser.add_argument("--requests", type=int, default=1000)
+        parser.add_argument(
+            "--concurrency", type=int, default=200, help="Concurrent clients."
+        )
+        parser.add_argument(
+            "--threads", type=int, default=8, help="WSGI worker threads."
+        )
+        parser.add_argument(
+            "--client-delay",
+            type=float,
+            default=50,
+            help="Milliseconds each client takes to read its response.",
+        )
+
+    def handle(self, *args, **options):
+        if settings.DATABASES["default"]["CONN_MAX_AGE"] != 0:
+            raise CommandError(
+                "ASGI requests do not reuse persistent connections; run with "
+                "DATABASE_POOL=1 (or DATABASE_CONN_MAX_AGE=0)."
+            )
+
+        delay = options["client_delay"] / 1000
+        runs = [
+            (
+                f"wsgi, {options['threads']} threads, sync view",
+                lambda: self.run_wsgi(
+                    options["sync_url"],
+                    options["requests"],
+                    options["threads"],
+                    delay,
+                ),
+            ),
+            (
+                "asgi, sync view",
+                lambda: self.run_asgi(
+                    options["sync_url"],
+                    options["requests"],
+                    options["concurrency"],
+                    delay,
+                ),
+            ),
+            (
+                "asgi, async view",
+                lambda: self.run_asgi(
+                    options["async_url"],
+                    options["requests"],
+                    options["concurrency"],
+                    delay,
+                ),
+            ),
+        ]
+        for name, run in runs:
+            result = self.measure(run)
+            self.stdout.write(
+                f"{name}: {result['requests']} requests, {result['errors']} errors, "
+                f"{result['throughput']:.0f} req/s, p50 {result['p50_ms']:.1f} ms, "
+                f"p99 {result['p99_ms']:.1f} ms, peak threads {result['threads']}"
+            )
+
+    def measure(self, run) -> dict:
+        peak, done = [threading.active_count()], threading.Event()
+
+        def sample():
+            while not done.wait(0.005):
+                peak[0] = max(peak[0], threading.active_count())
+
+        sampler = threading.Thread(target=sample)
+        sampler.start()
+        start = time.perf_counter()
+        try:
+            latencies, errors = run()
+        finally:
+            done.set()
+            sampler.join()
+        elapsed = time.perf_counter() - start
+
+        latencies.sort()
+        return {
+            "requests": len(latencies),
+            "errors": errors,
+            "throughput": len(latencies) / elapsed,
+            "p50_ms": statistics.median(latencies) * 1000,
+            "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+            # The sampler thread itself is not part of the deployment.
+            "threads": peak[0] - 1,
+        }
+
+    def run_wsgi(self, url, requests, threads, delay):
+        handler = WSGIHandler()
+        parts = urlsplit(url)
+
+        def request(_):
+            start = time.perf_counter()
+            statuses = []
+            response = handler(
+                self.wsgi_environ(parts.path, parts.query),
+                lambda status, headers: statuses.append(status),
+            )
+            try:
+                for _ in response:
+                    # A WSGI worker is blocked while the client reads.
+                    time.sleep(delay)
+            finally:
+                response.close()
+            return time.perf_counter() - start, not statuses[0].startswith("200")
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(request, range(requests)))
+        return [latency for latency, _ in results], sum(e for _, e in results)
+
+    def run_asgi(self, url, requests, concurrency, delay):
+        application = ASGIHandler()
+        parts = urlsplit(url)
+        latencies, errors = [], []
+        remaining = iter(range(requests))
+
+        async def request():
+            start = time.perf_counter()
+            received = asyncio.Queue()
+            await received.put({"type": "http.request", "body": b""})
+            statuses = []
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    statuses.append(message["status"])
+                elif message.get("body"):
+                    await asyncio.sleep(delay)
+
+            await application(
+                self.asgi_scope(parts.path, parts.query), received.get, send
+            )
+            latencies.append(time.perf_counter() - start)
+            errors.append(statuses[0] != 200)
+
+        async def client():
+            for _ in remaining:
+                await request()
+
+        async def main():
+            await asyncio.gather(*(client() for _ in range(concurrency)))
+
+        asyncio.run(main())
+        return latencies, sum(errors)
+
+    def wsgi_environ(self, path: str, query: str) -> dict:
+        return {
+            "REQUEST_METHOD": "GET",
+            "SCRIPT_NAME": "",
+            "PATH_INFO": path,
+            "QUERY_STRING": query,
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "80",
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "HTTP_HOST": "localhost",
+            "HTTP_ACCEPT": "application/json",
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": "http",
+            "wsgi.input": io.BytesIO(),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+
+    def asgi_scope(self, path: str, query: str) -> dict:
+        return {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "headers": [(b"host", b"localhost"), (b"accept", b"application/json")],
+            "server": ("localhost", 80),
+            "client": ("127.0.0.1", 0),
+        }
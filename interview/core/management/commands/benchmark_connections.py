@@ -0,0 +1,157 @@
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+
+# Connection strategies compared by --compare, as environment overrides.
+STRATEGIES = {
+    "connect per request": {"DATABASE_POOL": "0", "DATABASE_CONN_MAX_AGE": "0"},
+    "persistent": {"DATABASE_POOL": "0", "DATABASE_CONN_MAX_AGE": "60"},
+    "pooled": {"DATABASE_POOL": "1", "DATABASE_CONN_MAX_AGE": "0"},
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-tests a URL through the WSGI handler from several threads and "
+        "reports request latency for the configured connection strategy, or "
+        "for each strategy with --compare."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="/inventory/tags/", help="URL to load.")
+        parser.add_argument(
+            "--requests", type=int, default=2000, help="Total requests to send."
+        )
+        parser.add_argument(
+            "--threads", type=int, default=8, help="Concurrent client threads."
+        )
+        parser.add_argument(
+            "--compare",
+            action="store_true",
+            help="Run once per connection strategy in a subprocess.",
+        )
+        parser.add_argument("--json", action="store_true", help="Print JSON only.")
+
+    def handle(self, *args, **options):
+        if options["compare"]:
+            return self.compare(options)
+
+        result = self.run(options["url"], options["requests"], options["threads"])
+        if options["json"]:
+            self.stdout.write(json.dumps(result))
+        else:
+            self.stdout.write(self.format(self.describe(), result))
+
+    def compare(self, options):
+        argv = [
+            sys.executable,
+            sys.argv[0],
+            "benchmark_connections",
+            "--json",
+            f"--url={options['url']}",
+            f"--requests={options['requests']}",
+            f"--threads={options['threads']}",
+        ]
+        for name, overrides in STRATEGIES.items():
+            process = subprocess.run(
+                argv, env={**os.environ, **overrides}, capture_output=True, text=True
+            )
+            if process.returncode:
+                raise CommandError(f"{name} run failed:\n{process.stderr}")
+            result = json.loads(process.stdout.strip().splitlines()[-1])
+            self.stdout.write(self.format(name, result))
+
+    def run(self, url: str, requests: int, threads: int) -> dict:
+        handler = WSGIHandler()
+        parts = urlsplit(url)
+        latencies, errors = [], []
+        lock = threading.Lock()
+        per_thread = [
+            requests // threads + (i < requests % threads) for i in range(threads)
+        ]
+
+        def worker(count):
+            from django.db import connections
+
+            timings, failures = [], 0
+            for _ in range(count):
+                start = time.perf_counter()
+                status = self.request(handler, parts.path, parts.query)
+                timings.append(time.perf_counter() - start)
+                failures += not status.startswith("200")
+            connections.close_all()
+            with lock:
+                latencies.extend(timings)
+                errors.append(failures)
+
+        workers = [threading.Thread(target=worker, args=(n,)) for n in per_thread]
+        start = time.perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        latencies.sort()
+        return {
+            "requests": len(latencies),
+            "errors": sum(errors),
+            "throughput": len(latencies) / elapsed,
+            "mean_ms": statistics.fmean(latencies) * 1000,
+            "p50_ms": latencies[len(latencies) // 2] * 1000,
+            "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        }
+
+    def request(self, handler, path: str, query: str) -> str:
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "SCRIPT_NAME": "",
+            "PATH_INFO": path,
+            "QUERY_STRING": query,
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "80",
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "HTTP_HOST": "localhost",
+            "HTTP_ACCEPT": "application/json",
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": "http",
+            "wsgi.input": io.BytesIO(),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        statuses = []
+        response = handler(environ, lambda status, headers: statuses.append(status))
+        try:
+            for _ in response:
+                pass
+        finally:
+            # Closing the response fires request_finished, which is where
+            # Django closes or keeps the connection.
+            response.close()
+        return statuses[0]
+
+    def describe(self) -> str:
+        database = settings.DATABASES["default"]
+        return (
+            f"{database['ENGINE'].rsplit('.', 1)[-1]}, "
+            f"CONN_MAX_AGE={database['CONN_MAX_AGE']}"
+        )
+
+    def format(self, name: str, result: dict) -> str:
+        return (
+            f"{name}: {result['requests']} requests, {result['errors']} errors, "
+            f"{result['throughput']:.0f} req/s, mean {result['mean_ms']:.2f} ms, "
+            f"p50 {result['p50_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms"
+        )
@@ -0,0 +1,63 @@
+import time
+from decimal import Decimal
+from itertools import cycle, islice
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from interview.core.renderers import FastJSONRenderer, orjson
+from interview.inventory.models import Inventory
+from interview.inventory.serializers import InventorySerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares JSONRenderer and FastJSONRenderer render times on an inventory "
+        "list, and fails if their output differs."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--items", type=int, default=10000, help="Items in the rendered list."
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per renderer.")
+
+    def handle(self, *args, **options):
+        queryset = InventorySerializer.setup_eager_loading(Inventory.objects.all())
+        items = InventorySerializer(queryset[: options["items"]], many=True).data
+        if not items:
+            raise CommandError("No inventory to render; run manage.py seed first.")
+
+        # Inventory write responses carry the validated metadata with Decimal
+        # ratings, so render that shape here. Items repeat to reach --items.
+        data = [
+            dict(item, metadata=self.with_decimal_rating(item["metadata"]))
+            for item in islice(cycle(items), options["items"])
+        ]
+
+        results = {}
+        for renderer in (JSONRenderer(), FastJSONRenderer()):
+            best = None
+            for _ in range(options["repeat"]):
+                start = time.perf_counter()
+                content = renderer.render(data)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            results[type(renderer).__name__] = (best, content)
+
+        backend = "orjson" if orjson else "stdlib"
+        (base, base_content), (fast, fast_content) = results.values()
+        self.stdout.write(
+            f"{len(data)} items, {len(base_content)} bytes: "
+            f"JSONRenderer {base * 1000:.1f} ms, "
+            f"FastJSONRenderer ({backend}) {fast * 1000:.1f} ms "
+            f"({base / fast:.1f}x)"
+        )
+        if base_content != fast_content:
+            raise CommandError("Rendered JSON differs.")
+        self.stdout.write("Rendered JSON is identical.")
+
+    def with_decimal_rating(self, metadata: dict) -> dict:
+        if "imdb_rating" not in metadata:
+            return metadata
+        return dict(metadata, imdb_rating=Decimal(str(metadata["imdb_rating"])))
@@ -0,0 +1,76 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from interview.inventory.models import Inventory
+from interview.inventory.serializers import (
+    InventoryFastSerializer,
+    InventorySerializer,
+)
+from interview.order.models import Order
+from interview.order.serializers import OrderFastSerializer, OrderSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures rows/second of the DRF and fast serializers for inventory and "
+        "orders, and fails if the two render different JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit", type=int, default=10000, help="Rows serialized per run."
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="Runs per serializer."
+        )
+
+    def handle(self, *args, **options):
+        self.renderer = JSONRenderer()
+        cases = [
+            ("inventory", Inventory, InventorySerializer, InventoryFastSerializer),
+            ("orders", Order, OrderSerializer, OrderFastSerializer),
+        ]
+
+        mismatches = []
+        for name, model, serializer_class, fast_serializer_class in cases:
+            queryset = model.objects.order_by("id")
+            serializer = serializer_class()
+            drf_queryset = serializer.setup_queryset(queryset)[: options["limit"]]
+            fast_queryset = fast_serializer_class.setup_queryset(queryset)[
+                : options["limit"]
+            ]
+
+            rows, drf_time, drf_content = self.measure(
+                lambda: serializer_class(drf_queryset, many=True), options["repeat"]
+            )
+            _, fast_time, fast_content = self.measure(
+                lambda: fast_serializer_class(fast_queryset), options["repeat"]
+            )
+
+            self.stdout.write(
+                f"{name}: {rows} rows, "
+                f"drf {self.rate(rows, drf_time)} rows/s, "
+                f"fast {self.rate(rows, fast_time)} rows/s "
+                f"({drf_time / fast_time if fast_time else 0:.1f}x)"
+            )
+            if drf_content != fast_content:
+                mismatches.append(name)
+
+        if mismatches:
+            raise CommandError(f"Rendered JSON differs for: {', '.join(mismatches)}.")
+        self.stdout.write("Rendered JSON is identical.")
+
+    def measure(self, get_serializer, repeat: int) -> tuple[int, float, bytes]:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            data = get_serializer().data
+            content = self.renderer.render(data)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return len(data), best, content
+
+    def rate(self, rows: int, elapsed: float) -> str:
+        return f"{rows / elapsed:,.0f}" if elapsed else "-"
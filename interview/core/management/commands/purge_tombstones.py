@@ -0,0 +1,19 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from interview.core.models import Tombstone
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes the tombstones of rows deleted more than CHANGE_FEED_RETENTION_DAYS "
+        "ago, which change feeds no longer serve. Run it periodically."
+    )
+
+    def handle(self, *args, **options):
+        before = timezone.now() - timedelta(days=settings.CHANGE_FEED_RETENTION_DAYS)
+        deleted = Tombstone.purge(before)
+        self.stdout.write(f"Deleted {deleted} tombstones older than {before}.")
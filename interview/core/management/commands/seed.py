@@ -0,0 +1,316 @@
+import csv
+import io
+import json
+import random
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from interview.core import fixtures
+from interview.inventory.models import (
+    Inventory,
+    InventoryLanguage,
+    InventoryTag,
+    InventoryType,
+)
+from interview.inventory.signals import invalidate_inventory_responses
+from interview.order import read_model
+from interview.order.models import Order, OrderTag
+
+TITLE_WORDS = [
+    "Dark",
+    "Silent",
+    "Last",
+    "Golden",
+    "Broken",
+    "Hidden",
+    "Lost",
+    "Electric",
+    "Midnight",
+    "Crimson",
+    "River",
+    "Empire",
+    "Garden",
+    "Signal",
+    "Harbor",
+    "Winter",
+    "Machine",
+    "Kingdom",
+    "Shadow",
+    "Horizon",
+]
+FIRST_NAMES = ["Ana", "Ben", "Chloe", "Dev", "Elena", "Femi", "Grace", "Hiro", "Ines"]
+LAST_NAMES = ["Adams", "Baker", "Chen", "Diaz", "Evans", "Fischer", "Garcia", "Ito"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds the fixture data set and, optionally, a synthetic catalogue of "
+        "inventory and orders for load testing."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--inventory",
+            type=int,
+            default=0,
+            help="Number of synthetic inventory items to generate.",
+        )
+        parser.add_argument(
+            "--orders",
+            type=int,
+            default=0,
+            help="Number of synthetic orders to generate.",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Seed for the random generator."
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=730,
+            help="Spread created_at and updated_at over this many days before now.",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=10000, help="Rows written per batch."
+        )
+        parser.add_argument(
+            "--no-fixtures", action="store_true", help="Skip the fixture data set."
+        )
+        parser.add_argument(
+            "--no-copy",
+            action="store_true",
+            help="Use bulk_create instead of COPY on PostgreSQL.",
+        )
+
+    def handle(self, *args, **options):
+        self.random = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.span = timedelta(days=options["days"]).total_seconds()
+        self.use_copy = connection.vendor == "postgresql" and not options["no_copy"]
+        self.now = timezone.now()
+
+        self.seed_lookups()
+        if not options["no_fixtures"]:
+            self.seed_fixtures()
+        if options["inventory"]:
+            self.seed_inventory(options["inventory"])
+        if options["orders"]:
+            self.seed_orders(options["orders"])
+        # Rows are written with COPY and bulk_create, which send no signals.
+        invalidate_inventory_responses()
+        read_model.rebuild()
+
+    def seed_lookups(self):
+        self.language_ids = self.seed_names(
+            InventoryLanguage, fixtures.ISO_LANGUAGES.values()
+        )
+        self.inventory_tag_ids = self.seed_names(InventoryTag, fixtures.INVENTORY_TAGS)
+        self.type_ids = self.seed_names(InventoryType, fixtures.INVENTORY_TYPES)
+        self.order_tag_ids = self.seed_names(OrderTag, fixtures.ORDER_TAGS)
+
+    def seed_names(self, model, names) -> dict[str, int]:
+        model.objects.bulk_create(
+            [model(name=name) for name in names], ignore_conflicts=True
+        )
+        return dict(model.objects.values_list("name", "id"))
+
+    def seed_fixtures(self):
+        names = [item["name"] for item in fixtures.INVENTORY_ITEMS]
+        if Inventory.objects.filter(name__in=names).exists():
+            self.stdout.write("Fixture data already present, skipping.")
+            return
+
+        with transaction.atomic():
+            inventory_ids = self.insert(
+                Inventory,
+                [
+                    self.timestamped(
+                        name=item["name"],
+                        type_id=self.type_ids[item["type"]],
+                        language_id=self.language_ids[item["language"]],
+                        metadata=item["metadata"],
+                    )
+                    for item in fixtures.INVENTORY_ITEMS
+                ],
+            )
+            self.link(
+                Inventory.tags,
+                [
+                    (inventory_id, self.inventory_tag_ids[tag])
+                    for inventory_id, item in zip(
+                        inventory_ids, fixtures.INVENTORY_ITEMS
+                    )
+                    for tag in item["tags"]
+                ],
+            )
+            Inventory.objects.filter(id__in=inventory_ids).update_search_vector()
+
+            inventory_by_name = dict(zip(names, inventory_ids))
+            today = self.now.date()
+            order_ids = self.insert(
+                Order,
+                [
+                    self.timestamped(
+                        inventory_id=inventory_by_name[order["inventory"]],
+                        start_date=today + timedelta(days=order["start_date"]),
+                        embargo_date=today + timedelta(days=order["embargo_date"]),
+                        is_active=order.get("is_active", True),
+                    )
+                    for order in fixtures.ORDERS
+                ],
+            )
+            self.link(
+                Order.tags,
+                [
+                    (order_id, self.order_tag_ids[tag])
+                    for order_id, order in zip(order_ids, fixtures.ORDERS)
+                    for tag in order["tags"]
+                ],
+            )
+
+        self.stdout.write(
+            f"Fixture data: {len(inventory_ids)} inventory, {len(order_ids)} orders."
+        )
+
+    def seed_inventory(self, count: int):
+        type_ids = list(self.type_ids.values())
+        language_ids = list(self.language_ids.values())
+        tag_ids = list(self.inventory_tag_ids.values())
+        actors = [f"{first} {last}" for first in FIRST_NAMES for last in LAST_NAMES]
+
+        for start in range(0, count, self.batch_size):
+            size = min(self.batch_size, count - start)
+            rows = [
+                self.timestamped(
+                    name=" ".join(
+                        [*self.random.sample(TITLE_WORDS, k=2), str(start + i + 1)]
+                    ),
+                    type_id=self.random.choice(type_ids),
+                    language_id=self.random.choice(language_ids),
+                    metadata=dict(
+                        year=self.random.randint(1950, self.now.year),
+                        actors=self.random.sample(actors, k=3),
+                        imdb_rating=round(self.random.uniform(1, 10), 1),
+                        rotten_tomatoes_rating=self.random.randint(0, 100),
+                    ),
+                )
+                for i in range(size)
+            ]
+            with transaction.atomic():
+                inventory_ids = self.insert(Inventory, rows)
+                Inventory.objects.filter(id__in=inventory_ids).update_search_vector()
+                self.link(
+                    Inventory.tags,
+                    [
+                        (inventory_id, tag_id)
+                        for inventory_id in inventory_ids
+                        for tag_id in self.random.sample(
+                            tag_ids, k=self.random.randint(1, 3)
+                        )
+                    ],
+                )
+            self.report("Inventory", start + size, count)
+
+    def seed_orders(self, count: int):
+        inventory_ids = list(Inventory.objects.values_list("id", flat=True))
+        tag_ids = list(self.order_tag_ids.values())
+        today = self.now.date()
+
+        for start in range(0, count, self.batch_size):
+            size = min(self.batch_size, count - start)
+            rows = []
+            for _ in range(size):
+                start_date = today + timedelta(days=self.random.randint(-365, 365))
+                rows.append(
+                    self.timestamped(
+                        inventory_id=self.random.choice(inventory_ids),
+                        start_date=start_date,
+                        embargo_date=start_date
+                        + timedelta(days=self.random.randint(0, 90)),
+                        is_active=self.random.random() < 0.9,
+                    )
+                )
+            with transaction.atomic():
+                order_ids = self.insert(Order, rows)
+                self.link(
+                    Order.tags,
+                    [
+                        (order_id, tag_id)
+                        for order_id in order_ids
+                        for tag_id in self.random.sample(
+                            tag_ids, k=self.random.randint(1, 4)
+                        )
+                    ],
+                )
+            self.report("Orders", start + size, count)
+
+    def timestamped(self, **row) -> dict:
+        # Distinct, reproducible timestamps, so that keyset pagination, date
+        # ranges and change feeds see realistic data rather than one tie. About
+        # a third of the rows were updated after they were created.
+        age = self.random.uniform(0, self.span)
+        created_at = self.now - timedelta(seconds=age)
+        updated_at = created_at
+        if self.random.random() < 0.3:
+            updated_at += timedelta(seconds=self.random.uniform(0, age))
+        return dict(row, created_at=created_at, updated_at=updated_at)
+
+    def insert(self, model, rows: list[dict]) -> list[int]:
+        if not self.use_copy:
+            objects = model.objects.bulk_create(
+                [model(**row) for row in rows], batch_size=self.batch_size
+            )
+            return [obj.pk for obj in objects]
+
+        ids = self.allocate_ids(model, len(rows))
+        self.copy(
+            model._meta.db_table,
+            ["id", *rows[0]],
+            ([pk, *row.values()] for pk, row in zip(ids, rows)),
+        )
+        return ids
+
+    def link(self, descriptor, pairs: list[tuple[int, int]]):
+        through = descriptor.through
+        field = descriptor.field
+        columns = [field.m2m_column_name(), field.m2m_reverse_name()]
+        if self.use_copy:
+            self.copy(through._meta.db_table, columns, pairs)
+        else:
+            through.objects.bulk_create(
+                [through(**dict(zip(columns, pair))) for pair in pairs],
+                batch_size=self.batch_size,
+            )
+
+    def allocate_ids(self, model, count: int) -> list[int]:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, 'id')) "
+                "FROM generate_series(1, %s)",
+                [model._meta.db_table, count],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def copy(self, table: str, columns: list[str], rows):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow(
+                json.dumps(value) if isinstance(value, (dict, list)) else value
+                for value in row
+            )
+        buffer.seek(0)
+
+        quote_name = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {quote_name(table)} ({', '.join(map(quote_name, columns))}) "
+                "FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+
+    def report(self, label: str, done: int, total: int):
+        self.stdout.write(f"{label}: {done}/{total} ({done * 100 // total}%)")
@@ -0,0 +1,283 @@
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+
+from django.conf import settings
+
+from interview.core.cache import response_cache
+from interview.core.db.backends.postgresql_pool.pool import get_pool_stats
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# name: (type, help)
+METRICS = {
+    "http_requests_total": ("counter", "HTTP requests by view, method and status."),
+    "http_request_duration_seconds": (
+        "histogram",
+        "HTTP request latency by view and method.",
+    ),
+    "db_queries_total": ("counter", "SQL statements executed, by view."),
+    "db_query_duration_seconds_total": ("counter", "Time spent in SQL, by view."),
+    "response_cache_requests_total": (
+        "counter",
+        "Response cache lookups by namespace and result.",
+    ),
+    "db_pool_events_total": ("counter", "Connection pool events by alias."),
+    "db_pool_connections": ("gauge", "Pooled connections by alias and state."),
+}
+
+
+class Metrics:
+    """
+    In-process counters and histograms. Every thread updates its own shard
+    without locking and collect() sums the shards; shards of finished threads
+    are folded into a retired total. When METRICS_DIR is set, each process also
+    writes its totals to METRICS_DIR/<pid>.json at most every
+    METRICS_FLUSH_INTERVAL seconds, and collect() sums those files, so any
+    gunicorn worker can answer a scrape for all of them.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards = []
+        self._retired = self.new_shard()
+        self._flush_lock = threading.Lock()
+        self._flushed = 0.0
+
+    def new_shard(self) -> dict:
+        return new_totals()
+
+    def get_shard(self) -> dict:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = self.new_shard()
+            with self._lock:
+                self.retire_shards()
+                self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def inc(self, name: str, labels: tuple, value: float = 1):
+        self.get_shard()["counters"][(name, labels)] += value
+
+    def observe(self, name: str, labels: tuple, value: float):
+        histograms = self.get_shard()["histograms"]
+        histogram = histograms.get((name, labels))
+        if histogram is None:
+            # Bucket counts, the +Inf count, then the sum.
+            histogram = histograms[(name, labels)] = [0] * (len(DURATION_BUCKETS) + 2)
+        histogram[bisect_left(DURATION_BUCKETS, value)] += 1
+        histogram[-1] += value
+
+    def retire_shards(self):
+        # Called with self._lock held. Thread-per-request servers would
+        # otherwise grow the shard list without bound.
+        alive = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                alive.append((thread, shard))
+            else:
+                merge(self._retired, shard)
+        self._shards = alive
+
+    def collect_local(self) -> dict:
+        totals = self.new_shard()
+        with self._lock:
+            self.retire_shards()
+            merge(totals, self._retired)
+            for _, shard in self._shards:
+                merge(totals, shard)
+        add_process_stats(totals)
+        return totals
+
+    def collect(self) -> dict:
+        """
+        This process's totals or, with METRICS_DIR, the sum of every process's
+        file, this process's own flushed first. Summing files only, rather than
+        live totals plus older files, keeps counters from going backwards when
+        consecutive scrapes reach different workers. Files of exited processes
+        are folded into retired.json, without their gauges, and removed.
+        """
+        directory = settings.METRICS_DIR
+        if not directory:
+            return self.collect_local()
+
+        import fcntl
+
+        self.flush()
+        totals = new_totals()
+        with open(os.path.join(directory, ".lock"), "a") as lock:
+            # Only one process at a time may move files into retired.json.
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            retired_path = os.path.join(directory, "retired.json")
+            retired = read_snapshot(retired_path) or new_totals()
+            exited = []
+            for filename in os.listdir(directory):
+                pid, extension = os.path.splitext(filename)
+                if extension != ".json" or not pid.isdigit():
+                    continue
+                path = os.path.join(directory, filename)
+                snapshot = read_snapshot(path)
+                if snapshot is None:
+                    continue
+                if is_running(int(pid)):
+                    merge(totals, snapshot)
+                else:
+                    snapshot["gauges"].clear()
+                    merge(retired, snapshot)
+                    exited.append(path)
+            if exited:
+                write_snapshot(retired_path, retired)
+                for path in exited:
+                    os.remove(path)
+            merge(totals, retired)
+        return totals
+
+    def maybe_flush(self):
+        if (
+            settings.METRICS_DIR
+            and time.monotonic() - self._flushed >= settings.METRICS_FLUSH_INTERVAL
+        ):
+            self.flush(blocking=False)
+
+    def flush(self, blocking: bool = True):
+        if not self._flush_lock.acquire(blocking=blocking):
+            return
+        try:
+            self._flushed = time.monotonic()
+            path = os.path.join(settings.METRICS_DIR, f"{os.getpid()}.json")
+            write_snapshot(path, self.collect_local())
+        finally:
+            self._flush_lock.release()
+
+
+def new_totals() -> dict:
+    return {
+        "counters": defaultdict(float),
+        "histograms": {},
+        "gauges": defaultdict(float),
+    }
+
+
+def add_process_stats(totals: dict):
+    """
+    Adds the response cache and connection pool statistics this process keeps
+    on its own. Pool gauges are labelled with the pid, as they do not add up.
+    """
+    counters, gauges = totals["counters"], totals["gauges"]
+    for namespace, stats in response_cache.stats().items():
+        for result in ("hits", "misses"):
+            labels = (("namespace", namespace), ("result", result))
+            counters[("response_cache_requests_total", labels)] += stats[result]
+
+    pid = str(os.getpid())
+    for alias, stats in get_pool_stats().items():
+        for event in ("created", "reused", "waits", "timeouts"):
+            labels = (("alias", alias), ("event", event))
+            counters[("db_pool_events_total", labels)] += stats.get(event, 0)
+        for state in ("open", "idle", "in_use", "max_size"):
+            labels = (("alias", alias), ("pid", pid), ("state", state))
+            gauges[("db_pool_connections", labels)] = stats[state]
+
+
+def merge(totals: dict, shard: dict):
+    # dict() copies are atomic under the GIL, so a shard can be read while its
+    # thread keeps writing to it.
+    for kind in ("counters", "gauges"):
+        for key, value in dict(shard[kind]).items():
+            totals[kind][key] += value
+    for key, histogram in dict(shard["histograms"]).items():
+        target = totals["histograms"].setdefault(key, [0] * len(histogram))
+        for index, value in enumerate(list(histogram)):
+            target[index] += value
+
+
+def dump_snapshot(totals: dict) -> dict:
+    return {
+        kind: [[name, list(labels), value] for (name, labels), value in values.items()]
+        for kind, values in totals.items()
+    }
+
+
+def load_snapshot(snapshot: dict) -> dict:
+    totals = new_totals()
+    for kind, values in snapshot.items():
+        for name, labels, value in values:
+            totals[kind][(name, tuple(map(tuple, labels)))] = value
+    return totals
+
+
+def read_snapshot(path: str) -> dict | None:
+    try:
+        with open(path) as f:
+            return load_snapshot(json.load(f))
+    except (OSError, ValueError):
+        return None
+
+
+def write_snapshot(path: str, totals: dict):
+    # Readers never see a partly written file.
+    with open(f"{path}.tmp", "w") as f:
+        json.dump(dump_snapshot(totals), f)
+    os.replace(f"{path}.tmp", path)
+
+
+def is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def format_labels(labels: tuple, **extra) -> str:
+    pairs = [*labels, *extra.items()]
+    if not pairs:
+        return ""
+    escaped = (
+        (key, str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n"))
+        for key, value in pairs
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+def format_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render_exposition(totals: dict) -> str:
+    """
+    Renders counters, histograms and gauges in the Prometheus text format.
+    """
+    samples = defaultdict(list)
+    for (name, labels), value in sorted(totals["counters"].items()):
+        samples[name].append(f"{name}{format_labels(labels)} {format_number(value)}")
+    for (name, labels), histogram in sorted(totals["histograms"].items()):
+        cumulative = 0
+        bounds = [*map(str, DURATION_BUCKETS), "+Inf"]
+        for bound, count in zip(bounds, histogram[:-1]):
+            cumulative += count
+            samples[name].append(
+                f"{name}_bucket{format_labels(labels, le=bound)} {cumulative}"
+            )
+        samples[name].append(
+            f"{name}_sum{format_labels(labels)} {format_number(histogram[-1])}"
+        )
+        samples[name].append(f"{name}_count{format_labels(labels)} {cumulative}")
+    for (name, labels), value in sorted(totals["gauges"].items()):
+        samples[name].append(f"{name}{format_labels(labels)} {format_number(value)}")
+
+    lines = []
+    for name, (kind, description) in METRICS.items():
+        if name in samples:
+            lines += [f"# HELP {name} {description}", f"# TYPE {name} {kind}"]
+            lines += samples[name]
+    return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
@@ -0,0 +1,180 @@
+import asyncio
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.utils.deprecation import MiddlewareMixin
+
+from interview.core.instrumentation import (
+    NPlusOneError,
+    RequestProfile,
+    endpoint_stats,
+    logger,
+)
+from interview.core.metrics import metrics
+from interview.core.routers import pin_primary
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class ReplicaRoutingMiddleware(MiddlewareMixin):
+    """
+    Pins a request to the primary database when it writes, and, through a
+    short-lived cookie, for REPLICA_PIN_SECONDS after a write by the same client
+    so that it reads its own writes despite replication lag.
+    """
+
+    cookie_name = "primary_pin"
+
+    def process_request(self, request):
+        pin_primary(
+            request.method not in SAFE_METHODS or self.cookie_name in request.COOKIES
+        )
+
+    def process_response(self, request, response):
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            response.set_cookie(
+                self.cookie_name,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        pin_primary(False)
+        return response
+
+
+class InstrumentationMiddleware:
+    """
+    Profiles each request's query count, database, serializer and render time,
+    reports them in a Server-Timing header and aggregates them per endpoint
+    (see RequestStatsView). Requests repeating one statement shape more than
+    INSTRUMENTATION_N_PLUS_ONE_THRESHOLD times are logged as likely N+1s, or
+    fail when INSTRUMENTATION_N_PLUS_ONE_RAISE is set, e.g. in tests. Only
+    installed when INSTRUMENTATION is on.
+    """
+
+    def __init__(self, get_response):
+        if not settings.INSTRUMENTATION:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        profile = RequestProfile()
+        with profile.activate():
+            response = self.get_response(request)
+
+        match = request.resolver_match
+        endpoint = f"{request.method} /{match.route}" if match else "unmatched"
+        repeated = profile.get_repeated_queries(
+            settings.INSTRUMENTATION_N_PLUS_ONE_THRESHOLD
+        )
+        endpoint_stats.record(endpoint, profile, bool(repeated))
+        response["Server-Timing"] = profile.get_server_timing()
+
+        if repeated:
+            message = f"Possible N+1 queries in {endpoint}: " + "; ".join(
+                f"{count} x {shape}" for shape, count in repeated.items()
+            )
+            if settings.INSTRUMENTATION_N_PLUS_ONE_RAISE:
+                raise NPlusOneError(message)
+            logger.warning(message)
+
+        return response
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+
+
+# The request's QueryCounter. A context variable follows the request into the
+# sync_to_async() threads that run an async view's queries, where wrappers
+# installed on the request thread's connections would never see them.
+request_queries = ContextVar("request_queries", default=None)
+
+
+def count_queries(execute, sql, params, many, context):
+    queries = request_queries.get()
+    if queries is None:
+        return execute(sql, params, many, context)
+    return queries(execute, sql, params, many, context)
+
+
+def install_query_counter(connection, **kwargs):
+    if count_queries not in connection.execute_wrappers:
+        # In front, so that execute_wrapper() blocks still pop their own wrapper.
+        connection.execute_wrappers.insert(0, count_queries)
+
+
+class MetricsMiddleware:
+    """
+    Counts requests by URL name, method and status, and records their latency
+    and SQL statements, for the /metrics endpoint. Runs natively under both
+    WSGI and ASGI. Installed unless METRICS is turned off.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.METRICS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            # Lets Django call this middleware without a thread hop.
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+        connection_created.connect(install_query_counter)
+        for alias in connections:
+            install_query_counter(connections[alias])
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        queries = QueryCounter()
+        token = request_queries.set(queries)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            request_queries.reset(token)
+        self.record(request, response, time.perf_counter() - start, queries)
+        return response
+
+    async def __acall__(self, request):
+        queries = QueryCounter()
+        token = request_queries.set(queries)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            request_queries.reset(token)
+        self.record(request, response, time.perf_counter() - start, queries)
+        return response
+
+    def record(self, request, response, duration, queries):
+        match = request.resolver_match
+        view = (match.url_name or match.route) if match else "unmatched"
+        labels = (("method", request.method), ("view", view))
+        metrics.inc(
+            "http_requests_total", (*labels, ("status", str(response.status_code)))
+        )
+        metrics.observe("http_request_duration_seconds", labels, duration)
+        metrics.inc("db_queries_total", (("view", view),), queries.count)
+        metrics.inc(
+            "db_query_duration_seconds_total", (("view", view),), queries.duration
+        )
+        # Writes a small file at most every METRICS_FLUSH_INTERVAL seconds.
+        metrics.maybe_flush()
@@ -0,0 +1,46 @@
+from django.db import models
+
+
+class Tombstone(models.Model):
+    model = models.CharField(max_length=100)
+    object_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["model", "deleted_at", "id"],
+                name="tombstone_model_deleted_id_idx",
+            ),
+            models.Index(fields=["deleted_at"], name="tombstone_deleted_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.model} {self.object_id}"
+
+    @classmethod
+    def record(cls, instance):
+        return cls.objects.create(
+            model=instance._meta.label_lower, object_id=instance.pk
+        )
+
+    @classmethod
+    def deleted_since(cls, model, timestamp):
+        return cls.objects.filter(
+            model=model._meta.label_lower, deleted_at__gte=timestamp
+        )
+
+    @classmethod
+    def purge(cls, before, batch_size: int = 10000) -> int:
+        """
+        Deletes tombstones recorded before the given time, a batch per
+        statement, and returns how many were deleted.
+        """
+        deleted = 0
+        while ids := list(
+            cls.objects.filter(deleted_at__lt=before).values_list("id", flat=True)[
+                :batch_size
+            ]
+        ):
+            deleted += cls.objects.filter(id__in=ids).delete()[0]
+        return deleted
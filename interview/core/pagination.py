@@ -0,0 +1,190 @@
+from base64 import b64decode, b64encode
+from urllib import parse
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset pagination over a unique, indexed ordering such as (created_at, id).
+
+    Pages are located with a WHERE clause on the ordering columns instead of an
+    OFFSET, so every page costs the same regardless of how deep it is. The mode
+    is opt-in: it only applies when the request carries a cursor or page size.
+    """
+
+    ordering = ("created_at", "id")
+    page_size = 50
+    max_page_size = 1000
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self.get_page_queryset(queryset, request)
+        if queryset is None:
+            return None
+        return self.set_page(list(queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        queryset = self.get_page_queryset(queryset, request)
+        if queryset is None:
+            return None
+        return self.set_page([item async for item in queryset])
+
+    def get_page_queryset(self, queryset, request):
+        if not self.is_requested(request):
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.cursor = self.decode_cursor(request)
+        self.reverse = self.cursor is not None and self.cursor["reverse"]
+
+        if self.cursor is not None:
+            try:
+                queryset = queryset.filter(
+                    self.get_position_filter(self.cursor["position"], self.reverse)
+                )
+            except (DjangoValidationError, ValueError):
+                raise NotFound(self.invalid_cursor_message)
+        ordering = [f"-{field}" if self.reverse else field for field in self.ordering]
+        return queryset.order_by(*ordering)[: self.page_size + 1]
+
+    def set_page(self, results: list) -> list:
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if self.reverse:
+            results.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.cursor is not None
+        self.page = results
+
+        return results
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True},
+                "previous": {"type": "string", "nullable": True},
+                "results": schema,
+            },
+        }
+
+    def is_requested(self, request) -> bool:
+        return (
+            self.cursor_query_param in request.query_params
+            or self.page_size_query_param in request.query_params
+        )
+
+    def get_page_size(self, request) -> int:
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def get_position_filter(self, position: list[str], reverse: bool) -> Q:
+        lookup = "lt" if reverse else "gt"
+        position_filter = Q()
+        for index, field in enumerate(self.ordering):
+            condition = Q(**{f"{field}__{lookup}": position[index]})
+            for previous_field, value in zip(self.ordering[:index], position):
+                condition &= Q(**{previous_field: value})
+            position_filter |= condition
+        if len(self.ordering) > 1:
+            # The OR alone is only applied as a filter; this redundant bound on
+            # the leading column lets the index scan start at the position.
+            bound = Q(**{f"{self.ordering[0]}__{lookup}e": position[0]})
+            position_filter = bound & position_filter
+        return position_filter
+
+    def get_position(self, instance) -> list[str]:
+        position = []
+        for field in self.ordering:
+            if isinstance(instance, dict):
+                value = instance[field]
+            else:
+                value = getattr(instance, field)
+            position.append(
+                value.isoformat() if hasattr(value, "isoformat") else str(value)
+            )
+        return position
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.get_position(self.page[-1]), reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self.encode_cursor(self.get_position(self.page[0]), reverse=True)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            querystring = b64decode(encoded.encode("ascii")).decode("ascii")
+            tokens = parse.parse_qs(querystring, keep_blank_values=True)
+            position = tokens["p"]
+            reverse = bool(int(tokens.get("r", ["0"])[0]))
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        return {"position": position, "reverse": reverse}
+
+    def encode_cursor(self, position: list[str], reverse: bool) -> str:
+        tokens = {"p": position}
+        if reverse:
+            tokens["r"] = "1"
+        querystring = parse.urlencode(tokens, doseq=True)
+        encoded = b64encode(querystring.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+
+class ColumnKeysetPagination(KeysetPagination):
+    """
+    Keyset pagination over a single unique column, such as one side of a
+    through table. Unlike KeysetPagination it always applies.
+    """
+
+    def __init__(self, column: str):
+        self.ordering = (column,)
+
+    def is_requested(self, request) -> bool:
+        return True
+
+
+class OrderingKeysetPagination(KeysetPagination):
+    """
+    Keyset positions and filters over any unique ordering, for views that page
+    several querysets in one response, such as the change feeds.
+    """
+
+    def __init__(self, ordering: tuple[str, ...]):
+        self.ordering = ordering
@@ -0,0 +1,300 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+from interview.core.cache import lookup_cache
+from interview.core.instrumentation import timed
+
+
+def get_prefetch(serializer, field, lookup: str) -> Prefetch | str:
+    # Many-valued relations are prefetched in primary key order so that the
+    # representation, and the fast serializers built on it, are deterministic.
+    try:
+        related_model = serializer.Meta.model._meta.get_field(
+            field.source
+        ).related_model
+    except (AttributeError, FieldDoesNotExist):
+        return lookup
+    return Prefetch(lookup, queryset=related_model._default_manager.order_by("pk"))
+
+
+def get_related_lookups(serializer, prefix: str = "") -> tuple[list[str], list]:
+    select_related, prefetch_related = [], []
+
+    for field in serializer.fields.values():
+        if field.source == "*":
+            continue
+
+        lookup = prefix + field.source.replace(".", "__")
+        if isinstance(field, serializers.ListSerializer):
+            prefetch_related.append(get_prefetch(serializer, field, lookup))
+            if isinstance(field.child, serializers.BaseSerializer):
+                nested_select, nested_prefetch = get_related_lookups(
+                    field.child, f"{lookup}__"
+                )
+                prefetch_related.extend(nested_select + nested_prefetch)
+        elif isinstance(field, serializers.ManyRelatedField):
+            prefetch_related.append(get_prefetch(serializer, field, lookup))
+        elif isinstance(field, CachedLookupSerializerMixin):
+            continue
+        elif isinstance(field, serializers.BaseSerializer):
+            select_related.append(lookup)
+            nested_select, nested_prefetch = get_related_lookups(field, f"{lookup}__")
+            select_related.extend(nested_select)
+            prefetch_related.extend(nested_prefetch)
+
+    return select_related, prefetch_related
+
+
+class EagerLoadingMixin:
+    """
+    Derives select_related/prefetch_related lookups from the serializer's nested
+    fields so that serializing a queryset runs a constant number of queries.
+    """
+
+    _related_lookups = None
+
+    @classmethod
+    def get_related_lookups(cls) -> tuple[list[str], list]:
+        if cls.__dict__.get("_related_lookups") is None:
+            cls._related_lookups = get_related_lookups(cls())
+        return cls._related_lookups
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        select_related, prefetch_related = cls.get_related_lookups()
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
+
+
+def parse_field_paths(value: str | None) -> dict | None:
+    """
+    Parses "id,name,type.name" into {"id": {}, "name": {}, "type": {"name": {}}}.
+    An empty subtree selects the whole field.
+    """
+    if value is None:
+        return None
+
+    tree = {}
+    for path in filter(None, (path.strip() for path in value.split(","))):
+        node = tree
+        for name in path.split("."):
+            node = node.setdefault(name, {})
+    return tree
+
+
+def prune_fields(serializer, fields: dict | None, expand: dict | None, prefix=""):
+    """
+    Drops the fields not selected by the fields tree and collapses the nested
+    serializers not selected by the expand tree to primary keys. A None tree
+    keeps, or expands, everything at that level.
+    """
+    if fields is not None:
+        unknown = [name for name in fields if name not in serializer.fields]
+        if unknown:
+            raise serializers.ValidationError(
+                {"fields": [f"Unknown field: {prefix}{name}." for name in unknown]}
+            )
+    if expand is not None:
+        unknown = [name for name in expand if name not in serializer.fields]
+        if unknown:
+            raise serializers.ValidationError(
+                {"expand": [f"Unknown field: {prefix}{name}." for name in unknown]}
+            )
+
+    for name, field in list(serializer.fields.items()):
+        if fields is not None and name not in fields:
+            del serializer.fields[name]
+            continue
+
+        many = isinstance(field, serializers.ListSerializer)
+        nested = field.child if many else field
+        if not isinstance(nested, serializers.BaseSerializer):
+            continue
+
+        nested_fields = fields.get(name) or None if fields is not None else None
+        if expand is not None and name not in expand and nested_fields is None:
+            kwargs = {} if field.source == name else {"source": field.source}
+            serializer.fields[name] = serializers.PrimaryKeyRelatedField(
+                many=many, read_only=True, **kwargs
+            )
+            continue
+
+        nested_expand = expand.get(name) or None if expand is not None else None
+        prune_fields(nested, nested_fields, nested_expand, f"{prefix}{name}.")
+
+
+def get_only_fields(serializer, prefix: str = "") -> list[str] | None:
+    """
+    Lists the columns the serializer reads, for QuerySet.only(). Returns None
+    when a field cannot be mapped to a concrete model field.
+    """
+    opts = serializer.Meta.model._meta
+    only = [prefix + opts.pk.name]
+
+    for field in serializer.fields.values():
+        if isinstance(
+            field, (serializers.ListSerializer, serializers.ManyRelatedField)
+        ):
+            continue
+        if field.source == "*" or "." in field.source:
+            return None
+        try:
+            model_field = opts.get_field(field.source)
+        except FieldDoesNotExist:
+            return None
+        if not model_field.concrete:
+            return None
+
+        only.append(prefix + field.source)
+        if isinstance(field, serializers.BaseSerializer) and not isinstance(
+            field, CachedLookupSerializerMixin
+        ):
+            nested = get_only_fields(field, f"{prefix}{field.source}__")
+            if nested is None:
+                return None
+            only.extend(nested)
+
+    return only
+
+
+class SparseFieldsetMixin(EagerLoadingMixin):
+    """
+    Accepts fields= and expand= path lists (see parse_field_paths) that trim the
+    representation, and projects querysets down to the columns and relations
+    the trimmed serializer actually reads.
+    """
+
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.is_sparse = fields is not None or expand is not None
+        if self.is_sparse:
+            prune_fields(self, parse_field_paths(fields), parse_field_paths(expand))
+
+    def to_representation(self, instance):
+        with timed("serialize"):
+            return super().to_representation(instance)
+
+    def setup_queryset(self, queryset, extra_fields=()):
+        if self.is_sparse:
+            select_related, prefetch_related = get_related_lookups(self)
+            if select_related:
+                queryset = queryset.select_related(*select_related)
+            if prefetch_related:
+                queryset = queryset.prefetch_related(*prefetch_related)
+        else:
+            queryset = self.setup_eager_loading(queryset)
+
+        only = get_only_fields(self)
+        if only is not None:
+            queryset = queryset.only(*only, *extra_fields)
+        return queryset
+
+
+class CachedLookupSerializerMixin:
+    """
+    Resolves a nested foreign key through the lookup cache using the
+    relation's id column, so the related table is neither joined nor queried.
+    """
+
+    def get_attribute(self, instance):
+        try:
+            field = instance._meta.get_field(self.source)
+        except (AttributeError, FieldDoesNotExist):
+            return super().get_attribute(instance)
+        if not field.many_to_one:
+            return super().get_attribute(instance)
+
+        pk = getattr(instance, field.attname)
+        if pk is None:
+            return None
+        return lookup_cache.get(self.Meta.model, pk) or super().get_attribute(instance)
+
+
+class ChangeFeedQuerySerializer(serializers.Serializer):
+    updated_since = serializers.DateTimeField()
+    cursor = serializers.CharField(required=False)
+
+
+class TaggedQuerySerializer(serializers.Serializer):
+    tags = serializers.CharField()
+    match = serializers.ChoiceField(choices=["all", "any"], default="any")
+
+    def validate_tags(self, value: str) -> list[str]:
+        names = list(dict.fromkeys(filter(None, map(str.strip, value.split(",")))))
+        if not names:
+            raise serializers.ValidationError("Provide at least one tag.")
+        return names
+
+
+class SetActiveSerializer(serializers.Serializer):
+    """
+    Body of a bulk activation request. Rows are selected by ids and/or the
+    filter fields a subclass adds; at least one selector is required.
+    """
+
+    is_active = serializers.BooleanField()
+    ids = serializers.ListField(
+        child=serializers.IntegerField(), allow_empty=False, required=False
+    )
+
+    def validate(self, attrs):
+        if attrs.keys() == {"is_active"}:
+            raise serializers.ValidationError("Provide ids or at least one filter.")
+        return attrs
+
+
+class FastSerializer:
+    """
+    Read-only, list-only counterpart of a ModelSerializer that builds the
+    representation from values() rows in bulk rather than dispatching field by
+    field. Subclasses must produce exactly what their ModelSerializer would.
+    Lookup rows come from the lookup cache unless use_lookup_cache is False.
+    """
+
+    values = ()
+
+    def __init__(self, rows=None, use_lookup_cache=True, **kwargs):
+        self.rows = rows
+        self.use_lookup_cache = use_lookup_cache
+
+    @classmethod
+    def setup_queryset(cls, queryset, extra_fields=()):
+        return queryset.values(*cls.values, *extra_fields)
+
+    @property
+    def data(self) -> list[dict]:
+        rows = list(self.rows)
+        with timed("serialize"):
+            return self.to_representation(rows) if rows else []
+
+    def to_representation(self, rows: list[dict]) -> list[dict]:
+        raise NotImplementedError
+
+    def get_lookup_map(self, serializer_class, pks: set[int]) -> dict[int, dict]:
+        model = serializer_class.Meta.model
+        if self.use_lookup_cache:
+            table = lookup_cache.get_complete_table(model, pks)["by_id"]
+        else:
+            table = model.objects.in_bulk(pks)
+        return {pk: dict(serializer_class(table[pk]).data) for pk in pks}
+
+    def get_many_map(self, descriptor, serializer_class, ids) -> dict[int, list]:
+        field = descriptor.field
+        source, target = field.m2m_field_name(), field.m2m_reverse_field_name()
+        names = serializer_class.Meta.fields
+        rows = (
+            descriptor.through.objects.filter(**{f"{source}__in": set(ids)})
+            .order_by(target)
+            .values_list(source, *(f"{target}__{name}" for name in names))
+        )
+
+        related, many_map = {}, {}
+        for pk, *values in rows:
+            representation = dict(zip(names, values))
+            representation = related.setdefault(representation["id"], representation)
+            many_map.setdefault(pk, []).append(representation)
+        return many_map
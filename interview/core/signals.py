@@ -0,0 +1,58 @@
+from django.apps import apps
+from django.core.signals import request_finished, request_started
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.utils import timezone
+
+from interview.core.behaviors import (
+    IsActiveModel,
+    TimestampedModel,
+    UniqueNameModel,
+    is_active_changed,
+)
+from interview.core.cache import lookup_cache
+
+
+def invalidate_lookup_cache(sender, **kwargs):
+    lookup_cache.invalidate(sender)
+
+
+def connect_lookup_cache_invalidation():
+    for model in apps.get_models():
+        if issubclass(model, UniqueNameModel):
+            post_save.connect(invalidate_lookup_cache, sender=model)
+            post_delete.connect(invalidate_lookup_cache, sender=model)
+            if issubclass(model, IsActiveModel):
+                is_active_changed.connect(invalidate_lookup_cache, sender=model)
+
+
+def connect_lookup_cache_requests():
+    request_started.connect(lookup_cache.start_request)
+    request_finished.connect(lookup_cache.finish_request)
+
+
+def touch_m2m_instances(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """
+    Bumps updated_at on the owner of a many-to-many relation when its links
+    change, so that updated_at based validators see tag additions and removals.
+    """
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    now = timezone.now()
+    if not reverse:
+        type(instance).objects.filter(pk=instance.pk).update(updated_at=now)
+        instance.updated_at = now
+    elif action == "pre_clear":
+        for field in model._meta.many_to_many:
+            if field.remote_field.through is sender:
+                model.objects.filter(**{field.name: instance}).update(updated_at=now)
+    else:
+        model.objects.filter(pk__in=pk_set).update(updated_at=now)
+
+
+def connect_m2m_touch():
+    for model in apps.get_models():
+        if not issubclass(model, TimestampedModel):
+            continue
+        for field in model._meta.local_many_to_many:
+            m2m_changed.connect(touch_m2m_instances, sender=field.remote_field.through)
@@ -0,0 +1,53 @@
+import asyncio
+import json
+import os
+import subprocess
+
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+
+from interview.core.metrics import dump_snapshot, metrics, new_totals
+from interview.core.middleware import MetricsMiddleware
+
+QUERIES = ("db_queries_total", (("view", "inventory-async-list"),))
+
+
+async def get_response(request):
+    pass
+
+
+@async_to_sync
+async def get(path: str):
+    return await AsyncClient(HTTP_ACCEPT="application/json").get(path)
+
+
+def test_async_requests_count_queries(catalogue):
+    assert asyncio.iscoroutinefunction(MetricsMiddleware(get_response))
+    before = metrics.collect_local()["counters"][QUERIES]
+
+    response = get("/inventory/async/")
+
+    assert response.status_code == 200
+    assert metrics.collect_local()["counters"][QUERIES] > before
+
+
+def test_collect_retires_exited_processes(settings, tmp_path):
+    settings.METRICS_DIR = str(tmp_path)
+    process = subprocess.Popen(["true"])
+    process.wait()
+    exited = new_totals()
+    exited["counters"][("http_requests_total", ())] = 3
+    exited["gauges"][("db_pool_connections", (("pid", str(process.pid)),))] = 1
+    (tmp_path / f"{process.pid}.json").write_text(json.dumps(dump_snapshot(exited)))
+    own = metrics.collect_local()["counters"][("http_requests_total", ())]
+
+    totals = metrics.collect()
+
+    assert totals["counters"][("http_requests_total", ())] == own + 3
+    assert ("db_pool_connections", (("pid", str(process.pid)),)) not in totals["gauges"]
+    assert sorted(os.listdir(tmp_path)) == [
+        ".lock",
+        f"{os.getpid()}.json",
+        "retired.json",
+    ]
+    assert metrics.collect()["counters"][("http_requests_total", ())] == own + 3
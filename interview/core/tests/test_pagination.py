@@ -0,0 +1,106 @@
+from base64 import b64encode
+from datetime import datetime, timedelta, timezone
+from urllib import parse
+
+import pytest
+from django.db import connection
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from interview.core.pagination import KeysetPagination
+from interview.inventory.models import Inventory
+
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def cursor(position: list[str], reverse: bool = False) -> str:
+    tokens = {"p": position, **({"r": "1"} if reverse else {})}
+    return b64encode(parse.urlencode(tokens, doseq=True).encode()).decode()
+
+
+def walk(api_client, url: str, link: str) -> list[list[int]]:
+    pages = []
+    while url:
+        response = api_client.get(url)
+        assert response.status_code == 200
+        pages.append([item["id"] for item in response.json()["results"]])
+        url = response.json()[link]
+    return pages
+
+
+@pytest.fixture
+def inventories(catalogue) -> list[int]:
+    # Three rows per timestamp, so pages break inside runs of equal created_at.
+    for index, inventory in enumerate(catalogue["inventories"]):
+        Inventory.objects.filter(pk=inventory.pk).update(
+            created_at=EPOCH + timedelta(hours=index // 3)
+        )
+    return list(
+        Inventory.objects.order_by("created_at", "id").values_list("id", flat=True)
+    )
+
+
+def test_cursor_round_trip(api_client, inventories):
+    forward = walk(api_client, "/inventory/?page_size=5", "next")
+
+    assert [id for page in forward for id in page] == inventories
+    assert [len(page) for page in forward] == [5, 5, 2]
+
+    last_page = api_client.get("/inventory/?page_size=5").json()
+    while last_page["next"]:
+        last_page = api_client.get(last_page["next"]).json()
+    backward = walk(api_client, last_page["previous"], "previous")
+
+    assert backward == forward[-2::-1]
+
+
+def test_ties_are_broken_by_id(api_client, inventories):
+    first, second, third = inventories[:3]
+    position = [EPOCH.isoformat(), str(first)]
+
+    response = api_client.get(f"/inventory/?page_size=2&cursor={cursor(position)}")
+
+    assert [item["id"] for item in response.json()["results"]] == [second, third]
+
+
+def test_reverse_page(api_client, inventories):
+    position = [(EPOCH + timedelta(hours=1)).isoformat(), str(inventories[4])]
+
+    response = api_client.get(
+        f"/inventory/?page_size=3&cursor={cursor(position, reverse=True)}"
+    )
+
+    assert [item["id"] for item in response.json()["results"]] == inventories[1:4]
+    assert response.json()["next"] is not None
+    assert response.json()["previous"] is not None
+
+
+def test_invalid_cursor(api_client, inventories):
+    response = api_client.get("/inventory/?cursor=not-a-cursor")
+
+    assert response.status_code == 404
+
+
+def test_deep_cursor_is_an_index_bound(lookups):
+    Inventory.objects.bulk_create(
+        Inventory(
+            name=f"Title {i}",
+            type=lookups["types"][0],
+            language=lookups["languages"][0],
+            metadata={},
+            created_at=EPOCH + timedelta(minutes=i // 2),
+        )
+        for i in range(20000)
+    )
+    with connection.cursor() as db_cursor:
+        db_cursor.execute("ANALYZE inventory_inventory")
+    position = [(EPOCH + timedelta(minutes=9500)).isoformat(), "0"]
+    request = Request(
+        APIRequestFactory().get("/inventory/", {"cursor": cursor(position)})
+    )
+
+    queryset = KeysetPagination().get_page_queryset(Inventory.objects.all(), request)
+    plan = queryset.explain()
+
+    assert "inventory_created_at_id_idx" in plan, plan
+    assert "Index Cond: (created_at >=" in plan, plan
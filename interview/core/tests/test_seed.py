@@ -0,0 +1,18 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db.models import Count, F
+
+from interview.inventory.models import Inventory
+from interview.order.models import Order
+
+
+def test_seeded_timestamps_are_spread(db):
+    call_command("seed", inventory=50, orders=100, no_fixtures=True, stdout=StringIO())
+
+    for model in (Inventory, Order):
+        rows = model.objects.aggregate(
+            count=Count("id"), created=Count("created_at", distinct=True)
+        )
+        assert rows["count"] == rows["created"]
+        assert model.objects.filter(updated_at__lt=F("created_at")).count() == 0
@@ -0,0 +1,93 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from interview.core.behaviors import is_active_changed
+from interview.order.models import Order, OrderTag
+
+
+@pytest.fixture(autouse=True)
+def no_background_refresh(settings):
+    settings.ORDER_READ_MODEL_BACKGROUND_REFRESH = False
+
+
+def updates_of(context, table: str) -> list[str]:
+    return [
+        query["sql"]
+        for query in context.captured_queries
+        if query["sql"].startswith(f'UPDATE "{table}"')
+    ]
+
+
+def test_activate_and_deactivate(catalogue):
+    tag = catalogue["order_tags"][0]
+
+    assert OrderTag.deactivate(tag.pk) == 1
+    assert OrderTag.objects.get(pk=tag.pk).is_active is False
+    assert OrderTag.deactivate(tag.pk) == 0
+
+    assert OrderTag.activate(tag.pk) == 1
+    assert OrderTag.objects.get(pk=tag.pk).is_active is True
+
+
+def test_set_active_is_one_update(catalogue):
+    orders = Order.objects.filter(is_active=True)
+    expected = orders.count()
+    before = max(orders.values_list("updated_at", flat=True))
+    sent = []
+
+    def receiver(sender, **kwargs):
+        sent.append((sender, kwargs["is_active"], kwargs["count"]))
+
+    is_active_changed.connect(receiver)
+    try:
+        with CaptureQueriesContext(connection) as context:
+            assert Order.set_active(False, Order.objects.all()) == expected
+    finally:
+        is_active_changed.disconnect(receiver)
+
+    assert len(updates_of(context, "order_order")) == 1
+    assert sent == [(Order, False, expected)]
+    assert not Order.objects.filter(is_active=True).exists()
+    assert Order.objects.filter(updated_at__gt=before).count() == expected
+
+
+def test_set_active_endpoint(api_client, catalogue):
+    ids = [order.pk for order in catalogue["orders"][:5]]
+
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.post(
+            "/orders/active/",
+            {"is_active": False, "ids": ids},
+            content_type="application/json",
+        )
+
+    assert response.status_code == 200
+    # Order 0 was already inactive.
+    assert response.json() == {"is_active": False, "updated": 4}
+    assert len(updates_of(context, "order_order")) == 1
+    assert not Order.objects.filter(pk__in=ids, is_active=True).exists()
+
+
+def test_set_active_endpoint_filters(api_client, catalogue):
+    response = api_client.post(
+        "/orders/active/",
+        {"is_active": False, "start_date_before": "2024-03-01"},
+        content_type="application/json",
+    )
+
+    assert response.status_code == 200
+    # Orders 1 and 2 start on or before March 1st; order 0 is already inactive.
+    assert response.json()["updated"] == 2
+
+
+def test_set_active_requires_a_selector(api_client, catalogue):
+    response = api_client.post(
+        "/orders/active/", {"is_active": False}, content_type="application/json"
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {
+        "non_field_errors": ["Provide ids or at least one filter."]
+    }
+    assert Order.objects.filter(is_active=True).count() == 9
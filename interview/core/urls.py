@@ -0,0 +1,8 @@
+from django.urls import path
+from interview.core.views import RequestStatsView, ResponseCacheStatsView
+
+
+urlpatterns = [
+    path("cache/", ResponseCacheStatsView.as_view(), name="response-cache-stats"),
+    path("requests/", RequestStatsView.as_view(), name="request-stats"),
+]
@@ -1,3 +1,443 @@
-from django.shortcuts import render
+import json
+from base64 import b64decode, b64encode
+from datetime import timedelta
 
-# Create your views here.
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Exists, OuterRef
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.views import View
+from rest_framework.exceptions import APIException, NotFound, ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
+
+from interview.core.cache import lookup_cache, response_cache
+from interview.core.instrumentation import endpoint_stats
+from interview.core.metrics import metrics, render_exposition
+from interview.core.models import Tombstone
+from interview.core.pagination import (
+    ColumnKeysetPagination,
+    OrderingKeysetPagination,
+)
+from interview.core.renderers import FastJSONRenderer
+from interview.core.routers import use_primary
+from interview.core.serializers import (
+    ChangeFeedQuerySerializer,
+    SetActiveSerializer,
+    TaggedQuerySerializer,
+)
+
+
+class SparseFieldsetViewMixin:
+    """
+    Passes ?fields= and ?expand= from GET requests to a SparseFieldsetMixin
+    serializer, e.g. ?fields=id,name,type.name&expand=type.
+    """
+
+    fieldset_query_params = ("fields", "expand")
+
+    def get_fieldset_kwargs(self) -> dict:
+        if self.request.method != "GET":
+            return {}
+        return {
+            param: self.request.query_params[param]
+            for param in self.fieldset_query_params
+            if param in self.request.query_params
+        }
+
+    def get_list_serializer(self, rows):
+        return self.serializer_class(rows, many=True, **self.get_fieldset_kwargs())
+
+    def get_pagination_ordering(self) -> tuple[str, ...]:
+        pagination_class = getattr(self, "pagination_class", None)
+        return getattr(pagination_class, "ordering", ())
+
+    def setup_queryset(self, queryset):
+        serializer = self.serializer_class(**self.get_fieldset_kwargs())
+        return serializer.setup_queryset(queryset, self.get_pagination_ordering())
+
+
+class FastSerializerViewMixin(SparseFieldsetViewMixin):
+    """
+    Serves list reads through fast_serializer_class, a FastSerializer, when the
+    FAST_SERIALIZERS setting is on and no fieldset was requested.
+    """
+
+    fast_serializer_class = None
+
+    def use_fast_serializer(self) -> bool:
+        return (
+            settings.FAST_SERIALIZERS
+            and self.fast_serializer_class is not None
+            and self.request.method == "GET"
+            and not self.get_fieldset_kwargs()
+        )
+
+    def get_list_serializer(self, rows):
+        if self.use_fast_serializer():
+            return self.fast_serializer_class(rows)
+        return super().get_list_serializer(rows)
+
+    def setup_queryset(self, queryset):
+        if self.use_fast_serializer():
+            return self.fast_serializer_class.setup_queryset(
+                queryset, self.get_pagination_ordering()
+            )
+        return super().setup_queryset(queryset)
+
+
+class ChangeFeedView(FastSerializerViewMixin, APIView):
+    """
+    Lists the rows updated and the ids deleted since ?updated_since=, at most
+    CHANGE_FEED_PAGE_SIZE of each per response. Clients follow "next" while it
+    is set, then pass the returned "until" timestamp as updated_since on their
+    next call. Successive responses overlap, so clients must deduplicate rows by
+    id and updated_at. Tombstones are purged after CHANGE_FEED_RETENTION_DAYS,
+    so older watermarks get a 410 and must reload the full list.
+    """
+
+    queryset = None
+    serializer_class = None
+    changed_ordering = ("updated_at", "id")
+    deleted_ordering = ("deleted_at", "id")
+    invalid_cursor_message = "Invalid cursor"
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        query = ChangeFeedQuerySerializer(data=request.query_params.dict())
+        query.is_valid(raise_exception=True)
+        since = query.validated_data["updated_since"]
+        now = timezone.now()
+        if since < now - timedelta(days=settings.CHANGE_FEED_RETENTION_DAYS):
+            return Response(
+                {
+                    "detail": "updated_since is older than the "
+                    f"{settings.CHANGE_FEED_RETENTION_DAYS} days deletes are kept "
+                    "for; reload the full list."
+                },
+                status=410,
+            )
+
+        cursor = self.decode_cursor(query.validated_data.get("cursor"))
+        if cursor is None:
+            # updated_at is set at save time, before the row commits, so a row
+            # stamped just before this read can become visible just after it.
+            # The watermark trails the read to have the next call cover such
+            # rows. Later pages keep the first page's watermark.
+            until = max(
+                since, now - timedelta(seconds=settings.CHANGE_FEED_OVERLAP_SECONDS)
+            )
+            cursor = {"until": until.isoformat()}
+
+        changed = OrderingKeysetPagination(self.changed_ordering)
+        deleted = OrderingKeysetPagination(self.deleted_ordering)
+        page_size = settings.CHANGE_FEED_PAGE_SIZE
+        # Replicas would add their lag to the overlap window.
+        with use_primary():
+            try:
+                rows = self.get_page(
+                    self.get_queryset(since), changed, cursor.get("changed")
+                )
+                tombstones = self.get_page(
+                    Tombstone.deleted_since(self.queryset.model, since).values(
+                        "id", "object_id", "deleted_at"
+                    ),
+                    deleted,
+                    cursor.get("deleted"),
+                )
+            except (DjangoValidationError, ValueError):
+                raise NotFound(self.invalid_cursor_message)
+            data = self.get_list_serializer(rows[:page_size]).data
+
+        next_url = None
+        if len(rows) > page_size or len(tombstones) > page_size:
+            for name, pagination, page in (
+                ("changed", changed, rows),
+                ("deleted", deleted, tombstones),
+            ):
+                if page:
+                    cursor[name] = pagination.get_position(page[:page_size][-1])
+            next_url = replace_query_param(
+                request.build_absolute_uri(), "cursor", self.encode_cursor(cursor)
+            )
+
+        return Response(
+            {
+                "until": parse_datetime(cursor["until"]),
+                "next": next_url,
+                "changed": data,
+                "deleted": [row["object_id"] for row in tombstones[:page_size]],
+            },
+            status=200,
+        )
+
+    def get_queryset(self, since):
+        queryset = self.queryset.updated_since(since)
+        return self.setup_queryset(queryset)
+
+    def get_pagination_ordering(self) -> tuple[str, ...]:
+        return self.changed_ordering
+
+    def get_page(self, queryset, pagination, position) -> list:
+        if position is not None:
+            queryset = queryset.filter(
+                pagination.get_position_filter(position, reverse=False)
+            )
+        queryset = queryset.order_by(*pagination.ordering)
+        return list(queryset[: settings.CHANGE_FEED_PAGE_SIZE + 1])
+
+    def decode_cursor(self, encoded: str | None) -> dict | None:
+        if encoded is None:
+            return None
+        try:
+            cursor = json.loads(b64decode(encoded.encode("ascii")))
+            valid = parse_datetime(cursor["until"]) is not None and all(
+                len(cursor.get(name, ())) in (0, 2) for name in ("changed", "deleted")
+            )
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            valid = False
+        if not valid:
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    def encode_cursor(self, cursor: dict) -> str:
+        return b64encode(json.dumps(cursor).encode()).decode("ascii")
+
+
+class SetActiveView(APIView):
+    """
+    Sets is_active on the rows selected by the ids and filters in the request
+    body with a single UPDATE (see IsActiveModel.set_active) and reports how
+    many rows changed. lookups maps filter fields to queryset lookups.
+    """
+
+    queryset = None
+    serializer_class = SetActiveSerializer
+    lookups = {}
+
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        serializer = self.serializer_class(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=400)
+
+        filters = dict(serializer.validated_data)
+        is_active = filters.pop("is_active")
+        updated = self.queryset.model.set_active(is_active, self.get_queryset(filters))
+
+        return Response({"is_active": is_active, "updated": updated}, status=200)
+
+    def get_queryset(self, filters: dict):
+        queryset = self.queryset.all()
+        if "ids" in filters:
+            queryset = queryset.filter(pk__in=filters.pop("ids"))
+        return queryset.filter(
+            **{self.lookups[field]: value for field, value in filters.items()}
+        )
+
+
+class ManyToManyListView(FastSerializerViewMixin, APIView):
+    """
+    Lists the rows of queryset linked through m2m_field, a ManyToManyField, to
+    the given ids on the other side of the relation. Each page of primary keys
+    is read from the through table alone, along its (filter, value) composite
+    index, and only then are the rows loaded by primary key. With match="all"
+    a row must be linked to every id, with "any" to at least one.
+    """
+
+    queryset = None
+    serializer_class = None
+    m2m_field = None
+
+    def list_related(self, ids: list[int], match: str = "any") -> Response:
+        column, through_queryset = self.get_through_queryset(ids, match)
+        paginator = ColumnKeysetPagination(column)
+        page = paginator.paginate_queryset(through_queryset, self.request, view=self)
+        serializer = self.get_list_serializer(
+            self.get_rows([row[column] for row in page])
+        )
+
+        return paginator.get_paginated_response(serializer.data)
+
+    def get_through_queryset(self, ids: list[int], match: str):
+        field = self.m2m_field
+        if self.queryset.model is field.model:
+            column, filter_column = field.m2m_column_name(), field.m2m_reverse_name()
+        else:
+            column, filter_column = field.m2m_reverse_name(), field.m2m_column_name()
+
+        through = field.remote_field.through.objects
+        if match == "any" and len(ids) > 1:
+            queryset = through.filter(**{f"{filter_column}__in": ids}).distinct()
+        else:
+            # The scan runs along the first id; the others are index probes.
+            first, *others = ids
+            queryset = through.filter(**{filter_column: first})
+            for pk in others:
+                queryset = queryset.filter(
+                    Exists(
+                        through.filter(**{column: OuterRef(column), filter_column: pk})
+                    )
+                )
+
+        return column, queryset.values(column)
+
+    def get_rows(self, pks: list[int]):
+        return self.setup_queryset(self.queryset).filter(pk__in=pks).order_by("pk")
+
+    def get_tag_ids(self, tag_model) -> tuple[list[int], str]:
+        """
+        Resolves ?tags=name,name&match=all|any through the lookup cache.
+        """
+        query = TaggedQuerySerializer(data=self.request.query_params.dict())
+        query.is_valid(raise_exception=True)
+
+        names = query.validated_data["tags"]
+        by_name = lookup_cache.get_complete_table(tag_model, names=names)["by_name"]
+        unknown = [name for name in names if name not in by_name]
+        if unknown:
+            raise ValidationError(
+                {"tags": [f"Unknown tag: {name}." for name in unknown]}
+            )
+
+        return [by_name[name] for name in names], query.validated_data["match"]
+
+
+class LookupManyToManyListView(ManyToManyListView):
+    """
+    ManyToManyListView for a lookup table, whose rows come from the lookup
+    cache instead of the database.
+    """
+
+    fieldset_query_params = ()
+
+    def get_rows(self, pks: list[int]):
+        table = lookup_cache.get_complete_table(self.queryset.model, pks)["by_id"]
+        return [table[pk] for pk in pks if pk in table]
+
+    def get_list_serializer(self, rows):
+        return self.serializer_class(rows, many=True)
+
+
+class AsyncReadView(SparseFieldsetViewMixin, View):
+    """
+    Read-only JSON view that runs natively under ASGI. Rows are fetched with the
+    async ORM and the lookup tables are loaded into the cache up front, so that
+    serializing, which runs in a worker thread, rarely touches the database.
+    """
+
+    queryset = None
+    serializer_class = None
+    pagination_class = None
+    lookup_models = ()
+    renderer = FastJSONRenderer()
+    # Lookup tables expiring sooner than this are reloaded before serializing.
+    lookup_min_ttl = 5
+
+    def setup(self, request, *args, **kwargs):
+        super().setup(Request(request), *args, **kwargs)
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            return await super().dispatch(request, *args, **kwargs)
+        except APIException as exc:
+            # Same body shape as DRF's default exception handler.
+            data = exc.detail
+            if not isinstance(data, (list, dict)):
+                data = {"detail": data}
+            return self.render(data, status=exc.status_code)
+
+    async def render_list(self, queryset) -> HttpResponse:
+        paginator = self.pagination_class() if self.pagination_class else None
+        rows = None
+        if paginator is not None:
+            rows = await paginator.apaginate_queryset(queryset, self.request, view=self)
+        if rows is None:
+            paginator, rows = None, [row async for row in queryset]
+
+        await self.load_lookups()
+        data = await self.serialize(self.get_list_serializer(rows))
+        if paginator is not None:
+            data = paginator.get_paginated_response(data).data
+
+        return self.render(data)
+
+    async def render_object(self, queryset, **kwargs) -> HttpResponse:
+        try:
+            instance = await queryset.aget(**kwargs)
+        except ObjectDoesNotExist:
+            raise NotFound()
+
+        await self.load_lookups()
+        data = await self.serialize(
+            self.serializer_class(instance, **self.get_fieldset_kwargs())
+        )
+
+        return self.render(data)
+
+    async def serialize(self, serializer):
+        # Serializers may still query, e.g. for a lookup row created by another
+        # process since its table was loaded, so they run in a worker thread.
+        return await sync_to_async(lambda: serializer.data)()
+
+    async def load_lookups(self):
+        for model in self.lookup_models:
+            if not lookup_cache.is_loaded(model, self.lookup_min_ttl):
+                await sync_to_async(lookup_cache.get_table)(model, self.lookup_min_ttl)
+
+    def render(self, data, status: int = 200) -> HttpResponse:
+        return HttpResponse(
+            self.renderer.render(data),
+            status=status,
+            content_type=self.renderer.media_type,
+        )
+
+
+class ResponseCacheStatsView(APIView):
+    """
+    Reports this process's response cache hits and misses per namespace.
+    """
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        stats = response_cache.stats()
+        for counters in stats.values():
+            lookups = counters["hits"] + counters["misses"]
+            counters["hit_ratio"] = counters["hits"] / lookups if lookups else None
+
+        return Response(
+            {"enabled": response_cache.is_enabled(), "namespaces": stats}, status=200
+        )
+
+
+class RequestStatsView(APIView):
+    """
+    Reports this process's per-endpoint request histograms, collected by
+    InstrumentationMiddleware.
+    """
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        return Response(
+            {
+                "enabled": settings.INSTRUMENTATION,
+                "endpoints": endpoint_stats.snapshot(),
+            },
+            status=200,
+        )
+
+
+class MetricsView(View):
+    """
+    Serves request, database, cache and pool metrics in the Prometheus text
+    exposition format.
+    """
+
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    def get(self, request, *args, **kwargs) -> HttpResponse:
+        return HttpResponse(
+            render_exposition(metrics.collect()), content_type=self.content_type
+        )
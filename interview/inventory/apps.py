@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class InventoryConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "interview.inventory"
+
+    def ready(self):
+        from interview.inventory import signals  # noqa: F401
@@ -0,0 +1,103 @@
+import json
+
+from django.db import transaction
+from pydantic import ValidationError
+
+from interview.inventory.models import (
+    Inventory,
+    InventoryLanguage,
+    InventoryTag,
+    InventoryType,
+)
+from interview.inventory.schemas import InventoryMetaData
+from interview.inventory.serializers import InventoryBulkItemSerializer
+from interview.inventory.signals import invalidate_inventory_responses
+
+
+def get_ids_by_name(model, names: set[str]) -> dict[str, int]:
+    return dict(model.objects.filter(name__in=names).values_list("name", "id"))
+
+
+def bulk_create_inventory(
+    items: list, batch_size: int = 1000
+) -> tuple[list[Inventory], list[dict]]:
+    """
+    Validates every item up front and inserts the valid ones with bulk_create,
+    returning the created rows and a list of per-item errors keyed by index.
+    Type, language and tag names are resolved with a single query per table.
+    """
+    errors, valid = [], []
+    for index, item in enumerate(items):
+        serializer = InventoryBulkItemSerializer(data=item)
+        if not serializer.is_valid():
+            errors.append({"index": index, "errors": serializer.errors})
+            continue
+
+        data = serializer.validated_data
+        try:
+            metadata = InventoryMetaData(**data["metadata"])
+        except ValidationError as e:
+            metadata_errors = {}
+            for error in e.errors():
+                field = ".".join(str(loc) for loc in error["loc"])
+                metadata_errors.setdefault(field, []).append(error["msg"])
+            errors.append({"index": index, "errors": {"metadata": metadata_errors}})
+            continue
+
+        data["metadata"] = json.loads(metadata.json())
+        valid.append((index, data))
+
+    type_ids = get_ids_by_name(InventoryType, {data["type"] for _, data in valid})
+    language_ids = get_ids_by_name(
+        InventoryLanguage, {data["language"] for _, data in valid}
+    )
+    tag_ids = get_ids_by_name(
+        InventoryTag, {tag for _, data in valid for tag in data["tags"]}
+    )
+
+    rows, row_tags = [], []
+    for index, data in valid:
+        item_errors = {}
+        if data["type"] not in type_ids:
+            item_errors["type"] = [f"Unknown type: {data['type']}."]
+        if data["language"] not in language_ids:
+            item_errors["language"] = [f"Unknown language: {data['language']}."]
+        unknown_tags = [tag for tag in data["tags"] if tag not in tag_ids]
+        if unknown_tags:
+            item_errors["tags"] = [f"Unknown tag: {tag}." for tag in unknown_tags]
+        if item_errors:
+            errors.append({"index": index, "errors": item_errors})
+            continue
+
+        rows.append(
+            Inventory(
+                name=data["name"],
+                type_id=type_ids[data["type"]],
+                language_id=language_ids[data["language"]],
+                metadata=data["metadata"],
+            )
+        )
+        row_tags.append({tag_ids[tag] for tag in data["tags"]})
+
+    errors.sort(key=lambda error: error["index"])
+    if not rows:
+        return [], errors
+
+    through = Inventory.tags.through
+    with transaction.atomic():
+        created = Inventory.objects.bulk_create(rows, batch_size=batch_size)
+        through.objects.bulk_create(
+            [
+                through(inventory_id=inventory.id, inventorytag_id=tag_id)
+                for inventory, tags in zip(created, row_tags)
+                for tag_id in tags
+            ],
+            batch_size=batch_size,
+        )
+        Inventory.objects.filter(
+            id__in=[inventory.id for inventory in created]
+        ).update_search_vector()
+        # bulk_create sends no post_save signals.
+        invalidate_inventory_responses([inventory.id for inventory in created])
+
+    return created, errors
@@ -0,0 +1,19 @@
+# Generated by Django 4.1.7 on 2026-10-18 09:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="inventory",
+            index=models.Index(
+                fields=["created_at", "id"], name="inventory_created_at_id_idx"
+            ),
+        ),
+    ]
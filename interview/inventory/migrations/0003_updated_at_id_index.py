@@ -0,0 +1,19 @@
+# Generated by Django 4.1.7 on 2026-10-18 09:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0002_created_at_id_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="inventory",
+            index=models.Index(
+                fields=["updated_at", "id"], name="inventory_updated_at_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.1.7 on 2026-10-18 09:53
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.fields.json
+import django.db.models.functions.comparison
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0003_updated_at_id_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="inventory",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["metadata"],
+                name="inventory_metadata_gin_idx",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inventory",
+            index=models.Index(
+                django.db.models.functions.comparison.Cast(
+                    django.db.models.fields.json.KeyTextTransform("year", "metadata"),
+                    models.IntegerField(),
+                ),
+                name="inventory_metadata_year_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inventory",
+            index=models.Index(
+                django.db.models.functions.comparison.Cast(
+                    django.db.models.fields.json.KeyTextTransform(
+                        "imdb_rating", "metadata"
+                    ),
+                    models.DecimalField(decimal_places=1, max_digits=3),
+                ),
+                name="inventory_metadata_imdb_idx",
+            ),
+        ),
+    ]
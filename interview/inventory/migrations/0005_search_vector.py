@@ -0,0 +1,51 @@
+# Generated by Django 4.1.7 on 2026-10-18 09:54
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models.fields.json import KeyTextTransform
+
+
+def populate_search_vector(apps, schema_editor):
+    Inventory = apps.get_model("inventory", "Inventory")
+    Inventory.objects.update(
+        search_vector=SearchVector("name", weight="A", config="english")
+        + SearchVector(
+            KeyTextTransform("actors", "metadata"), weight="B", config="english"
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0004_metadata_indexes"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="inventory",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(populate_search_vector, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="inventory",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="inventory_search_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inventory",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"],
+                name="inventory_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
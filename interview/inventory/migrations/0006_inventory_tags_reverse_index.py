@@ -0,0 +1,21 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("inventory", "0005_search_vector"),
+    ]
+
+    operations = [
+        # The unique (inventory_id, inventorytag_id) constraint serves
+        # inventory -> tags; this serves tag -> inventory as an ordered,
+        # index-only range scan.
+        migrations.RunSQL(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS inventory_tags_tag_inventory_idx "
+            "ON inventory_inventory_tags (inventorytag_id, inventory_id)",
+            "DROP INDEX CONCURRENTLY IF EXISTS inventory_tags_tag_inventory_idx",
+        ),
+    ]
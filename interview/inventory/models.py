@@ -1,12 +1,33 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorField,
+    TrigramWordSimilarity,
+)
 from django.db import models
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Cast
 
 from interview.core.behaviors import (
     IsActiveModel,
     NameModel,
     TimestampedModel,
+    TimestampedQuerySet,
     UniqueNameModel,
 )
 
+METADATA_YEAR = Cast(KeyTextTransform("year", "metadata"), models.IntegerField())
+METADATA_IMDB_RATING = Cast(
+    KeyTextTransform("imdb_rating", "metadata"),
+    models.DecimalField(max_digits=3, decimal_places=1),
+)
+SEARCH_CONFIG = "english"
+SEARCH_VECTOR = SearchVector("name", weight="A", config=SEARCH_CONFIG) + SearchVector(
+    KeyTextTransform("actors", "metadata"), weight="B", config=SEARCH_CONFIG
+)
+
 
 class InventoryTag(UniqueNameModel, TimestampedModel, IsActiveModel, models.Model):
     def __str__(self) -> str:
@@ -29,6 +50,52 @@ class InventoryType(UniqueNameModel, TimestampedModel, models.Model):
         return self.name
 
 
+class InventoryQuerySet(TimestampedQuerySet):
+    def filter_metadata(
+        self,
+        year_min=None,
+        year_max=None,
+        imdb_rating_min=None,
+        imdb_rating_max=None,
+        actors=None,
+    ):
+        # These expressions match the indexes on Inventory.Meta so the planner
+        # can use them; actor containment is served by the GIN index.
+        queryset = self.alias(
+            metadata_year=METADATA_YEAR, metadata_imdb_rating=METADATA_IMDB_RATING
+        )
+        if year_min is not None:
+            queryset = queryset.filter(metadata_year__gte=year_min)
+        if year_max is not None:
+            queryset = queryset.filter(metadata_year__lte=year_max)
+        if imdb_rating_min is not None:
+            queryset = queryset.filter(metadata_imdb_rating__gte=imdb_rating_min)
+        if imdb_rating_max is not None:
+            queryset = queryset.filter(metadata_imdb_rating__lte=imdb_rating_max)
+        if actors:
+            queryset = queryset.filter(metadata__contains={"actors": actors})
+        return queryset
+
+    def search(self, text: str):
+        # Full-text matches on the weighted name/actors vector, with trigram
+        # word similarity on the name to catch prefixes and typos.
+        query = SearchQuery(text, search_type="websearch", config=SEARCH_CONFIG)
+        return (
+            self.filter(
+                models.Q(search_vector=query)
+                | models.Q(name__trigram_word_similar=text)
+            )
+            .annotate(
+                rank=SearchRank(models.F("search_vector"), query)
+                + TrigramWordSimilarity(text, "name")
+            )
+            .order_by("-rank", "id")
+        )
+
+    def update_search_vector(self) -> int:
+        return self.update(search_vector=SEARCH_VECTOR)
+
+
 class Inventory(NameModel, TimestampedModel, models.Model):
     type = models.ForeignKey(
         InventoryType, on_delete=models.CASCADE, related_name="inventories"
@@ -38,9 +105,33 @@ class Inventory(NameModel, TimestampedModel, models.Model):
     )
     tags = models.ManyToManyField(InventoryTag, related_name="inventories")
     metadata = models.JSONField()
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = InventoryQuerySet.as_manager()
 
     class Meta:
         verbose_name_plural = "Inventories"
+        indexes = [
+            models.Index(
+                fields=["created_at", "id"], name="inventory_created_at_id_idx"
+            ),
+            models.Index(
+                fields=["updated_at", "id"], name="inventory_updated_at_id_idx"
+            ),
+            GinIndex(
+                fields=["metadata"],
+                opclasses=["jsonb_path_ops"],
+                name="inventory_metadata_gin_idx",
+            ),
+            models.Index(METADATA_YEAR, name="inventory_metadata_year_idx"),
+            models.Index(METADATA_IMDB_RATING, name="inventory_metadata_imdb_idx"),
+            GinIndex(fields=["search_vector"], name="inventory_search_vector_idx"),
+            GinIndex(
+                fields=["name"],
+                opclasses=["gin_trgm_ops"],
+                name="inventory_name_trgm_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -1,5 +1,10 @@
 from rest_framework import serializers
 
+from interview.core.serializers import (
+    CachedLookupSerializerMixin,
+    FastSerializer,
+    SparseFieldsetMixin,
+)
 from interview.inventory.models import (
     Inventory,
     InventoryLanguage,
@@ -14,19 +19,21 @@ class InventoryTagSerializer(serializers.ModelSerializer):
         fields = ["id", "name", "is_active"]
 
 
-class InventoryLanguageSerializer(serializers.ModelSerializer):
+class InventoryLanguageSerializer(
+    CachedLookupSerializerMixin, serializers.ModelSerializer
+):
     class Meta:
         model = InventoryLanguage
         fields = ["id", "name"]
 
 
-class InventoryTypeSerializer(serializers.ModelSerializer):
+class InventoryTypeSerializer(CachedLookupSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = InventoryType
         fields = ["id", "name"]
 
 
-class InventorySerializer(serializers.ModelSerializer):
+class InventorySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     type = InventoryTypeSerializer()
     language = InventoryLanguageSerializer()
     tags = InventoryTagSerializer(many=True)
@@ -35,3 +42,56 @@ class InventorySerializer(serializers.ModelSerializer):
     class Meta:
         model = Inventory
         fields = ["id", "name", "type", "language", "tags", "metadata"]
+
+
+class InventoryFastSerializer(FastSerializer):
+    values = ("id", "name", "type_id", "language_id", "metadata")
+
+    def to_representation(self, rows: list[dict], prefix: str = "") -> list[dict]:
+        types = self.get_lookup_map(
+            InventoryTypeSerializer, {row[f"{prefix}type_id"] for row in rows}
+        )
+        languages = self.get_lookup_map(
+            InventoryLanguageSerializer, {row[f"{prefix}language_id"] for row in rows}
+        )
+        tags = self.get_many_map(
+            Inventory.tags, InventoryTagSerializer, (row[f"{prefix}id"] for row in rows)
+        )
+
+        return [
+            {
+                "id": row[f"{prefix}id"],
+                "name": row[f"{prefix}name"],
+                "type": types[row[f"{prefix}type_id"]],
+                "language": languages[row[f"{prefix}language_id"]],
+                "tags": tags.get(row[f"{prefix}id"], []),
+                "metadata": row[f"{prefix}metadata"],
+            }
+            for row in rows
+        ]
+
+
+class InventoryBulkItemSerializer(serializers.Serializer):
+    name = serializers.CharField(max_length=255)
+    type = serializers.CharField()
+    language = serializers.CharField()
+    tags = serializers.ListField(child=serializers.CharField(), default=list)
+    metadata = serializers.DictField()
+
+
+class InventoryMetadataQuerySerializer(serializers.Serializer):
+    year_min = serializers.IntegerField(required=False)
+    year_max = serializers.IntegerField(required=False)
+    imdb_rating_min = serializers.DecimalField(
+        max_digits=5, decimal_places=2, required=False
+    )
+    imdb_rating_max = serializers.DecimalField(
+        max_digits=5, decimal_places=2, required=False
+    )
+    actor = serializers.ListField(
+        child=serializers.CharField(), required=False, source="actors"
+    )
+
+
+class InventorySearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=255)
@@ -0,0 +1,79 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from interview.core.behaviors import is_active_changed
+from interview.core.cache import response_cache
+from interview.core.models import Tombstone
+from interview.inventory.models import (
+    Inventory,
+    InventoryLanguage,
+    InventoryTag,
+    InventoryType,
+)
+
+INVENTORY_CACHE_NAMESPACE = "inventory"
+
+
+def invalidate_inventory_responses(inventory_ids=None):
+    """
+    Invalidates the cached list and the cached details of inventory_ids once
+    the current transaction commits, or every cached inventory response when
+    no ids are given.
+    """
+    if not response_cache.is_enabled():
+        return
+
+    def invalidate():
+        if inventory_ids is None:
+            response_cache.invalidate(INVENTORY_CACHE_NAMESPACE)
+            return
+        response_cache.invalidate(INVENTORY_CACHE_NAMESPACE, "list")
+        for inventory_id in inventory_ids:
+            response_cache.invalidate(INVENTORY_CACHE_NAMESPACE, str(inventory_id))
+
+    transaction.on_commit(invalidate)
+
+
+@receiver(post_delete, sender=Inventory)
+def record_inventory_tombstone(sender, instance, **kwargs):
+    Tombstone.record(instance)
+
+
+@receiver(post_save, sender=Inventory)
+def update_inventory_search_vector(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and {"name", "metadata"}.isdisjoint(update_fields):
+        return
+    Inventory.objects.filter(pk=instance.pk).update_search_vector()
+
+
+@receiver(post_save, sender=Inventory)
+@receiver(post_delete, sender=Inventory)
+def invalidate_inventory_cache(sender, instance, **kwargs):
+    invalidate_inventory_responses([instance.pk])
+
+
+@receiver(m2m_changed, sender=Inventory.tags.through)
+def invalidate_inventory_tags_cache(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        invalidate_inventory_responses([instance.pk])
+    elif pk_set is not None:
+        invalidate_inventory_responses(pk_set)
+    else:
+        invalidate_inventory_responses()
+
+
+@receiver(is_active_changed, sender=InventoryTag)
+@receiver(post_save, sender=InventoryTag)
+@receiver(post_save, sender=InventoryType)
+@receiver(post_save, sender=InventoryLanguage)
+@receiver(post_delete, sender=InventoryTag)
+@receiver(post_delete, sender=InventoryType)
+@receiver(post_delete, sender=InventoryLanguage)
+def invalidate_inventory_lookup_cache(sender, **kwargs):
+    # Lookup rows are embedded in every inventory representation.
+    invalidate_inventory_responses()
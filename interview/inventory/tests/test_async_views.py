@@ -0,0 +1,32 @@
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+
+from interview.core.cache import lookup_cache
+from interview.inventory.models import Inventory, InventoryType
+
+
+@async_to_sync
+async def get(path: str):
+    return await AsyncClient(HTTP_ACCEPT="application/json").get(path)
+
+
+def test_async_detail_with_uncached_lookup(catalogue):
+    lookup_cache.get_table(InventoryType)
+    # Created without signals, as by another process: the cached table lacks it.
+    InventoryType.objects.bulk_create([InventoryType(name="Documentary")])
+    inventory = catalogue["inventories"][0]
+    Inventory.objects.filter(pk=inventory.pk).update(
+        type=InventoryType.objects.get(name="Documentary")
+    )
+
+    response = get(f"/inventory/async/{inventory.pk}/")
+
+    assert response.status_code == 200
+    assert response.json()["type"]["name"] == "Documentary"
+
+
+def test_async_list(catalogue):
+    response = get("/inventory/async/")
+
+    assert response.status_code == 200
+    assert len(response.json()) == len(catalogue["inventories"])
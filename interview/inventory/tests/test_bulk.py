@@ -0,0 +1,107 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from interview.inventory.models import Inventory
+
+
+def item(index: int, **overrides) -> dict:
+    return {
+        "name": f"Bulk {index}",
+        "type": "Movie",
+        "language": "English",
+        "tags": ["Drama", "Comedy"] if index % 2 else ["Drama"],
+        "metadata": {
+            "year": 2000 + index,
+            "actors": [f"Actor {index}"],
+            "imdb_rating": "7.5",
+            "rotten_tomatoes_rating": 80,
+        },
+        **overrides,
+    }
+
+
+def post(api_client, items):
+    return api_client.post("/inventory/bulk/", items, content_type="application/json")
+
+
+def test_valid_batch(api_client, lookups):
+    response = post(api_client, [item(i) for i in range(4)])
+
+    assert response.status_code == 201
+    assert response.json()["errors"] == []
+    created = Inventory.objects.filter(id__in=response.json()["created"])
+    assert created.count() == 4
+    assert Inventory.tags.through.objects.filter(inventory__in=created).count() == 6
+    assert created.get(name="Bulk 1").metadata["year"] == 2001
+
+
+def test_query_count_is_constant(api_client, lookups):
+    def count_queries(size: int, offset: int) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = post(api_client, [item(offset + i) for i in range(size)])
+        assert response.status_code == 201
+        return len(context)
+
+    assert count_queries(2, 0) == count_queries(20, 100)
+
+
+@pytest.mark.parametrize(
+    "overrides,field,message",
+    [
+        ({"type": "Podcast"}, "type", "Unknown type: Podcast."),
+        ({"language": "Klingon"}, "language", "Unknown language: Klingon."),
+        ({"tags": ["Drama", "Noir"]}, "tags", "Unknown tag: Noir."),
+    ],
+)
+def test_unknown_names(api_client, lookups, overrides, field, message):
+    response = post(api_client, [item(0, **overrides)])
+
+    assert response.status_code == 400
+    assert response.json() == {
+        "created": [],
+        "errors": [{"index": 0, "errors": {field: [message]}}],
+    }
+    assert not Inventory.objects.exists()
+
+
+def test_invalid_items_do_not_abort_the_batch(api_client, lookups):
+    items = [
+        item(0),
+        item(1, metadata={"year": "unknown"}),
+        item(2, type="Podcast"),
+        item(3),
+    ]
+
+    response = post(api_client, items)
+
+    assert response.status_code == 201
+    assert [error["index"] for error in response.json()["errors"]] == [1, 2]
+    assert "metadata" in response.json()["errors"][0]["errors"]
+    assert set(Inventory.objects.values_list("name", flat=True)) == {"Bulk 0", "Bulk 3"}
+
+
+def test_failed_insert_rolls_back(api_client, lookups, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("tag links failed")
+
+    monkeypatch.setattr(Inventory.tags.through.objects, "bulk_create", fail)
+
+    with pytest.raises(RuntimeError):
+        post(api_client, [item(0), item(1)])
+
+    assert not Inventory.objects.exists()
+
+
+def test_empty_batch(api_client, lookups, django_assert_num_queries):
+    with django_assert_num_queries(0):
+        response = post(api_client, [])
+
+    assert response.status_code == 201
+    assert response.json() == {"created": [], "errors": []}
+
+
+def test_not_a_list(api_client, lookups):
+    response = post(api_client, item(0))
+
+    assert response.status_code == 400
@@ -0,0 +1,106 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from interview.core.models import Tombstone
+from interview.inventory.models import Inventory
+
+
+def poll(api_client, since):
+    response = api_client.get(
+        "/inventory/changes/", {"updated_since": since.isoformat()}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_watermark_trails_the_read(api_client, catalogue, settings):
+    settings.CHANGE_FEED_OVERLAP_SECONDS = 30
+    before = timezone.now()
+
+    data = poll(api_client, before - timedelta(hours=1))
+
+    assert len(data["changed"]) == len(catalogue["inventories"])
+    assert parse_datetime(data["until"]) <= before - timedelta(seconds=29)
+
+
+def test_watermark_never_moves_back(api_client, catalogue, settings):
+    settings.CHANGE_FEED_OVERLAP_SECONDS = 30
+    since = timezone.now() - timedelta(seconds=5)
+
+    data = poll(api_client, since)
+
+    assert parse_datetime(data["until"]) == since
+    # Rows saved within the overlap are listed again on the next poll.
+    assert len(data["changed"]) == len(catalogue["inventories"])
+
+
+def walk(api_client, since) -> list[dict]:
+    pages = [poll(api_client, since)]
+    while pages[-1]["next"]:
+        response = api_client.get(pages[-1]["next"])
+        assert response.status_code == 200
+        pages.append(response.json())
+    return pages
+
+
+def test_feed_is_paged(api_client, catalogue, settings):
+    settings.CHANGE_FEED_PAGE_SIZE = 5
+    deleted = {inventory.pk for inventory in catalogue["inventories"][:7]}
+    Inventory.objects.filter(pk__in=deleted).delete()
+
+    pages = walk(api_client, timezone.now() - timedelta(hours=1))
+
+    assert [len(page["changed"]) for page in pages] == [5, 0]
+    assert [len(page["deleted"]) for page in pages] == [5, 2]
+    assert len({page["until"] for page in pages}) == 1
+    assert {id for page in pages for id in page["deleted"]} == deleted
+
+
+def test_pages_split_rows_with_equal_timestamps(api_client, catalogue, settings):
+    settings.CHANGE_FEED_PAGE_SIZE = 5
+    # As set_active() does: one updated_at value for many rows.
+    Inventory.objects.update(updated_at=timezone.now())
+
+    pages = walk(api_client, timezone.now() - timedelta(hours=1))
+
+    ids = [row["id"] for page in pages for row in page["changed"]]
+    assert sorted(ids) == sorted(inventory.pk for inventory in catalogue["inventories"])
+    assert [len(page["changed"]) for page in pages] == [5, 5, 2]
+
+
+def test_watermark_older_than_retention(api_client, catalogue, settings):
+    settings.CHANGE_FEED_RETENTION_DAYS = 30
+
+    response = api_client.get(
+        "/inventory/changes/",
+        {"updated_since": (timezone.now() - timedelta(days=31)).isoformat()},
+    )
+
+    assert response.status_code == 410
+
+
+def test_invalid_cursor(api_client, catalogue):
+    response = api_client.get(
+        "/inventory/changes/",
+        {"updated_since": timezone.now().isoformat(), "cursor": "not-a-cursor"},
+    )
+
+    assert response.status_code == 404
+
+
+def test_purge_tombstones(catalogue, settings):
+    settings.CHANGE_FEED_RETENTION_DAYS = 30
+    old, recent = (inventory.pk for inventory in catalogue["inventories"][:2])
+    Inventory.objects.filter(pk__in=[old, recent]).delete()
+    Tombstone.objects.filter(object_id=old).update(
+        deleted_at=timezone.now() - timedelta(days=31)
+    )
+
+    call_command("purge_tombstones", stdout=StringIO())
+
+    tombstones = Tombstone.objects.filter(model="inventory.inventory")
+    assert list(tombstones.values_list("object_id", flat=True)) == [recent]
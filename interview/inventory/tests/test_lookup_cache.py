@@ -0,0 +1,92 @@
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from interview.core.cache import LookupCache, lookup_cache
+from interview.inventory.models import (
+    Inventory,
+    InventoryLanguage,
+    InventoryTag,
+    InventoryType,
+)
+from interview.inventory.serializers import InventorySerializer
+
+
+def create_elsewhere(model, name: str):
+    # bulk_create sends no signals, like a row created by another process.
+    model.objects.bulk_create([model(name=name)])
+    return model.objects.get(name=name)
+
+
+def test_get_by_name_reloads_on_miss(lookups):
+    lookup_cache.get_table(InventoryType)
+    created = create_elsewhere(InventoryType, "Documentary")
+
+    assert InventoryType.get_by_name("Documentary").pk == created.pk
+    assert InventoryType.get_by_name("Unknown") is None
+
+
+def test_serializer_reloads_on_miss(catalogue):
+    lookup_cache.get_table(InventoryLanguage)
+    lookup_cache.get_table(InventoryType)
+    created = create_elsewhere(InventoryType, "Documentary")
+    Inventory.objects.update(type=created)
+
+    queryset = InventorySerializer.setup_eager_loading(Inventory.objects.all())
+    with CaptureQueriesContext(connection) as context:
+        data = InventorySerializer(queryset, many=True).data
+
+    assert {item["type"]["name"] for item in data} == {"Documentary"}
+    # Inventory rows, prefetched tags and one reload of the type table.
+    assert len(context) == 3
+
+
+def test_tagged_list_finds_new_tag(api_client, lookups):
+    lookup_cache.get_table(InventoryTag)
+    create_elsewhere(InventoryTag, "Thriller")
+
+    response = api_client.get("/inventory/tagged/?tags=Thriller")
+
+    assert response.status_code == 200
+
+
+def test_changes_reach_other_processes(
+    lookups, settings, django_capture_on_commit_callbacks
+):
+    settings.LOOKUP_CACHE_ALIAS = "default"
+    # A second process has its own in-process tables, and shares the cache.
+    other = LookupCache()
+    movie, show = lookups["types"]
+    assert other.get(InventoryType, movie.pk).name == "Movie"
+    assert lookup_cache.get(InventoryType, movie.pk).name == "Movie"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        movie.name = "Film"
+        movie.save()
+        show.delete()
+
+    assert other.get(InventoryType, movie.pk).name == "Film"
+    assert other.get_by_name(InventoryType, "Show") is None
+
+
+def test_tables_loaded_in_a_transaction_are_not_shared(lookups, settings):
+    settings.LOOKUP_CACHE_ALIAS = "default"
+
+    # Tests run inside a transaction, whose rows may never be committed.
+    lookup_cache.get_table(InventoryType)
+
+    assert caches["default"].get(lookup_cache.get_key(InventoryType, 0)) is None
+
+
+def test_misses_reload_once_per_interval(lookups, settings, django_assert_num_queries):
+    lookup_cache.get_table(InventoryTag)
+
+    with django_assert_num_queries(1):
+        assert InventoryTag.get_by_name("Unknown") is None
+    with django_assert_num_queries(0):
+        assert InventoryTag.get_by_name("Unknown") is None
+        assert InventoryTag.get_by_name("Missing") is None
+
+    settings.LOOKUP_CACHE_MISS_INTERVAL = 0
+    with django_assert_num_queries(1):
+        assert InventoryTag.get_by_name("Unknown") is None
@@ -0,0 +1,51 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.fixture(autouse=True)
+def uncached(settings):
+    settings.RESPONSE_CACHE_ALIAS = None
+
+
+def count_queries(api_client, url: str) -> int:
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(url)
+    assert response.status_code == 200
+    return len(context)
+
+
+@pytest.mark.parametrize("fast_serializers", [False, True])
+def test_inventory_list_query_count_is_constant(
+    api_client, catalogue, settings, fast_serializers
+):
+    settings.FAST_SERIALIZERS = fast_serializers
+    # Loads the lookup tables, which later requests take from the cache.
+    api_client.get("/inventory/")
+
+    small = count_queries(api_client, "/inventory/?page_size=2")
+    large = count_queries(api_client, "/inventory/?page_size=10")
+    unpaginated = count_queries(api_client, "/inventory/")
+
+    assert small == large == unpaginated
+    assert small <= 3
+
+
+def test_inventory_list_query_count(api_client, catalogue, django_assert_num_queries):
+    api_client.get("/inventory/")
+
+    # Validators, inventory rows and prefetched tags.
+    with django_assert_num_queries(3):
+        api_client.get("/inventory/?page_size=2")
+    with django_assert_num_queries(3):
+        api_client.get("/inventory/?page_size=10")
+
+
+def test_inventory_detail_query_count_is_constant(api_client, catalogue):
+    untagged, tagged = catalogue["inventories"][0], catalogue["inventories"][3]
+    api_client.get(f"/inventory/{untagged.id}/")
+
+    assert tagged.tags.count() == 3
+    assert count_queries(api_client, f"/inventory/{untagged.id}/") == count_queries(
+        api_client, f"/inventory/{tagged.id}/"
+    )
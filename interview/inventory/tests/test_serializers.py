@@ -0,0 +1,38 @@
+from rest_framework.renderers import JSONRenderer
+
+from interview.inventory.models import Inventory
+from interview.inventory.serializers import (
+    InventoryFastSerializer,
+    InventorySerializer,
+)
+
+
+def render(serializer) -> bytes:
+    return JSONRenderer().render(serializer.data)
+
+
+def test_fast_serializer_matches_model_serializer(catalogue):
+    queryset = Inventory.objects.order_by("id")
+    tag_sets = {
+        frozenset(item.tags.values_list("is_active", flat=True)) for item in queryset
+    }
+    # Untagged items, and items with inactive tags, are both covered.
+    assert frozenset() in tag_sets and any(False in tags for tags in tag_sets)
+
+    expected = render(
+        InventorySerializer(
+            InventorySerializer.setup_eager_loading(queryset), many=True
+        )
+    )
+    actual = render(
+        InventoryFastSerializer(InventoryFastSerializer.setup_queryset(queryset))
+    )
+
+    assert actual == expected
+    assert b'"year":null' in actual
+
+
+def test_fast_serializer_renders_empty_list(db):
+    queryset = InventoryFastSerializer.setup_queryset(Inventory.objects.all())
+
+    assert render(InventoryFastSerializer(queryset)) == b"[]"
@@ -0,0 +1,113 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# In the catalogue, inventory i has the first i % 4 of Drama, Comedy and Retired.
+
+
+def with_tags(catalogue, count: int) -> list[int]:
+    # The inventories linked to at least the first count tags.
+    return sorted(
+        inventory.pk
+        for index, inventory in enumerate(catalogue["inventories"])
+        if index % 4 >= count
+    )
+
+
+def walk(api_client, url: str) -> list[list[int]]:
+    pages = []
+    while url:
+        response = api_client.get(url)
+        assert response.status_code == 200
+        pages.append([item["id"] for item in response.json()["results"]])
+        url = response.json()["next"]
+    return pages
+
+
+def through_queries(context) -> list[str]:
+    return [
+        query["sql"]
+        for query in context.captured_queries
+        if 'FROM "inventory_inventory_tags" WHERE' in query["sql"]
+    ]
+
+
+@pytest.mark.parametrize(
+    "match, names, count",
+    [
+        ("any", "Drama,Comedy", 1),
+        ("all", "Drama,Comedy", 2),
+        ("all", "Comedy,Retired", 3),
+        ("all", "Drama", 1),
+    ],
+)
+def test_match(api_client, catalogue, match, names, count):
+    response = api_client.get(f"/inventory/tagged/?tags={names}&match={match}")
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()["results"]] == with_tags(
+        catalogue, count
+    )
+
+
+def test_match_all_probes_the_other_tags(api_client, catalogue):
+    with CaptureQueriesContext(connection) as context:
+        api_client.get("/inventory/tagged/?tags=Drama,Comedy,Retired&match=all")
+
+    (query,) = through_queries(context)
+    assert query.count("EXISTS") == 2
+    assert "DISTINCT" not in query
+
+
+def test_match_any_is_distinct(api_client, catalogue):
+    with CaptureQueriesContext(connection) as context:
+        api_client.get("/inventory/tagged/?tags=Drama,Comedy")
+
+    (query,) = through_queries(context)
+    assert "DISTINCT" in query
+    assert "EXISTS" not in query
+
+
+def test_pages_cross_tag_boundaries(api_client, catalogue):
+    # Inventories with both tags have two links, but are listed once.
+    pages = walk(api_client, "/inventory/tagged/?tags=Comedy,Drama&page_size=2")
+
+    assert [id for page in pages for id in page] == with_tags(catalogue, 1)
+    assert [len(page) for page in pages] == [2, 2, 2, 2, 1]
+
+
+def test_tag_inventory_pages(api_client, catalogue):
+    comedy = catalogue["inventory_tags"][1]
+
+    pages = walk(api_client, f"/inventory/tags/{comedy.pk}/inventory/?page_size=4")
+
+    assert [id for page in pages for id in page] == with_tags(catalogue, 2)
+    assert [len(page) for page in pages] == [4, 2]
+
+
+def test_inventory_tags(api_client, catalogue):
+    inventory = catalogue["inventories"][3]
+
+    response = api_client.get(f"/inventory/{inventory.pk}/tags/")
+
+    assert [item["name"] for item in response.json()["results"]] == [
+        "Drama",
+        "Comedy",
+        "Retired",
+    ]
+
+
+def test_unknown_tags(api_client, catalogue):
+    response = api_client.get("/inventory/tagged/?tags=Drama,Horror,Western")
+
+    assert response.status_code == 400
+    assert response.json() == {
+        "tags": ["Unknown tag: Horror.", "Unknown tag: Western."]
+    }
+
+
+def test_tags_are_required(api_client, catalogue):
+    response = api_client.get("/inventory/tagged/?tags=,")
+
+    assert response.status_code == 400
+    assert response.json() == {"tags": ["Provide at least one tag."]}
@@ -1,11 +1,21 @@
 from django.urls import path
 from interview.inventory.views import (
+    InventoryAsyncDetailView,
+    InventoryAsyncListView,
+    InventoryBulkCreateView,
+    InventoryChangeFeedView,
+    InventoryExportView,
     InventoryLanguageListCreateView,
     InventoryLanguageRetrieveUpdateDestroyView,
     InventoryListCreateView,
     InventoryRetrieveUpdateDestroyView,
+    InventorySearchView,
     InventoryTagListCreateView,
     InventoryTagRetrieveUpdateDestroyView,
+    InventoryTagInventoryListView,
+    InventoryTagSetActiveView,
+    InventoryTaggedListView,
+    InventoryTagsListView,
     InventoryTypeListCreateView,
     InventoryTypeRetrieveUpdateDestroyView,
 )
@@ -38,7 +48,29 @@ urlpatterns = [
         InventoryLanguageListCreateView.as_view(),
         name="inventory-languages-list",
     ),
+    path(
+        "tags/<int:id>/inventory/",
+        InventoryTagInventoryListView.as_view(),
+        name="inventory-tag-inventory",
+    ),
+    path("<int:id>/tags/", InventoryTagsListView.as_view(), name="inventory-tags"),
+    path("tagged/", InventoryTaggedListView.as_view(), name="inventory-tagged"),
+    path(
+        "tags/active/",
+        InventoryTagSetActiveView.as_view(),
+        name="inventory-tags-active",
+    ),
     path("tags/", InventoryTagListCreateView.as_view(), name="inventory-tags-list"),
     path("types/", InventoryTypeListCreateView.as_view(), name="inventory-types-list"),
+    path("bulk/", InventoryBulkCreateView.as_view(), name="inventory-bulk"),
+    path("changes/", InventoryChangeFeedView.as_view(), name="inventory-changes"),
+    path("export/", InventoryExportView.as_view(), name="inventory-export"),
+    path("search/", InventorySearchView.as_view(), name="inventory-search"),
+    path(
+        "async/<int:id>/",
+        InventoryAsyncDetailView.as_view(),
+        name="inventory-async-detail",
+    ),
+    path("async/", InventoryAsyncListView.as_view(), name="inventory-async-list"),
     path("", InventoryListCreateView.as_view(), name="inventory-list"),
 ]
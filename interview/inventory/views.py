@@ -1,7 +1,28 @@
+from itertools import islice
+
+from django.http import HttpResponse, StreamingHttpResponse
+from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework.views import APIView
 
+from interview.core.conditional import (
+    cache_response,
+    conditional_get,
+    get_queryset_validators,
+)
+from interview.core.pagination import KeysetPagination
+from interview.core.renderers import FastJSONRenderer
+from interview.core.views import (
+    AsyncReadView,
+    ChangeFeedView,
+    FastSerializerViewMixin,
+    LookupManyToManyListView,
+    ManyToManyListView,
+    SetActiveView,
+    SparseFieldsetViewMixin,
+)
+from interview.inventory.bulk import bulk_create_inventory
 from interview.inventory.models import (
     Inventory,
     InventoryLanguage,
@@ -9,17 +30,26 @@ from interview.inventory.models import (
     InventoryType,
 )
 from interview.inventory.schemas import InventoryMetaData
+from interview.inventory.signals import INVENTORY_CACHE_NAMESPACE
 from interview.inventory.serializers import (
+    InventoryFastSerializer,
     InventoryLanguageSerializer,
+    InventoryMetadataQuerySerializer,
+    InventorySearchQuerySerializer,
     InventorySerializer,
     InventoryTagSerializer,
     InventoryTypeSerializer,
 )
 
+INVENTORY_LOOKUP_MODELS = [InventoryType, InventoryLanguage, InventoryTag]
 
-class InventoryListCreateView(APIView):
+
+class InventoryListCreateView(FastSerializerViewMixin, APIView):
     queryset = Inventory.objects.all()
     serializer_class = InventorySerializer
+    fast_serializer_class = InventoryFastSerializer
+    pagination_class = KeysetPagination
+    cache_namespace = INVENTORY_CACHE_NAMESPACE
 
     def post(self, request: Request, *args, **kwargs) -> Response:
         try:
@@ -36,22 +66,46 @@ class InventoryListCreateView(APIView):
 
         return Response(serializer.data, status=201)
 
+    @cache_response
+    @conditional_get
     def get(self, request: Request, *args, **kwargs) -> Response:
-        serializer = self.serializer_class(self.get_queryset(), many=True)
+        queryset = self.get_queryset()
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        if page is not None:
+            serializer = self.get_list_serializer(page)
+            return paginator.get_paginated_response(serializer.data)
+
+        serializer = self.get_list_serializer(queryset)
 
         return Response(serializer.data, status=200)
 
     def get_queryset(self):
-        return self.queryset.all()
+        query = InventoryMetadataQuerySerializer(data=self.request.query_params)
+        query.is_valid(raise_exception=True)
+        queryset = self.queryset.filter_metadata(**query.validated_data)
+
+        return self.setup_queryset(queryset)
+
+    def get_validators(self, request: Request, *args, **kwargs):
+        return get_queryset_validators(
+            request, self.queryset.all(), lookup_models=INVENTORY_LOOKUP_MODELS
+        )
+
+    def get_cache_scope(self, request: Request, *args, **kwargs) -> str:
+        return "list"
 
 
-class InventoryRetrieveUpdateDestroyView(APIView):
+class InventoryRetrieveUpdateDestroyView(SparseFieldsetViewMixin, APIView):
     queryset = Inventory.objects.all()
     serializer_class = InventorySerializer
+    cache_namespace = INVENTORY_CACHE_NAMESPACE
 
+    @cache_response
+    @conditional_get
     def get(self, request: Request, *args, **kwargs) -> Response:
         inventory = self.get_queryset(id=kwargs["id"])
-        serializer = self.serializer_class(inventory)
+        serializer = self.serializer_class(inventory, **self.get_fieldset_kwargs())
 
         return Response(serializer.data, status=200)
 
@@ -72,7 +126,132 @@ class InventoryRetrieveUpdateDestroyView(APIView):
         return Response(status=204)
 
     def get_queryset(self, **kwargs):
-        return self.queryset.get(**kwargs)
+        return self.setup_queryset(self.queryset).get(**kwargs)
+
+    def get_validators(self, request: Request, *args, **kwargs):
+        return get_queryset_validators(
+            request,
+            self.queryset.filter(id=kwargs["id"]),
+            lookup_models=INVENTORY_LOOKUP_MODELS,
+        )
+
+    def get_cache_scope(self, request: Request, *args, **kwargs) -> str:
+        return str(kwargs["id"])
+
+
+class InventoryAsyncListView(AsyncReadView):
+    queryset = Inventory.objects.all()
+    serializer_class = InventorySerializer
+    pagination_class = KeysetPagination
+    lookup_models = INVENTORY_LOOKUP_MODELS
+
+    @conditional_get
+    async def get(self, request, *args, **kwargs) -> HttpResponse:
+        query = InventoryMetadataQuerySerializer(data=self.request.query_params)
+        query.is_valid(raise_exception=True)
+        queryset = self.queryset.filter_metadata(**query.validated_data)
+
+        return await self.render_list(self.setup_queryset(queryset))
+
+    def get_validators(self, request, *args, **kwargs):
+        return get_queryset_validators(
+            request, self.queryset.all(), lookup_models=INVENTORY_LOOKUP_MODELS
+        )
+
+
+class InventoryAsyncDetailView(AsyncReadView):
+    queryset = Inventory.objects.all()
+    serializer_class = InventorySerializer
+    lookup_models = INVENTORY_LOOKUP_MODELS
+
+    @conditional_get
+    async def get(self, request, *args, **kwargs) -> HttpResponse:
+        return await self.render_object(
+            self.setup_queryset(self.queryset), id=kwargs["id"]
+        )
+
+    def get_validators(self, request, *args, **kwargs):
+        return get_queryset_validators(
+            request,
+            self.queryset.filter(id=kwargs["id"]),
+            lookup_models=INVENTORY_LOOKUP_MODELS,
+        )
+
+
+class InventoryBulkCreateView(APIView):
+    queryset = Inventory.objects.all()
+
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        if not isinstance(request.data, list):
+            return Response({"error": "Expected a list of items."}, status=400)
+
+        created, errors = bulk_create_inventory(request.data)
+
+        # An empty batch is a no-op; only batches with nothing but invalid
+        # items are rejected.
+        return Response(
+            {"created": [inventory.id for inventory in created], "errors": errors},
+            status=400 if errors and not created else 201,
+        )
+
+
+class InventoryChangeFeedView(ChangeFeedView):
+    queryset = Inventory.objects.all()
+    serializer_class = InventorySerializer
+    fast_serializer_class = InventoryFastSerializer
+
+
+class InventorySearchPagination(LimitOffsetPagination):
+    default_limit = 20
+    max_limit = 100
+
+
+class InventorySearchView(FastSerializerViewMixin, APIView):
+    queryset = Inventory.objects.all()
+    serializer_class = InventorySerializer
+    fast_serializer_class = InventoryFastSerializer
+    pagination_class = InventorySearchPagination
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        query = InventorySearchQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(
+            self.get_queryset(query.validated_data["q"]), request, view=self
+        )
+        serializer = self.get_list_serializer(page)
+
+        return paginator.get_paginated_response(serializer.data)
+
+    def get_queryset(self, text: str):
+        return self.setup_queryset(self.queryset.search(text))
+
+
+class InventoryExportView(FastSerializerViewMixin, APIView):
+    queryset = Inventory.objects.all()
+    serializer_class = InventorySerializer
+    fast_serializer_class = InventoryFastSerializer
+    renderer = FastJSONRenderer()
+    chunk_size = 2000
+
+    def get(self, request: Request, *args, **kwargs) -> StreamingHttpResponse:
+        return StreamingHttpResponse(
+            self.stream(self.get_queryset()), content_type="application/x-ndjson"
+        )
+
+    def stream(self, queryset):
+        # Tags are prefetched once per chunk by the iterator, so memory stays
+        # bounded by chunk_size no matter how large the catalogue is.
+        rows = queryset.iterator(chunk_size=self.chunk_size)
+        while chunk := list(islice(rows, self.chunk_size)):
+            serializer = self.get_list_serializer(chunk)
+            yield b"".join(
+                self.renderer.render(item) + b"\n" for item in serializer.data
+            )
+
+    def get_queryset(self):
+        return self.setup_queryset(self.queryset.order_by("id"))
 
 
 class InventoryTagListCreateView(APIView):
@@ -129,6 +308,39 @@ class InventoryTagRetrieveUpdateDestroyView(APIView):
         return self.queryset.get(**kwargs)
 
 
+class InventoryTagInventoryListView(ManyToManyListView):
+    queryset = Inventory.objects.all()
+    serializer_class = InventorySerializer
+    fast_serializer_class = InventoryFastSerializer
+    m2m_field = Inventory.tags.field
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        return self.list_related([kwargs["id"]])
+
+
+class InventoryTaggedListView(ManyToManyListView):
+    queryset = Inventory.objects.all()
+    serializer_class = InventorySerializer
+    fast_serializer_class = InventoryFastSerializer
+    m2m_field = Inventory.tags.field
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        return self.list_related(*self.get_tag_ids(InventoryTag))
+
+
+class InventoryTagsListView(LookupManyToManyListView):
+    queryset = InventoryTag.objects.all()
+    serializer_class = InventoryTagSerializer
+    m2m_field = Inventory.tags.field
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        return self.list_related([kwargs["id"]])
+
+
+class InventoryTagSetActiveView(SetActiveView):
+    queryset = InventoryTag.objects.all()
+
+
 class InventoryLanguageListCreateView(APIView):
     queryset = InventoryLanguage.objects.all()
     serializer_class = InventoryLanguageSerializer
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class OrderConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "interview.order"
+
+    def ready(self):
+        from interview.order import signals  # noqa: F401
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from interview.order import read_model
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the denormalized order read model, with --stale renders only the "
+        "rows flagged as stale, or with --check compares it with the orders it was "
+        "built from and fails on any difference."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Report missing, stale and orphaned rows instead of rebuilding.",
+        )
+        parser.add_argument(
+            "--stale",
+            action="store_true",
+            help="Render the rows flagged as stale, a batch per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        if options["stale"]:
+            written = read_model.refresh_stale()
+            self.stdout.write(f"Refreshed {written} stale order read model rows.")
+            return
+
+        if not options["check"]:
+            with transaction.atomic():
+                written = read_model.rebuild()
+            self.stdout.write(f"Rebuilt {written} order read model rows.")
+            return
+
+        result = read_model.check()
+        for problem, ids in result.items():
+            if ids:
+                sample = ", ".join(map(str, ids[:20]))
+                more = f" and {len(ids) - 20} more" if len(ids) > 20 else ""
+                self.stdout.write(f"{problem}: {len(ids)} ({sample}{more})")
+        if any(result.values()):
+            raise CommandError(
+                "The order read model is out of date; run order_read_model to rebuild it."
+            )
+        self.stdout.write("The order read model is up to date.")
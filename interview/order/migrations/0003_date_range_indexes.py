@@ -0,0 +1,31 @@
+# Generated by Django 4.1.7 on 2026-10-18 09:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0002_created_at_id_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["start_date", "embargo_date"], name="order_start_embargo_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(fields=["embargo_date"], name="order_embargo_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["start_date", "embargo_date"],
+                name="order_active_start_embargo_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("order", "0004_updated_at_id_index"),
+    ]
+
+    operations = [
+        # The unique (order_id, ordertag_id) constraint serves order -> tags;
+        # this serves tag -> orders as an ordered, index-only range scan.
+        migrations.RunSQL(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS order_tags_tag_order_idx "
+            "ON order_order_tags (ordertag_id, order_id)",
+            "DROP INDEX CONCURRENTLY IF EXISTS order_tags_tag_order_idx",
+        ),
+    ]
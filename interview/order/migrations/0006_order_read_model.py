@@ -0,0 +1,32 @@
+# Generated by Django 4.1.7 on 2026-10-18 10:26
+
+from django.db import migrations, models
+
+
+# The table starts out empty: rendering it needs the current serializers rather
+# than historical models, so run "manage.py order_read_model" after migrating
+# (start.sh does so through the seed command).
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0005_order_tags_reverse_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrderReadModel",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("created_at", models.DateTimeField()),
+                ("representation", models.TextField()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="orderreadmodel",
+            index=models.Index(
+                fields=["created_at", "id"], name="order_read_created_at_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.1.7 on 2026-10-18 16:02
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0006_order_read_model"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="orderreadmodel",
+            name="is_stale",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="orderreadmodel",
+            name="refreshed_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name="orderreadmodel",
+            index=models.Index(
+                condition=models.Q(("is_stale", True)),
+                fields=["id"],
+                name="order_read_stale_idx",
+            ),
+        ),
+    ]
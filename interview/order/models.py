@@ -17,5 +17,48 @@ class Order(TimestampedModel, IsActiveModel, models.Model):
     embargo_date = models.DateField()
     tags = models.ManyToManyField(OrderTag, related_name="orders")
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="order_created_at_id_idx"),
+            models.Index(fields=["updated_at", "id"], name="order_updated_at_id_idx"),
+            models.Index(
+                fields=["start_date", "embargo_date"], name="order_start_embargo_idx"
+            ),
+            models.Index(fields=["embargo_date"], name="order_embargo_date_idx"),
+            models.Index(
+                fields=["start_date", "embargo_date"],
+                condition=models.Q(is_active=True),
+                name="order_active_start_embargo_idx",
+            ),
+        ]
+
     def __str__(self) -> str:
         return f"{self.inventory.name} - {self.start_date}"
+
+
+class OrderReadModel(models.Model):
+    """
+    The list representation of each order, rendered once and kept in sync by
+    the receivers in interview.order.signals, so listing orders reads a single
+    table. Rows flagged is_stale are waiting to be rendered again by
+    interview.order.read_model.refresh_stale(). Rebuild or check it with the
+    order_read_model command.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    created_at = models.DateTimeField()
+    representation = models.TextField()
+    refreshed_at = models.DateTimeField()
+    is_stale = models.BooleanField(default=False)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["created_at", "id"], name="order_read_created_at_id_idx"
+            ),
+            models.Index(
+                fields=["id"],
+                condition=models.Q(is_stale=True),
+                name="order_read_stale_idx",
+            ),
+        ]
@@ -0,0 +1,169 @@
+import json
+import logging
+import threading
+from itertools import islice
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from interview.core.routers import use_primary
+from interview.order.models import Order, OrderReadModel
+from interview.order.serializers import OrderFastSerializer
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+
+def batched(iterable, size: int):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def build_rows(queryset) -> list[OrderReadModel]:
+    rows = list(OrderFastSerializer.setup_queryset(queryset, ("created_at",)))
+    if not rows:
+        return []
+
+    # Lookup names are read from the database rather than this process's lookup
+    # cache, which may not have seen another process's rename yet.
+    representations = OrderFastSerializer(use_lookup_cache=False).to_representation(
+        rows
+    )
+    refreshed_at = timezone.now()
+    return [
+        OrderReadModel(
+            id=row["id"],
+            created_at=row["created_at"],
+            representation=json.dumps(representation, cls=DjangoJSONEncoder),
+            refreshed_at=refreshed_at,
+        )
+        for row, representation in zip(rows, representations)
+    ]
+
+
+def refresh_orders(order_ids) -> int:
+    """
+    Rewrites the read model rows of order_ids, any iterable, and drops those
+    whose order no longer exists. Returns the number of rows written.
+    """
+    written = 0
+    with use_primary():
+        for ids in batched(order_ids, BATCH_SIZE):
+            rows = build_rows(Order.objects.filter(id__in=ids))
+            # is_stale is left alone: a flag set by a concurrent change this
+            # render may predate is only cleared by refresh_stale().
+            OrderReadModel.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=["id"],
+                update_fields=["created_at", "representation", "refreshed_at"],
+            )
+            OrderReadModel.objects.filter(
+                id__in=set(ids) - {row.id for row in rows}
+            ).delete()
+            written += len(rows)
+    return written
+
+
+def mark_stale(orders) -> int:
+    """
+    Flags the read model rows of the orders queryset with a single UPDATE and,
+    with ORDER_READ_MODEL_BACKGROUND_REFRESH, renders them again after commit.
+    """
+    count = OrderReadModel.objects.filter(id__in=orders.values("id")).update(
+        is_stale=True
+    )
+    if count and settings.ORDER_READ_MODEL_BACKGROUND_REFRESH:
+        transaction.on_commit(schedule_refresh)
+    return count
+
+
+def refresh_stale() -> int:
+    """
+    Renders flagged rows again, a batch per transaction, until none are left.
+    Rows locked by another process's refresh are skipped. Returns the number of
+    rows written.
+    """
+    written = 0
+    while True:
+        with transaction.atomic():
+            ids = list(
+                OrderReadModel.objects.filter(is_stale=True)
+                .select_for_update(skip_locked=True)
+                .values_list("id", flat=True)[:BATCH_SIZE]
+            )
+            if not ids:
+                return written
+            written += refresh_orders(ids)
+            OrderReadModel.objects.filter(id__in=ids).update(is_stale=False)
+
+
+refresh_requested = threading.Event()
+refresh_running = threading.Lock()
+
+
+def schedule_refresh():
+    # One refresh thread per process; a request made while it runs makes it go
+    # round again.
+    refresh_requested.set()
+    if refresh_running.acquire(blocking=False):
+        threading.Thread(target=refresh_in_background, daemon=True).start()
+
+
+def refresh_in_background():
+    try:
+        while refresh_requested.is_set():
+            refresh_requested.clear()
+            refresh_stale()
+    except Exception:
+        # The rows stay flagged for the next refresh or order_read_model --stale.
+        logger.exception("Refreshing stale order read model rows failed")
+    finally:
+        connections.close_all()
+        refresh_running.release()
+    if refresh_requested.is_set():
+        schedule_refresh()
+
+
+def orphans():
+    # An anti-join: NOT IN (SELECT ...) would be run as a subplan per row.
+    return OrderReadModel.objects.filter(
+        ~Exists(Order.objects.filter(pk=OuterRef("pk")))
+    )
+
+
+def rebuild() -> int:
+    order_ids = Order.objects.order_by("id").values_list("id", flat=True)
+    written = refresh_orders(order_ids.iterator(chunk_size=BATCH_SIZE))
+    orphans().delete()
+    refresh_stale()
+    return written
+
+
+def check() -> dict[str, list[int]]:
+    """
+    Compares the read model with freshly rendered rows, listing the ids of
+    orders with no row ("missing"), rows that differ or are flagged for a
+    refresh ("stale") and rows whose order no longer exists ("orphaned").
+    """
+    result = {"missing": [], "stale": [], "orphaned": []}
+    order_ids = Order.objects.order_by("id").values_list("id", flat=True)
+    for ids in batched(order_ids.iterator(chunk_size=BATCH_SIZE), BATCH_SIZE):
+        stored = OrderReadModel.objects.in_bulk(ids)
+        for row in build_rows(Order.objects.filter(id__in=ids)):
+            current = stored.get(row.id)
+            if current is None:
+                result["missing"].append(row.id)
+            elif current.is_stale or (current.created_at, current.representation) != (
+                row.created_at,
+                row.representation,
+            ):
+                result["stale"].append(row.id)
+
+    result["orphaned"] = list(orphans().order_by("id").values_list("id", flat=True))
+    return result
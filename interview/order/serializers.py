@@ -1,5 +1,15 @@
+import json
+
 from rest_framework import serializers
-from interview.inventory.serializers import InventorySerializer
+from interview.core.serializers import (
+    FastSerializer,
+    SetActiveSerializer,
+    SparseFieldsetMixin,
+)
+from interview.inventory.serializers import (
+    InventoryFastSerializer,
+    InventorySerializer,
+)
 from datetime import datetime
 
 from interview.order.models import Order, OrderTag
@@ -11,10 +21,82 @@ class OrderTagSerializer(serializers.ModelSerializer):
         fields = ["id", "name", "is_active"]
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     inventory = InventorySerializer()
     tags = OrderTagSerializer(many=True)
 
     class Meta:
         model = Order
         fields = ["id", "inventory", "start_date", "embargo_date", "tags", "is_active"]
+
+
+class OrderFastSerializer(FastSerializer):
+    values = (
+        "id",
+        "start_date",
+        "embargo_date",
+        "is_active",
+        *(f"inventory__{value}" for value in InventoryFastSerializer.values),
+    )
+
+    def to_representation(self, rows: list[dict]) -> list[dict]:
+        inventories = InventoryFastSerializer(
+            use_lookup_cache=self.use_lookup_cache
+        ).to_representation(rows, prefix="inventory__")
+        tags = self.get_many_map(
+            Order.tags, OrderTagSerializer, (row["id"] for row in rows)
+        )
+
+        return [
+            {
+                "id": row["id"],
+                "inventory": inventory,
+                "start_date": row["start_date"].isoformat(),
+                "embargo_date": row["embargo_date"].isoformat(),
+                "tags": tags.get(row["id"], []),
+                "is_active": row["is_active"],
+            }
+            for row, inventory in zip(rows, inventories)
+        ]
+
+
+class OrderReadModelSerializer(FastSerializer):
+    """
+    Lists orders from the representations stored in OrderReadModel.
+    """
+
+    values = ("representation",)
+
+    def to_representation(self, rows: list[dict]) -> list[dict]:
+        return [json.loads(row["representation"]) for row in rows]
+
+
+class OrderDateRangeQuerySerializer(serializers.Serializer):
+    start_date_after = serializers.DateField(required=False)
+    start_date_before = serializers.DateField(required=False)
+    embargo_date_after = serializers.DateField(required=False)
+    embargo_date_before = serializers.DateField(required=False)
+    is_active = serializers.BooleanField(required=False)
+
+    def validate(self, attrs):
+        return validate_date_ranges(attrs)
+
+
+class OrderSetActiveSerializer(SetActiveSerializer):
+    start_date_after = serializers.DateField(required=False)
+    start_date_before = serializers.DateField(required=False)
+    embargo_date_after = serializers.DateField(required=False)
+    embargo_date_before = serializers.DateField(required=False)
+
+    def validate(self, attrs):
+        return super().validate(validate_date_ranges(attrs))
+
+
+def validate_date_ranges(attrs: dict) -> dict:
+    for field in ("start_date", "embargo_date"):
+        after, before = attrs.get(f"{field}_after"), attrs.get(f"{field}_before")
+        if after and before and after > before:
+            raise serializers.ValidationError(
+                {f"{field}_before": f"Must not be earlier than {field}_after."}
+            )
+    return attrs
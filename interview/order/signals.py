@@ -0,0 +1,123 @@
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from interview.core.behaviors import is_active_changed
+from interview.core.models import Tombstone
+from interview.inventory.models import (
+    Inventory,
+    InventoryLanguage,
+    InventoryTag,
+    InventoryType,
+)
+from interview.order import read_model
+from interview.order.models import Order, OrderReadModel, OrderTag
+
+# Changes to given orders or inventories are rendered into the read model inside
+# the writing transaction, so they commit, or roll back, together. Changes that
+# can touch any number of orders (lookup renames, set_active(), tag deletes and
+# reverse clears) only flag the affected rows in one UPDATE; they are rendered
+# again by read_model.refresh_stale() after commit.
+
+# The orders each lookup model reaches, and the fields their representation shows.
+LOOKUPS = {
+    OrderTag: ("tags", ("name", "is_active")),
+    InventoryTag: ("inventory__tags", ("name", "is_active")),
+    InventoryType: ("inventory__type", ("name",)),
+    InventoryLanguage: ("inventory__language", ("name",)),
+}
+
+
+def refresh_orders(**lookups):
+    read_model.refresh_orders(
+        Order.objects.filter(**lookups).values_list("id", flat=True)
+    )
+
+
+def mark_stale(**lookups):
+    read_model.mark_stale(Order.objects.filter(**lookups))
+
+
+@receiver(post_delete, sender=Order)
+def record_order_tombstone(sender, instance, **kwargs):
+    Tombstone.record(instance)
+
+
+@receiver(post_save, sender=Order)
+def refresh_order_read_model(sender, instance, **kwargs):
+    read_model.refresh_orders([instance.pk])
+
+
+@receiver(post_delete, sender=Order)
+def delete_order_read_model(sender, instance, **kwargs):
+    OrderReadModel.objects.filter(pk=instance.pk).delete()
+
+
+@receiver(m2m_changed, sender=Order.tags.through)
+@receiver(m2m_changed, sender=Inventory.tags.through)
+def refresh_m2m_order_read_model(sender, instance, action, reverse, pk_set, **kwargs):
+    inventory = sender is Inventory.tags.through
+    if reverse and action == "pre_clear":
+        # A reverse clear removes links we can no longer find afterwards.
+        mark_stale(**{"inventory__tags" if inventory else "tags": instance})
+    elif action in ("post_add", "post_remove") or (
+        action == "post_clear" and not reverse
+    ):
+        ids = pk_set if reverse else [instance.pk]
+        if inventory:
+            refresh_orders(inventory__in=ids)
+        else:
+            read_model.refresh_orders(ids)
+
+
+@receiver(post_save, sender=Inventory)
+def refresh_inventory_order_read_model(sender, instance, **kwargs):
+    refresh_orders(inventory=instance)
+
+
+@receiver(pre_save, sender=OrderTag)
+@receiver(pre_save, sender=InventoryTag)
+@receiver(pre_save, sender=InventoryType)
+@receiver(pre_save, sender=InventoryLanguage)
+def compare_lookup_order_read_model(sender, instance, using, **kwargs):
+    # Only a change to a field the orders show makes their rows stale; new
+    # lookups are not referenced by any order yet.
+    fields = LOOKUPS[sender][1]
+    previous = (
+        sender.objects.using(using).filter(pk=instance.pk).values(*fields).first()
+        if instance.pk
+        else None
+    )
+    instance._read_model_changed = previous is not None and any(
+        previous[field] != getattr(instance, field) for field in fields
+    )
+
+
+@receiver(post_save, sender=OrderTag)
+@receiver(post_save, sender=InventoryTag)
+@receiver(post_save, sender=InventoryType)
+@receiver(post_save, sender=InventoryLanguage)
+def mark_lookup_order_read_model(sender, instance, **kwargs):
+    if instance.__dict__.pop("_read_model_changed", False):
+        mark_stale(**{LOOKUPS[sender][0]: instance})
+
+
+@receiver(is_active_changed, sender=Order)
+@receiver(is_active_changed, sender=OrderTag)
+@receiver(is_active_changed, sender=InventoryTag)
+def mark_active_order_read_model(sender, updated_at, **kwargs):
+    # set_active() writes one updated_at value to every row it changes.
+    lookup = "updated_at" if sender is Order else f"{LOOKUPS[sender][0]}__updated_at"
+    mark_stale(**{lookup: updated_at})
+
+
+@receiver(pre_delete, sender=OrderTag)
+@receiver(pre_delete, sender=InventoryTag)
+def mark_tag_order_read_model(sender, instance, **kwargs):
+    # Deleting a tag deletes its links without an m2m_changed signal.
+    mark_stale(**{LOOKUPS[sender][0]: instance})
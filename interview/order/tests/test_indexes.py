@@ -0,0 +1,73 @@
+from datetime import date, timedelta
+
+import pytest
+from django.db import connection
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from interview.inventory.models import Inventory
+from interview.order.models import Order
+from interview.order.views import OrderDateRangeListView
+
+
+@pytest.fixture
+def orders(lookups):
+    inventory = Inventory.objects.create(
+        name="Title",
+        type=lookups["types"][0],
+        language=lookups["languages"][0],
+        metadata={},
+    )
+    # bulk_create skips the read model signals, which these tests do not need.
+    first = date(2000, 1, 1)
+    Order.objects.bulk_create(
+        [
+            Order(
+                inventory=inventory,
+                start_date=first + timedelta(days=i % 7300),
+                embargo_date=first + timedelta(days=i % 7300 + i % 90),
+                is_active=i % 10 != 0,
+            )
+            for i in range(20000)
+        ]
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE order_order")
+
+
+def explain(query: dict) -> str:
+    view = OrderDateRangeListView()
+    view.setup(Request(APIRequestFactory().get("/orders/dates/", query)))
+    view.format_kwarg = None
+    return view.get_queryset().explain()
+
+
+@pytest.mark.parametrize(
+    "query,index",
+    [
+        (
+            {"start_date_after": "2010-01-01", "start_date_before": "2010-01-31"},
+            "order_start_embargo_idx",
+        ),
+        (
+            {
+                "start_date_after": "2010-01-01",
+                "start_date_before": "2010-01-31",
+                "embargo_date_before": "2010-02-15",
+            },
+            "order_start_embargo_idx",
+        ),
+        (
+            {
+                "start_date_after": "2010-01-01",
+                "start_date_before": "2010-01-31",
+                "is_active": "true",
+            },
+            "order_active_start_embargo_idx",
+        ),
+    ],
+)
+def test_date_range_uses_index(orders, query, index):
+    plan = explain(query)
+
+    assert index in plan, plan
@@ -0,0 +1,55 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def count_queries(api_client, url: str) -> int:
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(url)
+    assert response.status_code == 200
+    return len(context)
+
+
+@pytest.mark.parametrize(
+    "read_model,fast_serializers", [(False, False), (False, True), (True, False)]
+)
+def test_order_list_query_count_is_constant(
+    api_client, catalogue, settings, read_model, fast_serializers
+):
+    settings.ORDER_READ_MODEL = read_model
+    settings.FAST_SERIALIZERS = fast_serializers
+    api_client.get("/orders/")
+
+    small = count_queries(api_client, "/orders/?page_size=2")
+    large = count_queries(api_client, "/orders/?page_size=10")
+    unpaginated = count_queries(api_client, "/orders/")
+
+    assert small == large == unpaginated
+    assert small <= 4
+
+
+def test_order_list_query_count(
+    api_client, catalogue, settings, django_assert_num_queries
+):
+    settings.ORDER_READ_MODEL = False
+    api_client.get("/orders/")
+
+    # Validators, order rows joined to inventory, and the order and inventory
+    # tag prefetches.
+    with django_assert_num_queries(4):
+        api_client.get("/orders/?page_size=2")
+    with django_assert_num_queries(4):
+        api_client.get("/orders/?page_size=10")
+
+
+def test_order_read_model_list_query_count(
+    api_client, catalogue, settings, django_assert_num_queries
+):
+    settings.ORDER_READ_MODEL = True
+    api_client.get("/orders/")
+
+    # Validators and the read model rows.
+    with django_assert_num_queries(2):
+        api_client.get("/orders/?page_size=2")
+    with django_assert_num_queries(2):
+        api_client.get("/orders/?page_size=10")
@@ -0,0 +1,115 @@
+import json
+
+import pytest
+from django.utils import timezone
+
+from interview.core.cache import lookup_cache
+from interview.inventory.models import InventoryLanguage
+from interview.order import read_model
+from interview.order.models import OrderReadModel
+
+UP_TO_DATE = {"missing": [], "stale": [], "orphaned": []}
+
+
+@pytest.fixture(autouse=True)
+def no_background_refresh(settings):
+    # A refresh thread could not see the test's uncommitted rows.
+    settings.ORDER_READ_MODEL_BACKGROUND_REFRESH = False
+
+
+def stale_ids() -> set[int]:
+    return set(
+        OrderReadModel.objects.filter(is_stale=True).values_list("id", flat=True)
+    )
+
+
+def language_names() -> set[str]:
+    return {
+        json.loads(representation)["inventory"]["language"]["name"]
+        for representation in OrderReadModel.objects.values_list(
+            "representation", flat=True
+        )
+    }
+
+
+def test_rows_read_lookups_from_the_database(catalogue):
+    lookup_cache.get_table(InventoryLanguage)
+    # Renamed without signals, as by another process: the cached table is stale.
+    InventoryLanguage.objects.filter(name="French").update(name="Français")
+
+    read_model.refresh_orders(order.pk for order in catalogue["orders"])
+
+    assert language_names() == {"English", "Français"}
+
+
+def test_lookup_rename_marks_orders_stale(catalogue):
+    language = catalogue["languages"][1]
+    language.name = "Français"
+    language.save()
+
+    expected = {
+        order.pk
+        for order in catalogue["orders"]
+        if order.inventory.language_id == language.pk
+    }
+    assert stale_ids() == expected
+    assert language_names() == {"English", "French"}
+    assert read_model.check()["stale"] == sorted(expected)
+
+    assert read_model.refresh_stale() == len(expected)
+    assert stale_ids() == set()
+    assert language_names() == {"English", "Français"}
+    assert read_model.check() == UP_TO_DATE
+
+
+def test_unchanged_lookup_save_keeps_rows(
+    catalogue, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks() as callbacks:
+        catalogue["languages"][1].save()
+        catalogue["order_tags"][0].save()
+
+    assert stale_ids() == set()
+    assert callbacks == []
+
+
+def test_tag_delete_is_refreshed_after_commit(
+    catalogue, settings, django_capture_on_commit_callbacks
+):
+    settings.ORDER_READ_MODEL_BACKGROUND_REFRESH = True
+    tag = catalogue["order_tags"][0]
+    with django_capture_on_commit_callbacks() as callbacks:
+        tag.delete()
+
+    assert callbacks == [read_model.schedule_refresh]
+    read_model.refresh_stale()
+    assert read_model.check() == UP_TO_DATE
+
+
+def test_list_validators_follow_refreshed_rows(api_client, catalogue):
+    etag = api_client.get("/orders/")["ETag"]
+    language = catalogue["languages"][1]
+    language.name = "Français"
+    language.save()
+
+    assert api_client.get("/orders/")["ETag"] == etag
+    read_model.refresh_stale()
+    assert api_client.get("/orders/")["ETag"] != etag
+
+
+def test_rebuild_and_check_drop_orphaned_rows(catalogue):
+    # Rows left behind by deletes that sent no signals.
+    OrderReadModel.objects.bulk_create(
+        OrderReadModel(
+            id=order_id,
+            created_at=timezone.now(),
+            representation="{}",
+            refreshed_at=timezone.now(),
+        )
+        for order_id in (10**9, 10**9 + 1)
+    )
+    assert "Anti Join" in read_model.orphans().explain()
+
+    assert read_model.check() == {**UP_TO_DATE, "orphaned": [10**9, 10**9 + 1]}
+    assert read_model.rebuild() == len(catalogue["orders"])
+    assert read_model.check() == UP_TO_DATE
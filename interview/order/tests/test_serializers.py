@@ -0,0 +1,25 @@
+from rest_framework.renderers import JSONRenderer
+
+from interview.order.models import Order
+from interview.order.serializers import OrderFastSerializer, OrderSerializer
+
+
+def render(serializer) -> bytes:
+    return JSONRenderer().render(serializer.data)
+
+
+def test_fast_serializer_matches_model_serializer(catalogue):
+    queryset = Order.objects.order_by("id")
+    tag_sets = {
+        frozenset(order.tags.values_list("is_active", flat=True)) for order in queryset
+    }
+    assert frozenset() in tag_sets and any(False in tags for tags in tag_sets)
+    assert queryset.filter(is_active=False).exists()
+
+    expected = render(
+        OrderSerializer(OrderSerializer.setup_eager_loading(queryset), many=True)
+    )
+    actual = render(OrderFastSerializer(OrderFastSerializer.setup_queryset(queryset)))
+
+    assert actual == expected
+    assert b'"imdb_rating":null' in actual
@@ -1,8 +1,31 @@
 from django.urls import path
-from interview.order.views import OrderListCreateView, OrderTagListCreateView
+from interview.order.views import (
+    OrderAsyncListView,
+    OrderChangeFeedView,
+    OrderDateRangeListView,
+    OrderListCreateView,
+    OrderSetActiveView,
+    OrderTaggedListView,
+    OrderTagListCreateView,
+    OrderTagOrdersListView,
+    OrderTagsListView,
+    OrderTagSetActiveView,
+)
 
 
 urlpatterns = [
+    path(
+        "tags/<int:id>/orders/",
+        OrderTagOrdersListView.as_view(),
+        name="order-tag-orders",
+    ),
+    path("<int:id>/tags/", OrderTagsListView.as_view(), name="order-tags"),
+    path("tagged/", OrderTaggedListView.as_view(), name="order-tagged"),
+    path("tags/active/", OrderTagSetActiveView.as_view(), name="order-tags-active"),
     path("tags/", OrderTagListCreateView.as_view(), name="order-detail"),
+    path("changes/", OrderChangeFeedView.as_view(), name="order-changes"),
+    path("dates/", OrderDateRangeListView.as_view(), name="order-date-range"),
+    path("active/", OrderSetActiveView.as_view(), name="order-active"),
+    path("async/", OrderAsyncListView.as_view(), name="order-async-list"),
     path("", OrderListCreateView.as_view(), name="order-list"),
 ]
@@ -1,13 +1,183 @@
+from django.conf import settings
 from django.shortcuts import render
 from rest_framework import generics
 
-from interview.order.models import Order, OrderTag
-from interview.order.serializers import OrderSerializer, OrderTagSerializer
+from interview.core.conditional import conditional_get, get_queryset_validators
+from interview.core.pagination import KeysetPagination
+from interview.core.views import (
+    AsyncReadView,
+    ChangeFeedView,
+    FastSerializerViewMixin,
+    LookupManyToManyListView,
+    ManyToManyListView,
+    SetActiveView,
+)
+from interview.inventory.models import InventoryLanguage, InventoryTag, InventoryType
+from interview.order.models import Order, OrderReadModel, OrderTag
+from interview.order.serializers import (
+    OrderDateRangeQuerySerializer,
+    OrderFastSerializer,
+    OrderReadModelSerializer,
+    OrderSerializer,
+    OrderSetActiveSerializer,
+    OrderTagSerializer,
+)
 
 # Create your views here.
-class OrderListCreateView(generics.ListCreateAPIView):
+class OrderListCreateView(FastSerializerViewMixin, generics.ListCreateAPIView):
     queryset = Order.objects.all()
     serializer_class = OrderSerializer
+    fast_serializer_class = OrderFastSerializer
+    pagination_class = KeysetPagination
+
+    @conditional_get
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def use_read_model(self) -> bool:
+        return (
+            settings.ORDER_READ_MODEL
+            and self.request.method == "GET"
+            and not self.get_fieldset_kwargs()
+        )
+
+    def get_queryset(self):
+        if self.use_read_model():
+            return OrderReadModelSerializer.setup_queryset(
+                OrderReadModel.objects.all(), self.get_pagination_ordering()
+            )
+        return self.setup_queryset(super().get_queryset())
+
+    def get_serializer(self, *args, **kwargs):
+        if self.use_read_model():
+            return OrderReadModelSerializer(*args, **kwargs)
+        if self.use_fast_serializer():
+            return self.fast_serializer_class(*args, **kwargs)
+        return super().get_serializer(*args, **self.get_fieldset_kwargs(), **kwargs)
+
+    def get_validators(self, request, *args, **kwargs):
+        if self.use_read_model():
+            # Stale rows are rendered after the change commits, so the
+            # validators follow the rows served rather than the orders.
+            return get_queryset_validators(
+                request,
+                OrderReadModel.objects.all(),
+                timestamp_fields=("refreshed_at",),
+            )
+        return get_queryset_validators(
+            request,
+            self.queryset.all(),
+            timestamp_fields=("updated_at", "inventory__updated_at"),
+            lookup_models=[OrderTag, InventoryType, InventoryLanguage, InventoryTag],
+        )
+
+
+class OrderAsyncListView(AsyncReadView):
+    queryset = Order.objects.all()
+    serializer_class = OrderSerializer
+    pagination_class = KeysetPagination
+    lookup_models = [OrderTag, InventoryType, InventoryLanguage, InventoryTag]
+
+    @conditional_get
+    async def get(self, request, *args, **kwargs):
+        return await self.render_list(self.setup_queryset(self.queryset))
+
+    def get_validators(self, request, *args, **kwargs):
+        return get_queryset_validators(
+            request,
+            self.queryset.all(),
+            timestamp_fields=("updated_at", "inventory__updated_at"),
+            lookup_models=self.lookup_models,
+        )
+
+
+class OrderChangeFeedView(ChangeFeedView):
+    queryset = Order.objects.all()
+    serializer_class = OrderSerializer
+    fast_serializer_class = OrderFastSerializer
+
+
+class OrderDateRangePagination(KeysetPagination):
+    ordering = ("start_date", "id")
+
+
+class OrderDateRangeListView(FastSerializerViewMixin, generics.ListAPIView):
+    queryset = Order.objects.order_by("start_date", "id")
+    serializer_class = OrderSerializer
+    fast_serializer_class = OrderFastSerializer
+    pagination_class = OrderDateRangePagination
+    lookups = {
+        "start_date_after": "start_date__gte",
+        "start_date_before": "start_date__lte",
+        "embargo_date_after": "embargo_date__gte",
+        "embargo_date_before": "embargo_date__lte",
+        "is_active": "is_active",
+    }
+
+    def get_queryset(self):
+        query = OrderDateRangeQuerySerializer(data=self.request.query_params.dict())
+        query.is_valid(raise_exception=True)
+
+        queryset = (
+            super()
+            .get_queryset()
+            .filter(
+                **{
+                    self.lookups[param]: value
+                    for param, value in query.validated_data.items()
+                }
+            )
+        )
+        return self.setup_queryset(queryset)
+
+    def get_serializer(self, *args, **kwargs):
+        if self.use_fast_serializer():
+            return self.fast_serializer_class(*args, **kwargs)
+        return super().get_serializer(*args, **self.get_fieldset_kwargs(), **kwargs)
+
+
+class OrderTagOrdersListView(ManyToManyListView):
+    queryset = Order.objects.all()
+    serializer_class = OrderSerializer
+    fast_serializer_class = OrderFastSerializer
+    m2m_field = Order.tags.field
+
+    def get(self, request, *args, **kwargs):
+        return self.list_related([kwargs["id"]])
+
+
+class OrderTaggedListView(ManyToManyListView):
+    queryset = Order.objects.all()
+    serializer_class = OrderSerializer
+    fast_serializer_class = OrderFastSerializer
+    m2m_field = Order.tags.field
+
+    def get(self, request, *args, **kwargs):
+        return self.list_related(*self.get_tag_ids(OrderTag))
+
+
+class OrderTagsListView(LookupManyToManyListView):
+    queryset = OrderTag.objects.all()
+    serializer_class = OrderTagSerializer
+    m2m_field = Order.tags.field
+
+    def get(self, request, *args, **kwargs):
+        return self.list_related([kwargs["id"]])
+
+
+class OrderSetActiveView(SetActiveView):
+    queryset = Order.objects.all()
+    serializer_class = OrderSetActiveSerializer
+    lookups = {
+        "start_date_after": "start_date__gte",
+        "start_date_before": "start_date__lte",
+        "embargo_date_after": "embargo_date__gte",
+        "embargo_date_before": "embargo_date__lte",
+    }
+
+
+class OrderTagSetActiveView(SetActiveView):
+    queryset = OrderTag.objects.all()
 
 
 class OrderTagListCreateView(generics.ListCreateAPIView):
@@ -14,4 +14,4 @@ echo "Migrating..."
 ./manage.py migrate --settings=config.settings.local
 
 echo "Adding data to database..."
-echo "from database import *" | python manage.py shell
+./manage.py seed --settings=config.settings.local